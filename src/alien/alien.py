@@ -1,51 +1,111 @@
-
 from pygame import *
 from helpers import constants
+from helpers.assets import ATLAS
 
 '''
     Representa um alienígena no jogo, que pode alternar entre duas imagens.
-    Cada alienígena possui uma linha e uma coluna, além de uma referência ao jogo.
+    Cada alienígena guarda apenas sua linha, sua coluna, a formação a que pertence
+    e a tupla dos grupos em que está (__slots__, sem dicionário de atributos).
+    Não herda de sprite.Sprite, que cria um dicionário e um conjunto de grupos por
+    instância: implementa apenas o protocolo que os grupos do Pygame usam com
+    sprites que não são subclasses de Sprite (add_internal, remove_internal, kill,
+    alive e groups). A posição e o quadro de animação ficam armazenados na formação
+    (AliensGroup), e as imagens são tuplas compartilhadas por todos os alienígenas
+    da mesma linha, de modo que formações com dezenas de milhares de alienígenas
+    cabem na memória.
 '''
-class Alien(sprite.Sprite):
-    def __init__(self, row, column, game):
-        sprite.Sprite.__init__(self)
+class Alien:
+    __slots__ = ('row', 'column', 'formation', '_groups')
+
+    # Nomes das imagens de cada linha da formação (linhas além da terceira repetem a última)
+    ROW_IMAGE_NAMES = {0: ('1_2', '1_1'),
+                       1: ('2_2', '2_1'),
+                       2: ('2_2', '2_1')
+                       }
+    # Tuplas de imagens e de máscaras de pixels compartilhadas, criadas no primeiro uso de cada linha
+    _row_images = {}
+    _row_masks = {}
+
+    def __init__(self, row, column, formation):
         self.row = row
         self.column = column
-        self.images = []  # Lista para armazenar as imagens do alienígena
-        self._load_images()  # Carrega as imagens para animação
-        self.index = 0 # Índice da imagem atual
-        self.image = self.images[self.index] # Define a imagem inicial
-        self.rect = self.image.get_rect() 
-        self.game = game # Referência ao objeto do jogo
-
-    
-    def _toggle_image(self):
-        """Alterna entre as imagens do alienígena para criar um efeito de animação."""
-        self.index += 1
-        if self.index >= len(self.images):
-            self.index = 0 # Retorna ao início se ultrapassar o limite
-        self.image = self.images[self.index]  # Atualiza a imagem
-   
-    def update(self, *args):
+        self.formation = formation # Formação que guarda posição, animação e o jogo
+        self._groups = ()  # Grupos em que o alienígena está (quase sempre um ou dois)
+
+    def add_internal(self, group):
+        """Registra a entrada em um grupo (chamado pelo próprio grupo)."""
+        self._groups += (group,)
+
+    def remove_internal(self, group):
+        """Registra a saída de um grupo (chamado pelo próprio grupo)."""
+        self._groups = tuple(member for member in self._groups if member is not group)
+
+    def kill(self):
+        """Remove o alienígena de todos os grupos em que está."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def alive(self):
+        """Indica se o alienígena ainda pertence a algum grupo."""
+        return bool(self._groups)
+
+    def groups(self):
+        """Lista os grupos em que o alienígena está."""
+        return list(self._groups)
+
+    @property
+    def game(self):
+        """Referência ao objeto do jogo, obtida pela formação."""
+        return self.formation.game
+
+    @property
+    def images(self):
+        """Imagens de animação compartilhadas pela linha do alienígena."""
+        return self.row_images(self.row)
+
+    @property
+    def image(self):
+        """Imagem atual, definida pelo quadro de animação da formação."""
+        return self.row_images(self.row)[self.formation.frame]
+
+    @property
+    def mask(self):
+        """Máscara de pixels da imagem atual, usada na detecção de colisões precisa."""
+        return self.row_masks(self.row)[self.formation.frame]
+
+    @property
+    def rect(self):
+        """Retângulo do alienígena calculado a partir do array de posições da formação."""
+        x, y = self.formation.positions[self.row, self.column].tolist()
+        return Rect(x, y, *constants.ALIEN_SIZE)
+
+    @classmethod
+    def row_images(cls, row):
         """
-        Função responsável por atualizar a posição e exibe a imagem na tela do jogo.        
-        Essa função é chamada a cada frame para redesenhar o alienígena.
+        Função responsável por obter as imagens dos alienígenas com base na linha da formação.
+        Cada alienígena tem duas imagens alternadas para criar um efeito de movimento.
+        Linhas além da terceira (formações personalizadas) repetem a imagem da última.
         """
-        self.game.screen.blit(self.image, self.rect)
+        key = min(row, 2)
+        images = cls._row_images.get(key)
+        if images is None:
+            # Obtém as imagens redimensionadas e compartilhadas correspondentes à linha
+            images = cls._row_images[key] = tuple(
+                ATLAS.get(f'alien{img_num}', constants.ALIEN_SIZE)
+                for img_num in cls.ROW_IMAGE_NAMES[key])
+        return images
 
-    
-    def _load_images(self):
+    @classmethod
+    def row_masks(cls, row):
         """
-        Função responsável por carregar as imagens dos alienígenas com base na linha da formação.
-        Cada alienígena tem duas imagens alternadas para criar um efeito de movimento.
+        Retorna as máscaras de pixels compartilhadas das duas imagens da linha,
+        na mesma ordem de row_images.
         """
-        images = {0: ['1_2', '1_1'],
-                  1: ['2_2', '2_1'],
-                  2: ['2_2', '2_1']
-                  }
-        # Obtém as imagens correspondentes à linha do alienígena
-        img1, img2 = [constants.IMAGES[f'alien{img_num}'] for img_num in images[self.row]]
-
-        # Redimensiona e armazena as imagens
-        self.images.append(transform.scale(img1, (40, 35)))
-        self.images.append(transform.scale(img2, (40, 35)))
\ No newline at end of file
+        key = min(row, 2)
+        masks = cls._row_masks.get(key)
+        if masks is None:
+            masks = cls._row_masks[key] = tuple(
+                ATLAS.mask(f'alien{img_num}', constants.ALIEN_SIZE)
+                for img_num in cls.ROW_IMAGE_NAMES[key])
+        return masks
@@ -1,73 +1,102 @@
-from pygame import sprite, transform, time
-from helpers import constants
+from pygame import sprite
+from helpers.assets import ATLAS
 
 class AlienExplosion(sprite.Sprite):
     """
     Classe responsável por modelar a explosão de um alienígena quando ele é atingido por uma bala.
     
     Atributos:
-        image (Surface): Primeira imagem da explosão (menor).
+        row (int): Linha do alienígena que explodiu (define a cor).
+        image (Surface): Imagem atual da explosão (começa pela menor).
         image2 (Surface): Segunda imagem da explosão (maior).
-        rect (Rect): Área e posição da explosão na tela.
+        rect (Rect): Área e posição atual da explosão na tela.
         timer (int): Momento em que a explosão foi criada (em milissegundos).
         game (object): Referência ao objeto do jogo.
+
+    A troca de imagem e a remoção são disparadas pelo agendador do jogo.
     """
 
-    def __init__(self, game, alien, *groups):
+    def __init__(self, game, alien=None, *groups):
         """
         Inicializa a explosão do alienígena.
         
         :param game: Referência ao objeto do jogo.
-        :param alien: Alienígena que foi atingido e explodiu.
+        :param alien: Alienígena que foi atingido e explodiu (None cria a explosão
+            ainda sem uso, para um SpritePool).
         :param groups: Grupos aos quais a explosão pertence.
         """
-        super().__init__(*groups)  # Inicializa a classe base (sprite.Sprite)
+        super().__init__()  # Inicializa a classe base (sprite.Sprite)
+
+        # Referência ao objeto do jogo
+        self.game = game
 
-        # Carrega as imagens da explosão com base na linha do alienígena
-        self.image = transform.scale(self._get_explosion_image(alien.row), (40, 35))  # Imagem menor
-        self.image2 = transform.scale(self._get_explosion_image(alien.row), (50, 45))  # Imagem maior
+        if alien is not None:
+            self.reset(alien)
+            self.add(*groups)
+
+    def reset(self, alien):
+        """
+        Reinicia a explosão para um novo alienígena, permitindo reutilizar o objeto.
+        
+        :param alien: Alienígena que foi atingido e explodiu.
+        """
+        # Obtém as imagens da explosão com base na linha do alienígena
+        self.row = alien.row
+        self.image = self._get_explosion_image(alien.row, (40, 35))  # Imagem menor
+        self.image2 = self._get_explosion_image(alien.row, (50, 45))  # Imagem maior
 
         # Define a posição da explosão com base na posição do alienígena
         self.rect = self.image.get_rect(topleft=(alien.rect.x, alien.rect.y))
 
-        # Configura o timer para controlar a duração da explosão
-        self.timer = time.get_ticks()
+        # Registra no agendador a troca de imagem (100 ms) e a remoção (400 ms)
+        self.timer = self.game.game_clock.get_ticks()
+        self.game.timers.schedule(self.timer, 100, self._grow, phase='explosions')
+        self.game.timers.schedule(self.timer, 400, self._expire, phase='explosions')
 
-        # Referência ao objeto do jogo
-        self.game = game
+    def restore(self, row, x, y, grown, timer):
+        """
+        Restaura o estado salvo em um snapshot, sem registrar temporizadores
+        (o snapshot registra os que estavam pendentes).
+        
+        :param row: Linha do alienígena que explodiu.
+        :param x: Posição horizontal atual da explosão.
+        :param y: Posição vertical atual da explosão.
+        :param grown: Se a imagem maior já está sendo exibida.
+        :param timer: Momento em que a explosão foi criada (em milissegundos).
+        """
+        self.row = row
+        self.image2 = self._get_explosion_image(row, (50, 45))
+        self.image = self.image2 if grown else self._get_explosion_image(row, (40, 35))
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.timer = timer
 
     @staticmethod
-    def _get_explosion_image(row):
+    def _get_explosion_image(row, size):
         """
         Retorna a imagem da explosão com base na linha do alienígena.
         
         :param row: Linha do alienígena (usada para determinar a cor da explosão).
-        :return: Imagem da explosão correspondente.
+        :param size: Tamanho (largura, altura) da imagem.
+        :return: Imagem compartilhada da explosão correspondente.
         """
         # Define as cores das explosões com base na linha do alienígena
         explosion_colors = ['purple', 'green', 'green']
-        return constants.IMAGES[f'explosion{explosion_colors[row]}']
+        return ATLAS.get(f'explosion{explosion_colors[min(row, 2)]}', size)
 
-    def update(self, current_time, *args):
+    def _grow(self, current_time):
         """
-        Atualiza a explosão na tela com base no tempo atual.
+        Troca a imagem menor pela maior, 100 ms após o início da explosão.
         
         :param current_time: Tempo atual do jogo (em milissegundos).
         """
-        elapsed_time = current_time - self.timer  # Calcula o tempo decorrido desde o início da explosão
-
-        # Remove a explosão após 400 milissegundos
-        if elapsed_time > 400:
-            self.kill()
-            return
+        # Ajusta a posição para centralizar a imagem maior
+        self.rect = self.image2.get_rect(topleft=(self.rect.x - 6, self.rect.y - 6))
+        self.image = self.image2
 
-        # Alterna entre as duas imagens da explosão com base no tempo decorrido
-        if elapsed_time <= 100:
-            image = self.image  # Usa a imagem menor nos primeiros 100 ms
-            position = self.rect.topleft  # Mantém a posição original
-        else:
-            image = self.image2  # Usa a imagem maior após 100 ms
-            position = (self.rect.x - 6, self.rect.y - 6)  # Ajusta a posição para centralizar a imagem maior
-
-        # Desenha a explosão na tela
-        self.game.screen.blit(image, position)
\ No newline at end of file
+    def _expire(self, current_time):
+        """
+        Remove a explosão 400 ms após o seu início, devolvendo-a ao SpritePool.
+        
+        :param current_time: Tempo atual do jogo (em milissegundos).
+        """
+        self.kill()
\ No newline at end of file
@@ -1,5 +1,5 @@
-from pygame import sprite, time
-from random import choice
+import numpy as np
+from pygame import sprite
 from helpers import constants
 
 class AliensGroup(sprite.Group):
@@ -7,6 +7,23 @@ class AliensGroup(sprite.Group):
     Classe que gerencia um grupo de alienígenas no jogo.
     Herda de sprite.Group para permitir funcionalidades básicas de grupo de sprites.
     Essa classe controla movimentação, formação e comportamento dos alienígenas.
+
+    A posição e o estado de cada alienígena ficam em arrays NumPy, de modo que
+    um passo da marcha é um único deslocamento vetorizado. A formação é uma grade
+    regular (constants.ALIEN_SPACING), então contagens por coluna e por linha,
+    o alienígena da base de cada coluna e os limites da formação são mantidos
+    incrementalmente a cada remoção, e a busca dos alienígenas atingidos por um
+    retângulo é feita por aritmética de grade, sem percorrer os sprites.
+
+    Atributos:
+        positions (ndarray): Posição (x, y) de cada alienígena, formato (linhas, colunas, 2)
+        alive (ndarray): Máscara booleana dos alienígenas vivos, formato (linhas, colunas)
+        frame (int): Índice da imagem de animação compartilhada por toda a formação
+        column_counts (list): Quantidade de alienígenas vivos em cada coluna
+        column_bottoms (list): Linha do alienígena vivo mais baixo de cada coluna (-1 se vazia)
+        row_counts (list): Quantidade de alienígenas vivos em cada linha
+        top_row (int): Linha viva mais alta
+        bottom_row (int): Linha viva mais baixa
     """
     
     def __init__(self, columns, rows, game):
@@ -25,49 +42,73 @@ class AliensGroup(sprite.Group):
         self.columns = columns
         # Matriz que armazena referências a todos os alienígenas
         self.aliens = [[None for _ in range(columns)] for _ in range(rows)]
+        # Estado da formação em arrays (posições, vivos e quadro de animação)
+        self.positions = np.zeros((rows, columns, 2), dtype=np.int64)
+        self.alive = np.zeros((rows, columns), dtype=bool)
+        self.frame = 0
+        # Índice incremental da formação (atualizado ao adicionar e remover alienígenas)
+        self.column_counts = [0] * columns
+        self.column_bottoms = [-1] * columns
+        self.row_counts = [0] * rows
+        self.top_row = rows
+        self.bottom_row = -1
         
-        # Controle de movimentação
+        # Controle de movimentação: a formação centralizada percorre todo o espaço
+        # livre da arena (30 passos de 10px na arena original de 800px)
+        free_space = (game.settings.arena_width - (columns - 1) * constants.ALIEN_SPACING[0] -
+                      constants.ALIEN_SIZE[0])
+        self.base_moves = max(free_space // 10 - 1, 0)
         self.direction = 1  # 1=direita, -1=esquerda
-        self.left_moves = 30  # Limite de movimentos para esquerda
-        self.right_moves = 30  # Limite de movimentos para direita
+        self.left_moves = self.base_moves  # Limite de movimentos para esquerda
+        self.right_moves = self.base_moves  # Limite de movimentos para direita
         self.left_add_move = 0  # Movimentos extras para esquerda
         self.right_add_move = 0  # Movimentos extras para direita
-        self.move_number = 15  # Contador de movimentos atuais
-        self.move_time = 600  # Intervalo entre movimentos (ms)
+        self.move_number = self.base_moves // 2  # Contador de movimentos atuais
+        self.move_time = game.settings.alien_move_time  # Intervalo entre movimentos (ms)
         
-        # Controle de tempo e posição
-        self.timer = time.get_ticks()  # Último momento de movimento
+        # Controle de tempo e posição: cada passo da marcha é disparado pelo agendador
+        # do jogo a cada move_time ms. Outros temporizadores que seguem o ritmo da
+        # formação (a música) podem ser incluídos em tempo_timers.
+        self.march_timer = game.timers.schedule(game.game_clock.get_ticks(), self.move_time,
+                                                self.update, repeat=True, phase='enemies')
+        self.tempo_timers = [self.march_timer]
         # Calcula a posição Y mais baixa da formação
-        self.bottom = game.enemy_position + ((rows - 1) * 45) + 35
+        self.bottom = (game.enemy_position + ((rows - 1) * constants.ALIEN_SPACING[1]) +
+                       constants.ALIEN_SIZE[1])
         
         # Controle de colunas ativas
         self.alive_columns = list(range(columns))  # Índices das colunas com aliens
         self.leftmost_alive_column = 0  # Coluna viva mais à esquerda
         self.rightmost_alive_column = columns - 1  # Coluna viva mais à direita
 
+        # Referência ao jogo (gerador aleatório compartilhado)
+        self.game = game
+
+    @property
+    def timer(self):
+        """Momento do último passo da marcha (em milissegundos)."""
+        return self.march_timer.start
+
     def update(self, current_time):
         """
-        Atualiza a posição dos alienígenas baseado no tempo.
+        Executa um passo da marcha. Chamado pelo agendador do jogo a cada move_time ms.
         
         Args:
             current_time (int): Tempo atual do jogo em milissegundos
         """
-        if current_time - self.timer > self.move_time:
-            # Calcula o máximo de movimentos na direção atual
-            max_move = (
-                self.right_moves + self.right_add_move if self.direction == 1
-                else self.left_moves + self.left_add_move
-            )
+        # Calcula o máximo de movimentos na direção atual
+        max_move = (
+            self.right_moves + self.right_add_move if self.direction == 1
+            else self.left_moves + self.left_add_move
+        )
 
-            if self.move_number >= max_move:
-                # Inverte direção e desce
-                self._reverse_direction()
-                self._move_down()
-            else:
-                # Move lateralmente
-                self._move_laterally()
-
-            self.timer += self.move_time  # Atualiza o tempo do último movimento
+        if self.move_number >= max_move:
+            # Inverte direção e desce
+            self._reverse_direction()
+            self._move_down()
+        else:
+            # Move lateralmente
+            self._move_laterally()
 
     def _reverse_direction(self):
         """Inverte a direção do movimento da frota."""
@@ -75,26 +116,89 @@ class AliensGroup(sprite.Group):
         self.move_number = 0
         # Ajusta os limites de movimento após inversão
         adjustment = self.right_add_move if self.direction == 1 else self.left_add_move
-        self.left_moves = 30 + adjustment
-        self.right_moves = 30 + adjustment
+        self.left_moves = self.base_moves + adjustment
+        self.right_moves = self.base_moves + adjustment
 
     def _move_down(self):
         """Move toda a frota para baixo e atualiza a posição inferior."""
-        self.bottom = 0  # Reseta para recalcular
-        for alien in self:
-            alien.rect.y += constants.ENEMY_MOVE_DOWN
-            alien._toggle_image()  # Animação do sprite
-            # Atualiza a posição mais baixa da frota
-            self.bottom = max(self.bottom, alien.rect.y + 35)
+        self.positions[..., 1] += constants.ENEMY_MOVE_DOWN
+        self._toggle_frame()  # Animação da formação
+        # Atualiza a posição mais baixa da frota
+        self.bottom = self.bounding_box()[3]
 
     def _move_laterally(self):
         """Move a frota na direção horizontal atual."""
-        shift = 10 * self.direction  # Calcula deslocamento
-        for alien in self:
-            alien.rect.x += shift
-            alien._toggle_image()  # Animação do sprite
+        self.positions[..., 0] += 10 * self.direction
+        self._toggle_frame()  # Animação da formação
         self.move_number += 1
 
+    def _toggle_frame(self):
+        """Alterna a imagem de todos os alienígenas de uma só vez."""
+        self.frame = 1 - self.frame
+
+    def place(self, left, top):
+        """
+        Posiciona a formação em grade: o alienígena (linha, coluna) fica em
+        (left + coluna * espaçamento horizontal, top + linha * espaçamento vertical).
+
+        Args:
+            left (int): Posição horizontal da primeira coluna
+            top (int): Posição vertical da primeira linha
+        """
+        spacing_x, spacing_y = constants.ALIEN_SPACING
+        self.positions[..., 0] = left + np.arange(self.columns) * spacing_x
+        self.positions[..., 1] = (top + np.arange(self.rows) * spacing_y)[:, None]
+
+    def bounding_box(self):
+        """
+        Calcula o retângulo que envolve os alienígenas vivos a partir da origem
+        da grade e das colunas e linhas vivas extremas.
+
+        Returns:
+            tuple: (esquerda, topo, direita, base) em pixels, ou zeros se não houver aliens
+        """
+        if not len(self):
+            return 0, 0, 0, 0
+        left, top = self.positions[0, 0].tolist()
+        spacing_x, spacing_y = constants.ALIEN_SPACING
+        width, height = constants.ALIEN_SIZE
+        return (left + self.leftmost_alive_column * spacing_x,
+                top + self.top_row * spacing_y,
+                left + self.rightmost_alive_column * spacing_x + width,
+                top + self.bottom_row * spacing_y + height)
+
+    def query(self, rect):
+        """
+        Encontra os alienígenas vivos que intersectam um retângulo, calculando pela
+        grade as linhas e colunas que ele pode alcançar (custo proporcional à área
+        do retângulo, e não ao tamanho da formação).
+
+        Args:
+            rect (Rect): Retângulo a ser testado (por exemplo, de um projétil)
+
+        Returns:
+            list: Pares (ordem no grupo, alienígena), na ordem de iteração do grupo
+        """
+        left, top = self.positions[0, 0].tolist()
+        spacing_x, spacing_y = constants.ALIEN_SPACING
+        width, height = constants.ALIEN_SIZE
+        # Coluna c ocupa [left + c * spacing_x, left + c * spacing_x + width)
+        first_column = max((rect.left - left - width) // spacing_x + 1, 0)
+        last_column = min((rect.right - left - 1) // spacing_x, self.columns - 1)
+        first_row = max((rect.top - top - height) // spacing_y + 1, 0)
+        last_row = min((rect.bottom - top - 1) // spacing_y, self.rows - 1)
+        if first_column > last_column or first_row > last_row or not rect.width or not rect.height:
+            return []
+
+        found = []
+        for row in range(first_row, last_row + 1):
+            aliens = self.aliens[row]
+            for column in range(first_column, last_column + 1):
+                alien = aliens[column]
+                if alien is not None:
+                    found.append((row * self.columns + column, alien))
+        return found
+
     def add_internal(self, *sprites):
         """
         Adiciona alienígenas ao grupo e à matriz de controle.
@@ -105,7 +209,15 @@ class AliensGroup(sprite.Group):
         super().add_internal(*sprites)
         for sprite in sprites:
             # Armazena referência na posição correta da matriz
-            self.aliens[sprite.row][sprite.column] = sprite
+            row, column = sprite.row, sprite.column
+            self.aliens[row][column] = sprite
+            self.alive[row, column] = True
+            # Atualiza o índice da formação
+            self.column_counts[column] += 1
+            self.column_bottoms[column] = max(self.column_bottoms[column], row)
+            self.row_counts[row] += 1
+            self.top_row = min(self.top_row, row)
+            self.bottom_row = max(self.bottom_row, row)
 
     def remove_internal(self, *sprites):
         """
@@ -129,7 +241,7 @@ class AliensGroup(sprite.Group):
         Returns:
             bool: True se a coluna estiver vazia, False caso contrário
         """
-        return not any(self.aliens[row][column] for row in range(self.rows))
+        return not self.column_counts[column]
 
     def random_bottom_alien(self):
         """
@@ -141,21 +253,28 @@ class AliensGroup(sprite.Group):
         if not self.alive_columns:
             return None
             
-        column = choice(self.alive_columns)  # Escolhe coluna aleatória
-        # Procura de baixo para cima na coluna
-        for row in range(self.rows - 1, -1, -1):
-            alien = self.aliens[row][column]
-            if alien is not None:
-                return alien
-        return None
+        column = self.game.random.choice(self.alive_columns)  # Escolhe coluna aleatória
+        # Linha viva mais baixa da coluna
+        row = self.column_bottoms[column]
+        if row < 0:
+            return None
+        return self.aliens[row][column]
 
     def update_speed(self):
         """Ajusta a velocidade das naves baseado no número de aliens restantes."""
         aliens_count = len(self)
+        settings = self.game.settings
+        move_time = self.move_time
         if aliens_count == 1:
-            self.move_time = 200  # Máxima velocidade
-        elif aliens_count <= 10:
-            self.move_time = 400  # Velocidade intermediária
+            move_time = settings.alien_last_move_time  # Máxima velocidade
+        elif aliens_count <= settings.alien_fast_count:
+            move_time = settings.alien_fast_move_time  # Velocidade intermediária
+
+        if move_time != self.move_time:
+            # O novo ritmo vale já para o próximo passo da marcha
+            self.move_time = move_time
+            for timer in self.tempo_timers:
+                self.game.timers.reschedule(timer, delay=move_time)
 
     def kill(self, alien):
         """
@@ -164,7 +283,22 @@ class AliensGroup(sprite.Group):
         Args:
             alien (object): O alienígena a ser removido
         """
-        self.aliens[alien.row][alien.column] = None  # Limpa a posição
+        row, column = alien.row, alien.column
+        self.aliens[row][column] = None  # Limpa a posição
+        self.alive[row, column] = False
+
+        # Atualiza contagens e sobe os ponteiros que apontavam para o alienígena removido
+        self.column_counts[column] -= 1
+        self.row_counts[row] -= 1
+        if row == self.column_bottoms[column]:
+            bottom = row - 1
+            while bottom >= 0 and self.aliens[bottom][column] is None:
+                bottom -= 1
+            self.column_bottoms[column] = bottom
+        while self.bottom_row >= 0 and not self.row_counts[self.bottom_row]:
+            self.bottom_row -= 1
+        while self.top_row < self.rows and not self.row_counts[self.top_row]:
+            self.top_row += 1
 
         if self.is_column_dead(alien.column):
             self.alive_columns.remove(alien.column)  # Remove coluna das ativas
@@ -0,0 +1,77 @@
+"""
+Benchmark da marcha da formação de alienígenas (AliensGroup).
+
+Mede o custo de um passo de marcha (lateral ou descida) para formações de
+tamanhos crescentes, da grade padrão 10x3 até 100x50.
+
+Uso (a partir da pasta src):
+    python -m benchmarks.formation
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+import argparse
+from time import perf_counter
+
+from alien.alien import Alien
+from alien.alien_group import AliensGroup
+from space_invaders import SpaceInvaders
+
+GRID_SIZES = [(10, 3), (20, 10), (50, 20), (100, 50)]
+
+
+def build_formation(game, columns, rows):
+    """
+    Cria uma formação completa com o tamanho informado.
+
+    Args:
+        game (SpaceInvaders): Jogo headless usado como contexto
+        columns (int): Número de colunas
+        rows (int): Número de linhas
+
+    Returns:
+        AliensGroup: Formação preenchida
+    """
+    formation = AliensGroup(columns, rows, game)
+    formation.place(0, game.enemy_position)
+    for row in range(rows):
+        for column in range(columns):
+            formation.add(Alien(row, column, formation))
+    return formation
+
+
+def time_march(formation, steps):
+    """
+    Executa passos de marcha forçados e mede o tempo médio de cada um.
+
+    Args:
+        formation (AliensGroup): Formação a ser movida
+        steps (int): Quantidade de passos
+
+    Returns:
+        float: Tempo médio por passo em microssegundos
+    """
+    current_time = formation.timer
+    start = perf_counter()
+    for _ in range(steps):
+        current_time += formation.move_time + 1
+        formation.update(current_time)
+    return (perf_counter() - start) / steps * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--steps', type=int, default=2000, help='passos de marcha por formação')
+    args = parser.parse_args()
+
+    game = SpaceInvaders(44100, -16, 1, 4096, headless=True, seed=0)
+    print(f"{'grade':>8} {'aliens':>7} {'us/passo':>10} {'ns/alien':>10}")
+    for columns, rows in GRID_SIZES:
+        formation = build_formation(game, columns, rows)
+        per_step = time_march(formation, args.steps)
+        count = columns * rows
+        print(f"{columns:>4}x{rows:<3} {count:>7} {per_step:>10.2f} {per_step * 1000 / count:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Cenários determinísticos usados pelos benchmarks.
+
+Cada cenário recebe um jogo headless já criado e o coloca em um estado
+conhecido, sempre a partir de uma nova partida e com o gerador aleatório
+reiniciado, sem depender de janela ou de tempo real.
+"""
+from helpers.bullet import Bullet
+from helpers.inputs import InputState
+
+
+def full_formation(game, seed=0):
+    """
+    Nova partida com a formação completa.
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+
+    Returns:
+        SpaceInvaders: O mesmo jogo, pronto para o benchmark
+    """
+    game.random.seed(seed)
+    game.start_new_game()
+    return game
+
+
+def near_empty_formation(game, seed=0, survivors=3):
+    """
+    Formação com apenas alguns alienígenas vivos (velocidade máxima de marcha).
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+        survivors (int): Quantidade de alienígenas que permanecem vivos
+    """
+    full_formation(game, seed)
+    for alien in game.enemies.sprites()[:-survivors]:
+        alien.kill()
+    return game
+
+
+def heavy_bullet_traffic(game, seed=0, enemy_bullets=60):
+    """
+    Formação completa com muitos projéteis inimigos espalhados pela tela
+    e dois projéteis do jogador subindo.
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+        enemy_bullets (int): Quantidade de projéteis inimigos
+    """
+    full_formation(game, seed)
+    for index in range(enemy_bullets):
+        bullet = Bullet(20 + (index * 97) % 760, 120 + (index * 53) % 300, 1,
+                        game.settings.enemy_bullet_speed, 'enemylaser', 'center', game)
+        game.enemy_bullets.add(bullet)
+    game.score = 1000  # Tiro duplo
+    game.check_input(InputState(shoot=True))
+    game.all_sprites.add(game.enemy_bullets)
+    return game
+
+
+def barriers_under_fire(game, seed=0):
+    """
+    Projéteis posicionados sobre todas as barreiras, atingindo-as no próximo teste de colisões.
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+    """
+    full_formation(game, seed)
+    for blocker in game.all_blockers:
+        for offset in range(0, blocker.rect.width, 15):
+            x = blocker.rect.x + offset
+            game.enemy_bullets.add(Bullet(x, blocker.rect.y - 5, 1, 5, 'enemylaser', 'center', game))
+            game.bullets.add(Bullet(x, blocker.rect.bottom - 5, -1, 15, 'laser', 'center', game))
+    game.all_sprites.add(game.bullets, game.enemy_bullets)
+    return game
+
+
+def near_misses(game, seed=0):
+    """
+    Projéteis sobre as margens transparentes dos alienígenas da base, da nave
+    misteriosa e da nave do jogador: os retângulos se tocam, mas as máscaras de
+    pixels não (todos os contatos passam pela narrowphase).
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+    """
+    full_formation(game, seed)
+    enemies = game.enemies
+    for column in range(enemies.columns):
+        alien = enemies.aliens[enemies.column_bottoms[column]][column]
+        game.bullets.add(Bullet(alien.rect.x - 4, alien.rect.bottom - 10, -1, 0,
+                                'laser', 'center', game))
+    game.mystery_ship.rect.x = 200
+    game.bullets.add(Bullet(196, 60, -1, 0, 'laser', 'center', game))
+    ship = game.player.rect
+    for x in (ship.x, ship.right - 5):
+        game.enemy_bullets.add(Bullet(x, ship.y + 5, 1, 0, 'enemylaser', 'center', game))
+    game.all_sprites.add(game.bullets, game.enemy_bullets)
+    return game
+
+
+def round_transition(game, seed=0):
+    """
+    Rodada concluída, com a próxima rodada prestes a começar no próximo passo.
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+    """
+    full_formation(game, seed)
+    for alien in game.enemies.sprites():
+        alien.kill()
+    game.explosions_group.empty()
+    game.game_timer = game.game_clock.get_ticks() - 3000
+    return game
+
+
+SCENARIOS = {
+    'full_formation': full_formation,
+    'near_empty_formation': near_empty_formation,
+    'heavy_bullet_traffic': heavy_bullet_traffic,
+    'barriers_under_fire': barriers_under_fire,
+    'near_misses': near_misses,
+    'round_transition': round_transition,
+}
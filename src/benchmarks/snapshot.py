@@ -0,0 +1,85 @@
+"""
+Benchmark de snapshot() e restore() do estado completo do jogo.
+
+Para cada cenário determinístico (e para partidas em andamento jogadas por um
+bot), mede a latência de salvar e de restaurar o estado e informa o tamanho do
+snapshot, bruto e compactado com zlib.
+
+Uso (a partir da pasta src):
+    python -m benchmarks.snapshot
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+import argparse
+import zlib
+from statistics import quantiles
+from time import perf_counter
+
+from benchmarks import scenarios
+from helpers.inputs import InputState
+from tools.policies import TrackingPolicy
+from tools.simulation import make_game
+
+
+def mid_game(game, seed=0, steps=3000):
+    """
+    Partida em andamento, jogada por um bot (explosões, projéteis e barreiras
+    desgastadas em estados reais).
+
+    Args:
+        game (SpaceInvaders): Jogo headless
+        seed (int): Semente do gerador aleatório
+        steps (int): Passos jogados antes da medição
+    """
+    scenarios.full_formation(game, seed)
+    policy = TrackingPolicy(seed)
+    for _ in range(steps):
+        game.step(policy(game) if game.start_game else InputState(start=True))
+    return game
+
+
+STATES = dict(scenarios.SCENARIOS, mid_game=mid_game)
+
+
+def time_call(operation, samples):
+    """
+    Mede várias chamadas de uma operação.
+
+    Args:
+        operation (callable): Operação sem argumentos
+        samples (int): Quantidade de chamadas
+
+    Returns:
+        tuple: (mediana, p99) em microssegundos
+    """
+    times = []
+    for _ in range(samples):
+        start = perf_counter()
+        operation()
+        times.append((perf_counter() - start) * 1e6)
+    percentiles = quantiles(times, n=100, method='inclusive')
+    return percentiles[49], percentiles[98]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--samples', type=int, default=2000, help='chamadas medidas por operação')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos cenários')
+    args = parser.parse_args()
+
+    game = make_game(args.seed)
+    print(f"{'cenário':<22} {'bytes':>6} {'zlib':>6} {'snap p50':>9} {'snap p99':>9} "
+          f"{'rest p50':>9} {'rest p99':>9}")
+    for name, prepare in STATES.items():
+        prepare(game, args.seed)
+        blob = game.snapshot()
+        snapshot_p50, snapshot_p99 = time_call(game.snapshot, args.samples)
+        restore_p50, restore_p99 = time_call(lambda: game.restore(blob), args.samples)
+        print(f'{name:<22} {len(blob):>6} {len(zlib.compress(blob)):>6} {snapshot_p50:>9.1f} '
+              f'{snapshot_p99:>9.1f} {restore_p50:>9.1f} {restore_p99:>9.1f}')
+    print('(latências em microssegundos)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de inicialização a frio.
+
+Cada amostra roda em um novo interpretador, medindo o tempo de importação dos
+módulos do jogo e o tempo até um processo de simulação (como os da varredura
+de parâmetros) executar o primeiro passo lógico. Também verifica que importar
+as constantes não cria a janela do jogo.
+
+Uso (a partir da pasta src):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget 400
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+
+# Código executado em cada interpretador novo; imprime os tempos em JSON
+PROBE = """
+import os, json
+from time import perf_counter
+os.environ['SPACE_INVADERS_HEADLESS'] = '1'
+start = perf_counter()
+from helpers import constants
+from pygame import display
+constants_ms = (perf_counter() - start) * 1000
+window = display.get_surface() is not None
+import space_invaders
+game_ms = (perf_counter() - start) * 1000
+from tools.simulation import make_game
+from helpers.inputs import InputState
+game = make_game(0)
+game.step(InputState())
+worker_ms = (perf_counter() - start) * 1000
+print(json.dumps({'constants_ms': constants_ms, 'game_ms': game_ms,
+                  'worker_ms': worker_ms, 'window_on_import': window}))
+"""
+
+# Etapas medidas, na ordem em que aparecem no relatório
+STAGES = [('constants_ms', 'import helpers.constants'),
+          ('game_ms', 'import space_invaders'),
+          ('worker_ms', 'worker até o 1º passo')]
+
+
+def sample():
+    """
+    Executa uma inicialização a frio em um novo interpretador.
+
+    Returns:
+        dict: Tempos acumulados (ms) de cada etapa e se a importação criou uma janela
+    """
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    output = subprocess.run([sys.executable, '-c', PROBE], cwd=src, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de inicialização a frio')
+    parser.add_argument('--samples', type=int, default=10, help='inicializações medidas')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='limite (ms) para a mediana do worker até o 1º passo')
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.samples)]
+
+    print(f"{'etapa':<28} {'p50 ms':>10} {'máx ms':>10}")
+    for key, label in STAGES:
+        values = [result[key] for result in samples]
+        print(f'{label:<28} {median(values):>10.1f} {max(values):>10.1f}')
+
+    failed = False
+    if any(result['window_on_import'] for result in samples):
+        print('importar helpers.constants criou a janela do jogo')
+        failed = True
+    worker = median(result['worker_ms'] for result in samples)
+    if args.budget is not None and worker > args.budget:
+        print(f'worker acima do limite: {worker:.1f} ms > {args.budget:.1f} ms')
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+Suíte de micro-benchmarks por subsistema.
+
+Cada benchmark prepara um cenário determinístico (sem medir o preparo) e mede
+uma única chamada da operação, repetindo várias amostras. Os resultados são
+gravados em JSON com percentis e podem ser comparados com uma linha de base
+gravada anteriormente, apontando regressões.
+
+Uso (a partir da pasta src):
+    python -m benchmarks.suite --output atual.json
+    python -m benchmarks.suite --baseline base.json --threshold 0.15
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+from statistics import mean, quantiles
+from time import perf_counter
+
+import pygame
+
+from benchmarks import scenarios
+from helpers import constants
+from helpers.inputs import InputState
+from helpers.text import RENDER_CACHE, Text
+from tools.simulation import make_game
+
+
+def _march(game):
+    # Força um passo de marcha a cada chamada
+    enemies = game.enemies
+    return lambda: enemies.update(enemies.timer + enemies.move_time + 1)
+
+
+def _step_and_render(game):
+    def frame():
+        game.step(InputState())
+        game.render()
+    return frame
+
+
+def _text_uncached(game):
+    RENDER_CACHE.surfaces.clear()
+    return lambda: Text(constants.FONT, 20, '123450', constants.GREEN_COLOR, 85, 5)
+
+
+def _text_cached(game):
+    Text(constants.FONT, 20, '123450', constants.GREEN_COLOR, 85, 5)
+    return lambda: Text(constants.FONT, 20, '123450', constants.GREEN_COLOR, 85, 5)
+
+
+def _restore(game):
+    blob = game.snapshot()
+    return lambda: game.restore(blob)
+
+
+# Nome: (cenário, função que recebe o jogo preparado e retorna a operação medida)
+BENCHMARKS = {
+    'aliens_group.update/full': ('full_formation', _march),
+    'aliens_group.update/near_empty': ('near_empty_formation', _march),
+    'check_collisions/full': ('full_formation',
+                              lambda game: lambda: game.check_collisions(game.current_time)),
+    'check_collisions/heavy_bullets': ('heavy_bullet_traffic',
+                                       lambda game: lambda: game.check_collisions(game.current_time)),
+    'check_collisions/barriers': ('barriers_under_fire',
+                                  lambda game: lambda: game.check_collisions(game.current_time)),
+    'check_collisions/near_misses': ('near_misses',
+                                     lambda game: lambda: game.check_collisions(game.current_time)),
+    'make_blockers': ('full_formation',
+                      lambda game: lambda: [game.make_blockers(number)
+                                           for number in range(game.settings.barrier_count)]),
+    'make_enemies': ('full_formation', lambda game: game.make_enemies),
+    'reset': ('full_formation', lambda game: lambda: game.reset(game.score)),
+    'round_transition': ('round_transition', lambda game: lambda: game.step(InputState())),
+    'snapshot/full': ('full_formation', lambda game: game.snapshot),
+    'restore/full': ('full_formation', _restore),
+    'restore/heavy_bullets': ('heavy_bullet_traffic', _restore),
+    'text/uncached': ('full_formation', _text_uncached),
+    'text/cached': ('full_formation', _text_cached),
+    'frame/full': ('full_formation', _step_and_render),
+    'frame/heavy_bullets': ('heavy_bullet_traffic', _step_and_render),
+}
+
+
+def run_benchmark(game, name, samples, seed):
+    """
+    Executa as amostras de um benchmark.
+
+    Args:
+        game (SpaceInvaders): Jogo headless reutilizado entre amostras
+        name (str): Nome do benchmark em BENCHMARKS
+        samples (int): Quantidade de amostras
+        seed (int): Semente usada para preparar os cenários
+
+    Returns:
+        dict: Estatísticas em microssegundos
+    """
+    scenario, factory = BENCHMARKS[name]
+    times = []
+    for _ in range(samples):
+        operation = factory(scenarios.SCENARIOS[scenario](game, seed))
+        start = perf_counter()
+        operation()
+        times.append((perf_counter() - start) * 1e6)
+
+    percentiles = quantiles(times, n=100, method='inclusive')
+    return {
+        'samples': samples,
+        'mean_us': mean(times),
+        'min_us': min(times),
+        'p50_us': percentiles[49],
+        'p90_us': percentiles[89],
+        'p99_us': percentiles[98],
+        'max_us': max(times),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compara as medianas com a linha de base.
+
+    Args:
+        results (dict): Resultados atuais
+        baseline (dict): Resultados gravados anteriormente
+        threshold (float): Aumento relativo da mediana considerado regressão
+
+    Returns:
+        list: Linhas (nome, base, atual, variação, regressão) para os benchmarks em comum
+    """
+    rows = []
+    for name, current in results['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        change = current['p50_us'] / previous['p50_us'] - 1
+        rows.append((name, previous['p50_us'], current['p50_us'], change, change > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks por subsistema')
+    parser.add_argument('--samples', type=int, default=200, help='amostras por benchmark')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos cenários')
+    parser.add_argument('--filter', default='*', help='padrão (glob) dos benchmarks a executar')
+    parser.add_argument('--output', help='grava os resultados em JSON neste arquivo')
+    parser.add_argument('--baseline', help='JSON de uma execução anterior para comparação')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='aumento relativo da mediana considerado regressão')
+    args = parser.parse_args()
+
+    game = make_game(args.seed, render=True)
+    names = [name for name in BENCHMARKS if fnmatch.fnmatch(name, args.filter)]
+    results = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'samples': args.samples,
+        'benchmarks': {},
+    }
+
+    print(f"{'benchmark':<34} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10}")
+    for name in names:
+        stats = results['benchmarks'][name] = run_benchmark(game, name, args.samples, args.seed)
+        print(f"{name:<34} {stats['p50_us']:>10.1f} {stats['p90_us']:>10.1f} {stats['p99_us']:>10.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            rows = compare(results, json.load(baseline_file), args.threshold)
+        print()
+        print(f"{'benchmark':<34} {'base':>10} {'atual':>10} {'variação':>9}")
+        for name, previous, current, change, regressed in rows:
+            flag = '  REGRESSÃO' if regressed else ''
+            print(f'{name:<34} {previous:>10.1f} {current:>10.1f} {change:>+9.1%}{flag}')
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+from pygame import display, mask, transform
+from helpers import constants
+
+class AssetAtlas:
+    """
+    Registro compartilhado de imagens redimensionadas.
+    Cada variante (imagem, tamanho) é gerada uma única vez, convertida para o
+    formato de pixel da tela (quando há uma janela) e reutilizada por todas as entidades que a pedirem.
+    A máscara de pixels de cada variante (usada na detecção de colisões precisa)
+    também é calculada uma única vez e compartilhada.
+
+    Atributos:
+        images (dict): Imagens originais indexadas pelo nome
+        variants (dict): Superfícies já geradas, indexadas por (nome, tamanho)
+        masks (dict): Máscaras de pixels já geradas, indexadas por (nome, tamanho)
+        hits (int): Quantidade de pedidos atendidos pelo cache
+        misses (int): Quantidade de variantes que precisaram ser geradas
+    """
+
+    def __init__(self, images):
+        """
+        Inicializa o registro vazio.
+
+        Args:
+            images (dict): Imagens originais indexadas pelo nome
+        """
+        self.images = images
+        self.variants = {}
+        self.masks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, size=None):
+        """
+        Retorna a variante compartilhada de uma imagem.
+
+        Args:
+            name (str): Nome da imagem em constants.IMG_NAMES
+            size (tuple, optional): Tamanho (largura, altura) desejado. None mantém o original.
+
+        Returns:
+            Surface: Superfície compartilhada (não deve ser alterada por quem a recebe)
+        """
+        key = (name, size)
+        surface = self.variants.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.images[name]
+        if size is not None and surface.get_size() != tuple(size):
+            surface = transform.scale(surface, size)
+            if display.get_surface() is not None:
+                surface = surface.convert_alpha()
+        self.variants[key] = surface
+        return surface
+
+    def mask(self, name, size=None):
+        """
+        Retorna a máscara de pixels compartilhada de uma variante (pixels com
+        opacidade acima da metade).
+
+        Args:
+            name (str): Nome da imagem em constants.IMG_NAMES
+            size (tuple, optional): Tamanho (largura, altura) da variante. None mantém o original.
+
+        Returns:
+            Mask: Máscara compartilhada (não deve ser alterada por quem a recebe)
+        """
+        key = (name, size)
+        variant_mask = self.masks.get(key)
+        if variant_mask is None:
+            variant_mask = self.masks[key] = mask.from_surface(self.get(name, size))
+        return variant_mask
+
+    def warm(self, variants):
+        """
+        Gera antecipadamente uma lista de variantes e suas máscaras, evitando travadas
+        durante o jogo.
+
+        Args:
+            variants (list): Pares (nome, tamanho) a serem gerados
+        """
+        for name, size in variants:
+            self.get(name, size)
+            self.mask(name, size)
+
+    def stats(self):
+        """
+        Retorna as estatísticas de uso do cache.
+
+        Returns:
+            dict: Contadores de acertos, falhas, número de variantes e de máscaras
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'variants': len(self.variants),
+                'masks': len(self.masks)}
+
+
+# Variantes usadas pelo jogo padrão
+DEFAULT_VARIANTS = [
+    ('ship', None), ('ship', (25, 25)),
+    ('mystery', (75, 35)),
+    ('laser', None), ('enemylaser', None),
+    ('alien1_1', constants.ALIEN_SIZE), ('alien1_2', constants.ALIEN_SIZE),
+    ('alien2_1', constants.ALIEN_SIZE), ('alien2_2', constants.ALIEN_SIZE),
+    ('explosionpurple', constants.ALIEN_SIZE), ('explosionpurple', (50, 45)),
+    ('explosiongreen', constants.ALIEN_SIZE), ('explosiongreen', (50, 45)),
+]
+
+ATLAS = AssetAtlas(constants.IMAGES)
@@ -0,0 +1,311 @@
+from time import perf_counter
+
+from pygame import mixer
+from helpers import constants
+
+class SilentSound:
+    """
+    Substituto mudo de mixer.Sound usado quando o jogo roda sem áudio (modo headless).
+    Implementa apenas os métodos chamados pelo jogo.
+    """
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def fadeout(self, time):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+
+class SoundBank:
+    """
+    Registro de sons compartilhado pelo processo inteiro.
+    Cada arquivo .wav é lido e decodificado uma única vez; todos que pedirem o
+    mesmo som com o mesmo volume recebem o mesmo objeto Sound.
+
+    Atributos:
+        clips (dict): Sons decodificados, indexados pelo nome
+        handles (dict): Sons entregues, indexados por (nome, volume)
+        load_time (float): Tempo total gasto lendo e decodificando arquivos (ms)
+        memory (int): Bytes de áudio decodificado mantidos pelo registro
+        hits (int): Quantidade de pedidos atendidos sem decodificar
+        misses (int): Quantidade de arquivos que precisaram ser decodificados
+    """
+
+    def __init__(self):
+        """Inicializa o registro vazio."""
+        self.clips = {}
+        self.handles = {}
+        self.load_time = 0.0
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, volume):
+        """
+        Retorna o som compartilhado com o volume informado.
+        O volume fica fixo no objeto entregue: volumes diferentes para o mesmo
+        arquivo geram objetos distintos, copiados do som já decodificado.
+
+        Args:
+            name (str): Nome do arquivo sem a extensão .wav
+            volume (float): Volume entre 0.0 e 1.0
+
+        Returns:
+            Sound: Som compartilhado (o volume não deve ser alterado por quem o recebe)
+        """
+        key = (name, volume)
+        sound = self.handles.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        clip = self.clips.get(name)
+        if clip is None:
+            self.misses += 1
+            start = perf_counter()
+            clip = sound = mixer.Sound(constants.SOUND_PATH + '{}.wav'.format(name))
+            self.clips[name] = clip
+            self.memory += len(clip.get_raw())
+            self.load_time += (perf_counter() - start) * 1000
+        else:
+            self.hits += 1
+            sound = mixer.Sound(buffer=clip.get_raw())
+            self.memory += len(clip.get_raw())
+
+        sound.set_volume(volume)
+        self.handles[key] = sound
+        return sound
+
+    def warm(self, sounds):
+        """
+        Decodifica antecipadamente uma lista de sons, evitando travadas durante o jogo.
+
+        Args:
+            sounds (list): Pares (nome, volume) a serem carregados
+        """
+        for name, volume in sounds:
+            self.get(name, volume)
+
+    def stats(self):
+        """
+        Retorna as estatísticas de uso do registro.
+
+        Returns:
+            dict: Contadores de acertos e falhas, número de sons, tempo de carga (ms) e memória (bytes)
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'clips': len(self.clips),
+                'load_ms': self.load_time, 'bytes': self.memory}
+
+
+# Sons usados pelo jogo padrão, com seus volumes
+DEFAULT_SOUNDS = [
+    ('shoot', 0.2), ('shoot2', 0.2), ('invader_killed', 0.2),
+    ('mystery_killed', 0.2), ('ship_explosion', 0.2), ('mystery_entered', 0.3),
+    ('0', 0.5), ('1', 0.5), ('2', 0.5), ('3', 0.5),
+]
+
+SOUND_BANK = SoundBank()
+
+# Buffer do dispositivo de áudio em amostras: 512 amostras a 44,1 kHz são ~12 ms
+# de latência (o buffer de 4096 amostras usado antes somava ~93 ms a cada som)
+AUDIO_BUFFER = 512
+
+
+class VoiceMixer:
+    """
+    Gerencia as vozes (canais) do mixer com baixa latência.
+    As notas da marcha tocam em canais reservados, que nunca são tomados pelos
+    efeitos; os efeitos disputam um número limitado de vozes (os canais seguintes
+    aos reservados) e, quando todas estão ocupadas, a voz iniciada há mais tempo
+    é roubada. Comandos redundantes (o mesmo som iniciado duas vezes no mesmo
+    frame, fadeout de um som que já está sumindo) são descartados sem chegar ao mixer.
+
+    Atributos:
+        enabled (bool): Se False, todos os métodos retornam sem acessar o mixer (também
+            fica False quando o mixer não pôde ser inicializado, por exemplo sem dispositivo de áudio)
+        voices (int): Vozes disponíveis para efeitos
+        reserved (int): Canais reservados para a música
+        music_channels (list): Canais reservados em que tocam as notas da marcha
+        effect_channels (list): Canais usados pelos efeitos (nunca os reservados)
+        latency_ms (float): Latência nominal do buffer do dispositivo (ms)
+        plays (int): Sons enviados ao mixer
+        steals (int): Sons que precisaram roubar a voz mais antiga
+        deduped (int): Comandos redundantes descartados
+        late_frames (int): Frames que começaram mais de um período do buffer além do
+            orçamento do frame (os sons disparados neles podem sair fora de sincronia
+            com a imagem; o SDL não informa os underruns do dispositivo, então esta é
+            apenas uma estimativa pelo lado do jogo)
+        trigger_ms (float): Soma dos atrasos entre o início do frame e o envio de cada som (ms)
+        trigger_max_ms (float): Maior atraso entre o início do frame e o envio de um som (ms)
+    """
+
+    def __init__(self, buffer=AUDIO_BUFFER, voices=8, reserved=1, enabled=True):
+        """
+        Configura os canais do mixer. Se o mixer não estiver inicializado, o áudio fica
+        desabilitado em vez de falhar.
+
+        Args:
+            buffer (int): Tamanho do buffer do dispositivo em amostras
+            voices (int): Vozes disponíveis para efeitos
+            reserved (int): Canais reservados para a música
+            enabled (bool): Se False, não acessa o mixer (modo headless)
+        """
+        self.enabled = enabled and mixer.get_init() is not None
+        self.voices = voices
+        self.reserved = reserved
+        self.plays = 0
+        self.steals = 0
+        self.deduped = 0
+        self.late_frames = 0
+        self.trigger_ms = 0.0
+        self.trigger_max_ms = 0.0
+        self.latency_ms = 0.0
+        self.frame_budget_ms = 1000 / 60
+
+        self.frame = 0
+        self.frame_start = perf_counter()
+        self.started = {}    # Som -> último frame em que foi iniciado
+        self.fading = set()  # Sons com fadeout em andamento
+        self.music_channels = []
+        self.effect_channels = []
+        self.voice_starts = []  # Ordem de início do som em cada voz de efeito
+        self.note_index = 0
+
+        if not self.enabled:
+            return
+        mixer.set_num_channels(reserved + voices)
+        mixer.set_reserved(reserved)
+        self.music_channels = [mixer.Channel(index) for index in range(reserved)]
+        # As vozes são escolhidas aqui: mixer.find_channel() ignora a reserva e
+        # poderia tocar um efeito no canal da marcha
+        self.effect_channels = [mixer.Channel(index) for index in range(reserved, reserved + voices)]
+        self.voice_starts = [0] * voices
+        frequency = mixer.get_init()[0]
+        self.latency_ms = buffer / frequency * 1000
+
+    def begin_frame(self):
+        """Marca o início de um frame (os comandos repetidos dentro dele são descartados)."""
+        now = perf_counter()
+        if self.enabled and (now - self.frame_start) * 1000 > self.frame_budget_ms + self.latency_ms:
+            self.late_frames += 1
+        self.frame += 1
+        self.frame_start = now
+
+    def _sent(self):
+        """Contabiliza um som enviado ao mixer e o atraso desde o início do frame."""
+        self.plays += 1
+        delay = (perf_counter() - self.frame_start) * 1000
+        self.trigger_ms += delay
+        self.trigger_max_ms = max(self.trigger_max_ms, delay)
+
+    def play(self, sound):
+        """
+        Toca um efeito em uma voz livre, roubando a mais antiga se todas estiverem ocupadas.
+
+        Args:
+            sound (Sound): Som a tocar
+        """
+        if not self.enabled:
+            return
+        if self.started.get(sound) == self.frame:
+            self.deduped += 1
+            return
+        self.started[sound] = self.frame
+        self.fading.discard(sound)
+
+        voice = next((index for index, channel in enumerate(self.effect_channels)
+                      if not channel.get_busy()), None)
+        if voice is None:
+            # Todas as vozes ocupadas: rouba a que começou a tocar primeiro
+            voice = self.voice_starts.index(min(self.voice_starts))
+            self.steals += 1
+        self.effect_channels[voice].play(sound)
+        self._sent()
+        self.voice_starts[voice] = self.plays
+
+    def play_note(self, sound):
+        """
+        Toca uma nota da marcha em um canal reservado (alternando entre eles).
+
+        Args:
+            sound (Sound): Nota a tocar
+        """
+        if not self.enabled:
+            return
+        channel = self.music_channels[self.note_index]
+        self.note_index = (self.note_index + 1) % len(self.music_channels)
+        channel.play(sound)
+        self._sent()
+
+    def fadeout(self, sound, time):
+        """
+        Inicia o fadeout de um som, ignorando pedidos enquanto ele já está sumindo.
+
+        Args:
+            sound (Sound): Som a esmaecer
+            time (int): Duração do fadeout em milissegundos
+        """
+        if not self.enabled:
+            return
+        if sound in self.fading:
+            self.deduped += 1
+            return
+        self.fading.add(sound)
+        sound.fadeout(time)
+
+    def stop(self, sound):
+        """
+        Interrompe um som em todas as vozes.
+
+        Args:
+            sound (Sound): Som a interromper
+        """
+        if not self.enabled:
+            return
+        self.fading.discard(sound)
+        sound.stop()
+
+    def stats(self):
+        """
+        Retorna os contadores de áudio.
+
+        Returns:
+            dict: Latência nominal e atrasos de envio (ms), vozes ocupadas, sons enviados,
+                roubos, comandos descartados e frames atrasados
+        """
+        busy = 0
+        if self.enabled:
+            busy = sum(channel.get_busy() for channel in self.effect_channels)
+        return {'latency_ms': self.latency_ms,
+                'trigger_mean_ms': self.trigger_ms / self.plays if self.plays else 0.0,
+                'trigger_max_ms': self.trigger_max_ms, 'busy_voices': busy,
+                'voices': self.voices, 'plays': self.plays, 'steals': self.steals,
+                'deduped': self.deduped, 'late_frames': self.late_frames}
+
+
+def load_sound(name, volume, enabled=True):
+    """
+    Obtém um efeito sonoro da pasta de sons com o volume informado.
+    O arquivo só é lido na primeira vez; depois o som do SOUND_BANK é reutilizado.
+
+    Args:
+        name (str): Nome do arquivo sem a extensão .wav
+        volume (float): Volume entre 0.0 e 1.0
+        enabled (bool): Se False, retorna um som mudo sem acessar o mixer
+
+    Returns:
+        Sound: Som compartilhado ou SilentSound quando o áudio está desabilitado
+    """
+    if not enabled:
+        return SilentSound()
+
+    return SOUND_BANK.get(name, volume)
@@ -0,0 +1,134 @@
+import numpy as np
+from pygame import sprite, surfarray, Surface, Rect, SRCALPHA
+
+class Barrier(sprite.Sprite):
+    """
+    Classe que representa uma barreira de proteção destrutível do jogador.
+    Cada barreira é um único sprite: a ocupação das células fica em uma matriz
+    booleana e a imagem é uma superfície em cache, alterada apenas quando
+    células são destruídas.
+
+    Atributos:
+        cells (ndarray): Ocupação das células, formato (linhas, colunas)
+        cell_size (int): Tamanho de cada célula em pixels
+        color (tuple): Cor da barreira no formato RGB
+        image (Surface): Superfície em cache com as células restantes
+        rect (Rect): Retângulo que define posição e área da barreira
+        dirty (bool): A imagem mudou desde o último desenho (o renderizador redesenha a barreira)
+        game (object): Referência ao objeto principal do jogo
+    """
+
+    def __init__(self, xpos, ypos, rows, columns, cell_size, color, game):
+        """
+        Inicializa uma barreira intacta.
+
+        Args:
+            xpos (int): Posição horizontal do canto superior esquerdo
+            ypos (int): Posição vertical do canto superior esquerdo
+            rows (int): Número de linhas de células
+            columns (int): Número de colunas de células
+            cell_size (int): Tamanho de cada célula em pixels (1 = erosão por pixel)
+            color (tuple): Cor da barreira no formato RGB
+            game (object): Referência ao objeto do jogo principal
+        """
+        super().__init__()  # Inicializa a classe base Sprite
+
+        # Ocupação das células: True onde ainda existe bloco (não é uma pygame.mask.Mask;
+        # as colisões com barreiras testam as próprias células)
+        self.cells = np.ones((rows, columns), dtype=bool)
+        self.cell_size = cell_size
+        self.color = color
+
+        # Superfície única da barreira inteira
+        self.image = Surface((columns * cell_size, rows * cell_size), SRCALPHA)
+        self.image.fill(self.color)
+        self.rect = self.image.get_rect(topleft=(xpos, ypos))
+        self.dirty = False
+
+        self.game = game
+
+    def _cells_under(self, rect):
+        """
+        Converte a interseção de um retângulo com a barreira em fatias da matriz de células.
+
+        Args:
+            rect (Rect): Retângulo a testar
+
+        Returns:
+            tuple: (fatia_linhas, fatia_colunas) ou None se não houver interseção
+        """
+        clip = self.rect.clip(rect)
+        if not clip.width or not clip.height:
+            return None
+        size = self.cell_size
+        left = (clip.left - self.rect.left) // size
+        right = (clip.right - 1 - self.rect.left) // size + 1
+        top = (clip.top - self.rect.top) // size
+        bottom = (clip.bottom - 1 - self.rect.top) // size + 1
+        return slice(top, bottom), slice(left, right)
+
+    def collides(self, rect):
+        """
+        Verifica se o retângulo atinge alguma célula intacta.
+
+        Args:
+            rect (Rect): Retângulo a testar
+
+        Returns:
+            bool: True se houver ao menos uma célula ocupada sob o retângulo
+        """
+        region = self._cells_under(rect)
+        return region is not None and bool(self.cells[region].any())
+
+    def erode(self, rect):
+        """
+        Destrói todas as células sob o retângulo e atualiza a imagem em cache.
+
+        Args:
+            rect (Rect): Retângulo do objeto que atingiu a barreira
+
+        Returns:
+            bool: True se alguma célula intacta foi destruída
+        """
+        region = self._cells_under(rect)
+        if region is None or not self.cells[region].any():
+            return False
+
+        self.cells[region] = False
+        # Todas as células da região ficam vazias: basta apagar o retângulo delas
+        rows, columns = region
+        size = self.cell_size
+        self.image.fill((0, 0, 0, 0), Rect(columns.start * size, rows.start * size,
+                                           (columns.stop - columns.start) * size,
+                                           (rows.stop - rows.start) * size))
+        self.dirty = True
+        return True
+
+    def set_cells(self, cells):
+        """
+        Substitui a ocupação das células e redesenha a imagem em cache
+        (usado ao restaurar um snapshot). Não faz nada se a ocupação não mudou.
+
+        Args:
+            cells (ndarray): Nova ocupação, com o mesmo formato da ocupação atual
+        """
+        if np.array_equal(self.cells, cells):
+            return
+
+        self.cells[...] = cells
+        self.image.fill(self.color)
+        # Células destruídas ficam transparentes (cada célula ocupa cell_size x cell_size pixels)
+        size = self.cell_size
+        alpha = surfarray.pixels_alpha(self.image)
+        alpha[~self.cells.T.repeat(size, axis=0).repeat(size, axis=1)] = 0
+        del alpha  # Libera a trava da superfície
+        self.dirty = True
+
+    def is_destroyed(self):
+        """
+        Verifica se a barreira não possui mais células.
+
+        Returns:
+            bool: True se todas as células foram destruídas
+        """
+        return not self.cells.any()
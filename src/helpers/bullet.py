@@ -1,5 +1,5 @@
 from pygame import sprite
-from helpers import constants
+from helpers.assets import ATLAS
 
 class Bullet(sprite.Sprite):
     """
@@ -7,6 +7,7 @@ class Bullet(sprite.Sprite):
 
     Atributos:
         image (Surface): Imagem visual do projétil
+        mask (Mask): Máscara de pixels compartilhada da imagem (colisões precisas)
         rect (Rect): Área e posição do projétil na tela
         speed (int): Velocidade de movimento do projétil
         direction (int): Direção do movimento (1 para baixo, -1 para cima)
@@ -31,7 +32,8 @@ class Bullet(sprite.Sprite):
         super().__init__()  # Inicializa a classe base Sprite
 
         # Configuração visual do projétil
-        self.image = constants.IMAGES[filename]
+        self.image = ATLAS.get(filename)
+        self.mask = ATLAS.mask(filename)
         self.rect = self.image.get_rect(topleft=(xpos, ypos))
 
         # Propriedades de movimento
@@ -51,13 +53,10 @@ class Bullet(sprite.Sprite):
             keys (dict, optional): Estado das teclas pressionadas (para projéteis do jogador)
             *args: Argumentos variáveis para compatibilidade
         """
-        # 1. Renderiza o projétil na tela
-        self.game.screen.blit(self.image, self.rect)
-        
-        # 2. Move o projétil na direção especificada
+        # 1. Move o projétil na direção especificada
         self.rect.y += self.speed * self.direction
         
-        # 3. Verifica se saiu dos limites da tela
+        # 2. Verifica se saiu dos limites da tela
         self._check_boundaries()
 
     def _check_boundaries(self):
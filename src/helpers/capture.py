@@ -0,0 +1,264 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from threading import Condition, Thread, get_native_id
+from time import perf_counter
+
+import numpy as np
+
+# Cabeçalho de cada arquivo de bloco: assinatura, versão, primeiro frame e quantidade de frames
+CHUNK_HEADER = struct.Struct('<4sBII')
+FRAME_SIZE = struct.Struct('<I')
+MAGIC = b'SIFC'
+VERSION = 1
+
+RING_NAME = 'ring.mmap'
+MANIFEST_NAME = 'frames.json'
+
+
+class FrameRecorder:
+    """
+    Grava os frames apresentados em um anel de memória mapeada (mmap) que é
+    esvaziado em segundo plano para arquivos de blocos compactados.
+
+    O jogo só copia os pixels da superfície (pelo seu buffer, direto para uma
+    vaga pré-alocada do anel); a thread de escrita calcula a diferença (XOR)
+    de cada frame para o anterior, compacta com zlib e grava um arquivo a cada
+    chunk_frames frames. Quando o anel está cheio, capture() espera a thread
+    liberar uma vaga (contrapressão), e a espera entra no custo do frame.
+
+    Atributos:
+        directory (str): Pasta com o anel, os blocos e o manifesto
+        slots (int): Quantidade de frames que cabem no anel
+        chunk_frames (int): Frames por arquivo de bloco
+        level (int): Nível de compressão do zlib
+        written (int): Frames copiados para o anel
+        drained (int): Vagas já liberadas pela thread de escrita (a do último frame
+            lido fica retida até o próximo, que é comparado com ela)
+        stalls (int): Capturas que precisaram esperar por uma vaga livre
+        costs (list): Custo de cada captura (ms), incluindo a espera
+        bytes_written (int): Bytes gravados nos arquivos de bloco
+    """
+
+    def __init__(self, directory, surface, slots=32, chunk_frames=60, level=1):
+        """
+        Cria a pasta de gravação e o anel com o tamanho dos frames da superfície.
+
+        Args:
+            directory (str): Pasta de saída (criada se não existir)
+            surface (Surface): Superfície cujos frames serão gravados (a tela)
+            slots (int): Quantidade de frames que cabem no anel
+            chunk_frames (int): Frames por arquivo de bloco
+            level (int): Nível de compressão do zlib (1 = mais rápido)
+
+        Raises:
+            ValueError: Se o anel tiver menos de duas vagas
+        """
+        if slots < 2:
+            raise ValueError('o anel precisa de ao menos duas vagas')
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.slots = slots
+        self.chunk_frames = chunk_frames
+        self.level = level
+        self.format = {'width': surface.get_width(), 'height': surface.get_height(),
+                       'pitch': surface.get_pitch(), 'bytesize': surface.get_bytesize(),
+                       'masks': list(surface.get_masks())}
+        self.frame_bytes = surface.get_pitch() * surface.get_height()
+
+        # Anel pré-alocado em um arquivo mapeado em memória, com uma visão por vaga
+        self.ring_path = os.path.join(directory, RING_NAME)
+        with open(self.ring_path, 'w+b') as ring_file:
+            ring_file.truncate(self.frame_bytes * slots)
+            self.ring = mmap.mmap(ring_file.fileno(), self.frame_bytes * slots)
+        ring_view = memoryview(self.ring)
+        self.views = [ring_view[slot * self.frame_bytes:(slot + 1) * self.frame_bytes]
+                      for slot in range(slots)]
+        del ring_view
+        # Toca todas as páginas do anel agora, e não durante a partida
+        blank = bytes(self.frame_bytes)
+        for view in self.views:
+            view[:] = blank
+
+        # Visão em cache dos pixels da superfície gravada (criada na primeira captura)
+        self.source = None
+        self.view = None
+
+        self.written = 0
+        self.drained = 0
+        self.stalls = 0
+        self.costs = []
+        self.bytes_written = 0
+        self.chunks = 0
+        self.closing = False
+        self.condition = Condition()
+        self.thread = Thread(target=self._drain, name='frame-recorder', daemon=True)
+        self.thread.start()
+
+    def capture(self, surface):
+        """
+        Copia o frame atual da superfície para a próxima vaga do anel.
+        Espera enquanto o anel estiver cheio.
+
+        Args:
+            surface (Surface): Superfície com o frame apresentado
+        """
+        start = perf_counter()
+        if surface is not self.source:
+            # Uma única visão por superfície, em vez de um novo BufferProxy a cada frame
+            self.source = surface
+            self.view = surface.get_view('1')
+        with self.condition:
+            stalled = False
+            while self.written - self.drained >= self.slots:
+                stalled = True
+                self.condition.wait()
+            if stalled:
+                self.stalls += 1
+        # A superfície só fica travada durante a cópia (blits exigem a superfície destravada)
+        with memoryview(self.view) as pixels, pixels.cast('B') as raw:
+            self.views[self.written % self.slots][:] = raw
+        with self.condition:
+            self.written += 1
+            self.condition.notify()
+        self.costs.append((perf_counter() - start) * 1000)
+
+    def _drain(self):
+        """Thread de escrita: retira os frames do anel e grava os blocos compactados."""
+        # No Linux a prioridade vale por thread: a escrita cede a CPU ao jogo
+        try:
+            os.setpriority(os.PRIO_PROCESS, get_native_id(), 10)
+        except (AttributeError, OSError):
+            pass
+        delta = np.empty(self.frame_bytes, dtype=np.uint8)
+        previous = None
+        position = 0
+        frames = []
+        first = 0
+        while True:
+            with self.condition:
+                while position == self.written and not self.closing:
+                    self.condition.wait()
+                if position == self.written:
+                    self.drained = position
+                    self.condition.notify()
+                    break
+            current = np.frombuffer(self.views[position % self.slots], dtype=np.uint8)
+            # Diferença para o frame anterior, lido da própria vaga dele no anel
+            # (o primeiro frame de cada bloco fica completo)
+            if frames:
+                np.bitwise_xor(current, previous, out=delta)
+                frames.append(zlib.compress(delta, self.level))
+            else:
+                frames.append(zlib.compress(current, self.level))
+            previous = current
+            position += 1
+            # A vaga anterior só é liberada agora que não é mais necessária
+            with self.condition:
+                self.drained = position - 1
+                self.condition.notify()
+
+            if len(frames) == self.chunk_frames:
+                self._write_chunk(first, frames)
+                first += len(frames)
+                frames = []
+        # Solta as visões do anel antes que ele seja fechado
+        current = previous = None
+        if frames:
+            self._write_chunk(first, frames)
+
+    def _write_chunk(self, first, frames):
+        """Grava um arquivo de bloco com os frames compactados."""
+        path = os.path.join(self.directory, f'chunk_{self.chunks:05d}.bin')
+        with open(path, 'wb') as chunk_file:
+            chunk_file.write(CHUNK_HEADER.pack(MAGIC, VERSION, first, len(frames)))
+            for data in frames:
+                chunk_file.write(FRAME_SIZE.pack(len(data)))
+                chunk_file.write(data)
+            self.bytes_written += chunk_file.tell()
+        self.chunks += 1
+
+    def stats(self):
+        """
+        Retorna as estatísticas da gravação.
+
+        Returns:
+            dict: Frames, esperas, custo por frame (média, p99, máximo em ms) e bytes gravados
+        """
+        costs = sorted(self.costs)
+        count = len(costs)
+        return {
+            'frames': self.written,
+            'stalls': self.stalls,
+            'mean_ms': sum(costs) / count if count else 0.0,
+            'p99_ms': costs[min(count - 1, int(count * 0.99))] if count else 0.0,
+            'max_ms': costs[-1] if count else 0.0,
+            'bytes_written': self.bytes_written,
+            'compression': self.written * self.frame_bytes / max(self.bytes_written, 1),
+        }
+
+    def close(self):
+        """
+        Grava os frames restantes, escreve o manifesto e remove o anel.
+
+        Returns:
+            dict: Estatísticas da gravação (ver stats())
+        """
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.thread.join()
+        self.source = self.view = None
+        for view in self.views:
+            view.release()
+        self.ring.close()
+        os.remove(self.ring_path)
+
+        stats = self.stats()
+        with open(os.path.join(self.directory, MANIFEST_NAME), 'w') as manifest:
+            json.dump(dict(self.format, chunks=self.chunks, chunk_frames=self.chunk_frames,
+                           stats=stats), manifest)
+        return stats
+
+
+def iter_frames(directory):
+    """
+    Lê os frames gravados por um FrameRecorder, em ordem.
+
+    Args:
+        directory (str): Pasta da gravação
+
+    Yields:
+        ndarray: Pixels de cada frame, formato (altura, largura, bytes por pixel), no
+            formato de pixel da superfície gravada (ver as máscaras no manifesto)
+
+    Raises:
+        ValueError: Se algum bloco não for válido
+    """
+    with open(os.path.join(directory, MANIFEST_NAME)) as manifest_file:
+        manifest = json.load(manifest_file)
+    height, pitch = manifest['height'], manifest['pitch']
+    row_bytes = manifest['width'] * manifest['bytesize']
+
+    frame = np.zeros(height * pitch, dtype=np.uint8)
+    for chunk in range(manifest['chunks']):
+        path = os.path.join(directory, f'chunk_{chunk:05d}.bin')
+        with open(path, 'rb') as chunk_file:
+            data = chunk_file.read()
+        magic, version, _, count = CHUNK_HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} não é um bloco de frames válido')
+        offset = CHUNK_HEADER.size
+        for index in range(count):
+            size, = FRAME_SIZE.unpack_from(data, offset)
+            offset += FRAME_SIZE.size
+            delta = np.frombuffer(zlib.decompress(data[offset:offset + size]), dtype=np.uint8)
+            offset += size
+            if index:
+                np.bitwise_xor(frame, delta, out=frame)
+            else:
+                np.copyto(frame, delta)
+            yield frame.reshape(height, pitch)[:, :row_bytes].reshape(
+                height, manifest['width'], manifest['bytesize']).copy()
@@ -0,0 +1,34 @@
+class VirtualClock:
+    """
+    Relógio lógico que só avança quando o jogo executa um passo fixo.
+    Permite simular partidas mais rápido que o tempo real e com resultados
+    idênticos para a mesma semente. No jogo com janela, o loop principal
+    executa quantos passos couberem no tempo real decorrido.
+
+    Atributos:
+        fps (int): Número de passos lógicos por segundo simulado
+        frame (int): Quantidade de passos executados até o momento
+    """
+
+    def __init__(self, fps=60):
+        """
+        Inicializa o relógio virtual parado no instante zero.
+
+        Args:
+            fps (int): Número de passos lógicos por segundo simulado
+        """
+        self.fps = fps
+        self.frame = 0
+
+    def get_ticks(self):
+        """
+        Retorna o tempo virtual correspondente ao passo atual.
+
+        Returns:
+            int: Milissegundos simulados desde o início
+        """
+        return self.frame * 1000 // self.fps
+
+    def tick(self):
+        """Avança o relógio em exatamente um passo lógico."""
+        self.frame += 1
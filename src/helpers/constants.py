@@ -1,11 +1,20 @@
 import os
+from threading import Thread
 from pygame import *
 
 # Configura caminhos de acesso aos diretórios das fontes, imagens e sons utilizados
+# (terminados com o separador do sistema, para concatenar o nome do arquivo)
 BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-FONT_PATH = BASE_PATH + '\\assets\\fonts\\'
-IMAGE_PATH = BASE_PATH + '\\assets\\images\\'
-SOUND_PATH = BASE_PATH + '\\assets\\sounds\\'
+FONT_PATH = os.path.join(BASE_PATH, 'assets', 'fonts', '')
+IMAGE_PATH = os.path.join(BASE_PATH, 'assets', 'images', '')
+SOUND_PATH = os.path.join(BASE_PATH, 'assets', 'sounds', '')
+
+# Modo headless: sem janela e sem áudio, usado em simulações automatizadas.
+# Precisa ser definido antes da importação deste módulo.
+HEADLESS = os.environ.get('SPACE_INVADERS_HEADLESS') == '1'
+if HEADLESS:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
 
 # Configura as cores utilizadas no jogo (R, G, B)
 WHITE_COLOR = (255, 255, 255)
@@ -14,17 +23,97 @@ PURPLE_COLOR = (203, 0, 255)
 RED_COLOR = (237, 28, 36)
 
 # Configura o tamanho da tela que o jogo será executado
-SCREEN = display.set_mode((800, 600))
+SCREEN_SIZE = (800, 600)
 FONT = FONT_PATH + 'space_invaders_game.ttf'
 IMG_NAMES = ['ship', 'mystery',
              'alien1_1', 'alien1_2',
              'alien2_1', 'alien2_2',
              'explosionpurple', 'explosiongreen',
              'laser', 'enemylaser']
-IMAGES = {name: image.load(IMAGE_PATH + '{}.png'.format(name)).convert_alpha()
-          for name in IMG_NAMES}
+
+
+class LazyImages(dict):
+    """
+    Dicionário de imagens do jogo que só lê cada arquivo no primeiro acesso.
+    A leitura pode ser adiantada em uma thread com preload(); a conversão para o
+    formato de pixel da tela acontece no primeiro acesso, quando existe uma janela.
+
+    Atributos:
+        names (list): Nomes das imagens disponíveis
+        loaded (dict): Imagens lidas do disco e ainda não convertidas
+    """
+
+    def __init__(self, names):
+        """
+        Inicializa o dicionário sem ler nenhum arquivo.
+
+        Args:
+            names (list): Nomes dos arquivos .png na pasta de imagens
+        """
+        super().__init__()
+        self.names = list(names)
+        self.loaded = {}
+        self.thread = None
+
+    def __missing__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        self.wait()
+        surface = self.loaded.pop(name, None)
+        if surface is None:
+            surface = self._load(name)
+        if display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self[name] = surface
+        return surface
+
+    def _load(self, name):
+        return image.load(IMAGE_PATH + '{}.png'.format(name))
+
+    def _load_all(self):
+        for name in self.names:
+            if name not in self and name not in self.loaded:
+                self.loaded[name] = self._load(name)
+
+    def preload(self):
+        """Começa a ler todas as imagens em segundo plano, sem bloquear quem chamou."""
+        if self.thread is None:
+            self.thread = Thread(target=self._load_all, name='image-preload', daemon=True)
+            self.thread.start()
+
+    def wait(self):
+        """Aguarda o fim da leitura em segundo plano, se houver uma em andamento."""
+        if self.thread is not None:
+            self.thread.join()
+
+
+IMAGES = LazyImages(IMG_NAMES)
+
+
+def __getattr__(name):
+    """
+    Cria a janela do jogo apenas no primeiro acesso a SCREEN, para que importar
+    este módulo não tenha efeitos colaterais (ferramentas e processos de simulação
+    que não desenham nada não pagam pela janela).
+    """
+    if name == 'SCREEN':
+        screen = globals()['SCREEN'] = display.set_mode(SCREEN_SIZE)
+        return screen
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 # Configura a posição inicial de alguns componentes do jogo
 BLOCKERS_POSITION = 440
+# Base da formação a partir da qual os inimigos invadem a área do jogador
+# (na arena original; em outras arenas, mantém a mesma distância da base)
+INVASION_LINE = 540
 ENEMY_DEFAULT_POSITION = 60 
 ENEMY_MOVE_DOWN = 30
+
+# Configura o tamanho (largura, altura) dos alienígenas na formação
+ALIEN_SIZE = (40, 35)
+# Distância (horizontal, vertical) entre alienígenas vizinhos na formação
+ALIEN_SPACING = (50, 45)
+
+# Configura o tamanho (largura, altura) de cada barreira e de suas células destrutíveis
+BLOCKER_SIZE = (90, 40)
+BLOCKER_CELL_SIZE = 10
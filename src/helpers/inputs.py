@@ -0,0 +1,150 @@
+from time import perf_counter
+
+from pygame import (FINGERDOWN, FINGERMOTION, FINGERUP, JOYAXISMOTION, JOYBALLMOTION,
+                    JOYBUTTONDOWN, JOYBUTTONUP, JOYHATMOTION, K_LEFT, K_RIGHT, K_SPACE, KEYDOWN,
+                    MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION, MOUSEWHEEL, NOEVENT, event, key)
+
+# Dispositivos de entrada que o jogo não usa: seus eventos nem entram na fila (e não
+# acordam a espera entre frames). Eventos de janela (foco, exposição, redimensionamento)
+# continuam permitidos
+UNUSED_EVENTS = [MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL,
+                 JOYAXISMOTION, JOYBALLMOTION, JOYHATMOTION, JOYBUTTONDOWN, JOYBUTTONUP,
+                 FINGERDOWN, FINGERUP, FINGERMOTION]
+
+# Teclas que viram entradas do jogo (as únicas com latência medida)
+GAME_KEYS = (K_LEFT, K_RIGHT, K_SPACE)
+
+class InputState:
+    """
+    Estado das entradas do jogador em um único passo lógico.
+    Pode ser indexado como o resultado de key.get_pressed(), o que permite
+    repassá-lo diretamente para Ship.update().
+
+    Atributos:
+        left (bool): Seta esquerda pressionada
+        right (bool): Seta direita pressionada
+        shoot (bool): Disparo solicitado neste passo
+        start (bool): Alguma tecla foi solta (usado para sair do menu)
+    """
+
+    __slots__ = ('left', 'right', 'shoot', 'start')
+
+    def __init__(self, left=False, right=False, shoot=False, start=False):
+        """
+        Inicializa o estado das entradas.
+
+        Args:
+            left (bool): Seta esquerda pressionada
+            right (bool): Seta direita pressionada
+            shoot (bool): Disparo solicitado neste passo
+            start (bool): Alguma tecla foi solta neste passo
+        """
+        self.left = left
+        self.right = right
+        self.shoot = shoot
+        self.start = start
+
+    def __getitem__(self, key):
+        """
+        Permite consultar o estado como keys[K_LEFT], keys[K_RIGHT] ou keys[K_SPACE].
+
+        Args:
+            key (int): Constante de tecla do Pygame
+
+        Returns:
+            bool: True se a tecla estiver ativa neste passo
+        """
+        if key == K_LEFT:
+            return self.left
+        if key == K_RIGHT:
+            return self.right
+        if key == K_SPACE:
+            return self.shoot
+        return False
+
+
+class InputSampler:
+    """
+    Coleta as entradas do teclado o mais tarde possível antes de cada passo lógico.
+    Enquanto o loop espera pelo próximo frame, os eventos são retirados da fila
+    assim que chegam e recebem o instante de chegada; a leitura final da fila e do
+    estado das teclas acontece imediatamente antes da lógica. Cada tecla pressionada
+    do jogo (setas e espaço) fica pendente até ser apresentado o frame que a
+    reflete, o que permite medir a latência entre a entrada e a tela.
+
+    Atributos:
+        events (list): Pares (instante, evento) recebidos desde a última leitura
+        waiting (list): Instantes das teclas já lidas cujo frame ainda não foi apresentado
+        latencies (list): Latências recentes entre tecla e apresentação (ms)
+        total (int): Teclas medidas desde o início da sessão
+        history (int): Quantidade de latências mantidas para as estatísticas
+    """
+
+    def __init__(self, history=300):
+        """
+        Inicializa o coletor e bloqueia os eventos de dispositivos que o jogo não usa.
+
+        Args:
+            history (int): Quantidade de latências mantidas para as estatísticas
+        """
+        event.set_blocked(UNUSED_EVENTS)
+        self.history = history
+        self.events = []
+        self.waiting = []
+        self.latencies = []
+        self.total = 0
+
+    def wait(self, deadline):
+        """
+        Espera até o instante informado, registrando os eventos que chegarem.
+
+        Args:
+            deadline (float): Instante (perf_counter) em que a espera termina
+        """
+        while True:
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                return
+            received = event.wait(max(1, int(remaining * 1000)))
+            if received.type != NOEVENT:
+                self.events.append((perf_counter(), received))
+
+    def poll(self):
+        """
+        Esvazia a fila de eventos e lê o estado das teclas (depois de esvaziar a
+        fila, de modo que o estado inclui os eventos mais recentes).
+
+        Returns:
+            tuple: (eventos, teclas), com os eventos em pares (instante, evento) e
+                as teclas no formato de key.get_pressed()
+        """
+        now = perf_counter()
+        self.events.extend((now, received) for received in event.get())
+        events, self.events = self.events, []
+        self.waiting.extend(stamp for stamp, received in events
+                            if received.type == KEYDOWN and received.key in GAME_KEYS)
+        return events, key.get_pressed()
+
+    def presented(self):
+        """Registra a apresentação do frame que reflete as teclas pendentes."""
+        if not self.waiting:
+            return
+        now = perf_counter()
+        self.latencies.extend((now - stamp) * 1000 for stamp in self.waiting)
+        self.total += len(self.waiting)
+        self.waiting = []
+        del self.latencies[:-self.history]
+
+    def stats(self):
+        """
+        Retorna as latências recentes entre tecla e apresentação.
+
+        Returns:
+            dict: Teclas medidas na sessão e percentis recentes (ms)
+        """
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        if not count:
+            return {'keys': self.total, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        return {'keys': self.total, 'p50_ms': latencies[count // 2],
+                'p99_ms': latencies[min(count - 1, int(count * 0.99))], 'max_ms': latencies[-1]}
@@ -1,5 +1,5 @@
-from pygame import sprite, transform
-from helpers import constants
+from pygame import sprite
+from helpers.assets import ATLAS
 
 class Life(sprite.Sprite):
     """
@@ -21,24 +21,11 @@ class Life(sprite.Sprite):
             game (object): Referência ao objeto do jogo principal.
         """
         super().__init__()  
-        # Carrega e redimensiona a imagem da nave
-        self.image = transform.scale(
-            constants.IMAGES['ship'],  # Imagem original da nave
-            (25, 25)  # Dimensões desejadas
-        )
+        # Obtém a imagem redimensionada e compartilhada da nave
+        self.image = ATLAS.get('ship', (25, 25))
 
         # Define a posição do indicador de vida
         self.rect = self.image.get_rect(topleft=(xpos, ypos))
 
-        # Referência ao jogo principal para acesso à tela
-        self.game = game
-
-    def update(self, *args):
-        """
-        Atualiza a exibição da vida na tela.
-        
-        Args:
-            *args: Argumentos variáveis (compatibilidade com sprite.Group)
-        """
-        # Renderiza a imagem na posição atual
-        self.game.screen.blit(self.image, self.rect)
\ No newline at end of file
+        # Referência ao jogo principal
+        self.game = game
\ No newline at end of file
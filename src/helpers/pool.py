@@ -0,0 +1,84 @@
+class SpritePool:
+    """
+    Conjunto de sprites reutilizáveis para efeitos de vida curta (explosões).
+    Um sprite está livre quando não pertence a nenhum grupo, ou seja, depois de
+    chamar kill() ou de o grupo ser esvaziado; acquire() o reinicia com reset()
+    em vez de criar um novo objeto.
+
+    Atributos:
+        factory (callable): Cria um novo sprite, ainda sem grupos
+        objects (list): Todos os sprites criados pelo conjunto
+        created (int): Quantidade de sprites criados
+        reused (int): Quantidade de pedidos atendidos com um sprite reutilizado
+    """
+
+    def __init__(self, factory):
+        """
+        Inicializa o conjunto vazio.
+
+        Args:
+            factory (callable): Função sem argumentos que cria um novo sprite
+        """
+        self.factory = factory
+        self.objects = []
+        self.created = 0
+        self.reused = 0
+
+    def warm(self, size):
+        """
+        Cria antecipadamente sprites até o conjunto ter o tamanho informado.
+
+        Args:
+            size (int): Quantidade mínima de sprites no conjunto
+        """
+        while len(self.objects) < size:
+            self.objects.append(self.factory())
+            self.created += 1
+
+    def take(self, group):
+        """
+        Obtém um sprite livre e o adiciona ao grupo, sem reiniciar seu estado
+        (usado ao restaurar um snapshot, que define o estado diretamente).
+
+        Args:
+            group (sprite.Group): Grupo ao qual o sprite passa a pertencer
+
+        Returns:
+            sprite.Sprite: Sprite livre, agora no grupo
+        """
+        for effect in self.objects:
+            if not effect.alive():
+                self.reused += 1
+                break
+        else:
+            effect = self.factory()
+            self.objects.append(effect)
+            self.created += 1
+
+        group.add(effect)
+        return effect
+
+    def acquire(self, group, *args):
+        """
+        Obtém um sprite livre, reinicia seu estado e o adiciona ao grupo.
+
+        Args:
+            group (sprite.Group): Grupo ao qual o sprite passa a pertencer
+            *args: Argumentos repassados para o reset() do sprite
+
+        Returns:
+            sprite.Sprite: Sprite pronto para uso
+        """
+        effect = self.take(group)
+        effect.reset(*args)
+        return effect
+
+    def stats(self):
+        """
+        Retorna as estatísticas de uso do conjunto.
+
+        Returns:
+            dict: Sprites criados, pedidos reaproveitados e sprites em uso
+        """
+        in_use = sum(1 for effect in self.objects if effect.alive())
+        return {'created': self.created, 'reused': self.reused, 'in_use': in_use}
@@ -0,0 +1,207 @@
+import csv
+import json
+from time import perf_counter
+
+from helpers import constants
+from helpers.text import Text
+
+# Fases de um frame, na ordem em que acontecem
+PHASES = ('input', 'logic', 'timers', 'enemies', 'sprites', 'explosions', 'collisions', 'render',
+          'present', 'record')
+
+# Grupos de sprites contados em cada frame
+COUNTED_GROUPS = ('all_sprites', 'bullets', 'enemy_bullets', 'explosions_group', 'all_blockers')
+
+# Orçamento de um frame a 60 FPS (ms)
+FRAME_BUDGET = 1000 / 60
+
+
+class FrameProfiler:
+    """
+    Mede o tempo de cada fase dos frames do loop principal.
+    O tempo entre duas marcações é atribuído à fase da segunda marcação.
+
+    Atributos:
+        frames (list): Um registro por frame: (duração em ms, tempos das fases, contagens)
+        history (int): Quantidade de frames recentes usados nas estatísticas ao vivo
+    """
+
+    def __init__(self, history=300):
+        """
+        Inicializa o medidor sem frames registrados.
+
+        Args:
+            history (int): Quantidade de frames recentes usados nas estatísticas ao vivo
+        """
+        self.history = history
+        self.frames = []
+        self.frame_starts = []
+        self.current = {}
+        self.frame_start = self.last = perf_counter()
+
+    def begin_frame(self):
+        """Marca o início de um novo frame."""
+        self.frame_start = self.last = perf_counter()
+        self.frame_starts.append(self.frame_start)
+        self.current = {}
+
+    def mark(self, phase):
+        """
+        Atribui à fase o tempo decorrido desde a marcação anterior.
+
+        Args:
+            phase (str): Nome da fase (ver PHASES)
+        """
+        now = perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self, counts):
+        """
+        Fecha o frame atual e guarda seu registro.
+
+        Args:
+            counts (dict): Quantidade de sprites por grupo neste frame
+        """
+        duration = (perf_counter() - self.frame_start) * 1000
+        self.frames.append((duration, self.current, counts))
+
+    def fps(self):
+        """
+        Retorna a taxa de frames recente, incluindo a espera do relógio.
+
+        Returns:
+            float: Frames por segundo
+        """
+        starts = self.frame_starts[-self.history:]
+        if len(starts) < 2:
+            return 0.0
+        return (len(starts) - 1) / (starts[-1] - starts[0])
+
+    def percentile(self, percent):
+        """
+        Retorna um percentil da duração dos frames recentes.
+
+        Args:
+            percent (float): Percentil entre 0 e 100
+
+        Returns:
+            float: Duração em milissegundos
+        """
+        durations = sorted(frame[0] for frame in self.frames[-self.history:])
+        if not durations:
+            return 0.0
+        return durations[min(len(durations) - 1, int(len(durations) * percent / 100))]
+
+    def phase_shares(self):
+        """
+        Retorna a fração média do orçamento de um frame (60 FPS) gasta em cada fase.
+
+        Returns:
+            dict: Fração do orçamento por fase
+        """
+        recent = self.frames[-self.history:]
+        if not recent:
+            return {phase: 0.0 for phase in PHASES}
+        return {phase: sum(frame[1].get(phase, 0.0) for frame in recent) / len(recent) / FRAME_BUDGET
+                for phase in PHASES}
+
+    def summary(self):
+        """
+        Resume a sessão inteira.
+
+        Returns:
+            dict: Número de frames, percentis e tempo médio por fase
+        """
+        durations = sorted(frame[0] for frame in self.frames)
+        count = len(durations)
+        session = {'frames': count}
+        if count:
+            session.update({
+                'mean_ms': sum(durations) / count,
+                'p50_ms': durations[count // 2],
+                'p99_ms': durations[min(count - 1, int(count * 0.99))],
+                'max_ms': durations[-1],
+                'phase_mean_ms': {phase: sum(frame[1].get(phase, 0.0) for frame in self.frames) / count
+                                  for phase in PHASES},
+            })
+        return session
+
+    def export(self, path, **counters):
+        """
+        Grava os registros da sessão em CSV ou JSON, conforme a extensão do arquivo.
+
+        Args:
+            path (str): Caminho do arquivo (.csv ou .json)
+            **counters: Contadores adicionais incluídos no resumo JSON, por nome
+                (ex.: audio=VoiceMixer.stats())
+        """
+        rows = [dict({'frame_ms': duration},
+                     **{f'{phase}_ms': phases.get(phase, 0.0) for phase in PHASES},
+                     **counts)
+                for duration, phases, counts in self.frames]
+
+        if path.endswith('.csv'):
+            fields = ['frame_ms'] + [f'{phase}_ms' for phase in PHASES] + list(COUNTED_GROUPS)
+            with open(path, 'w', newline='') as output:
+                writer = csv.DictWriter(output, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, 'w') as output:
+                json.dump({'summary': dict(self.summary(), **counters), 'frames': rows}, output)
+
+
+class PerfOverlay:
+    """
+    Painel com FPS, percentis da duração dos frames, participação de cada fase
+    no orçamento do frame e, opcionalmente, os contadores de áudio e a latência
+    entre tecla e tela. Os textos são atualizados algumas vezes por segundo
+    para não sobrecarregar o cache de textos.
+
+    Atributos:
+        profiler (FrameProfiler): Fonte das medições
+        audio (VoiceMixer): Fonte dos contadores de áudio (None omite a linha)
+        inputs (InputSampler): Fonte das latências de entrada (None omite a linha)
+        visible (bool): Indica se o painel deve ser desenhado
+        texts (list): Linhas de texto do painel
+    """
+
+    def __init__(self, profiler, refresh=15, audio=None, inputs=None):
+        """
+        Inicializa o painel oculto.
+
+        Args:
+            profiler (FrameProfiler): Fonte das medições
+            refresh (int): Número de frames entre atualizações dos textos
+            audio (VoiceMixer, optional): Fonte dos contadores de áudio
+            inputs (InputSampler, optional): Fonte das latências de entrada
+        """
+        self.profiler = profiler
+        self.audio = audio
+        self.inputs = inputs
+        self.refresh = refresh
+        self.visible = False
+        self.texts = [Text(constants.FONT, 12, '', constants.WHITE_COLOR, 5, 30 + 14 * line)
+                      for line in range(len(PHASES) + 4)]
+
+    def toggle(self):
+        """Mostra ou esconde o painel."""
+        self.visible = not self.visible
+
+    def update(self):
+        """Atualiza as linhas do painel com as medições mais recentes."""
+        if len(self.profiler.frames) % self.refresh:
+            return
+        lines = [f'FPS {self.profiler.fps():.0f}',
+                 f'p50 {self.profiler.percentile(50):.1f} ms  p99 {self.profiler.percentile(99):.1f} ms']
+        lines += [f'{phase} {share:.0%}' for phase, share in self.profiler.phase_shares().items()]
+        if self.audio is not None and self.audio.enabled:
+            audio = self.audio.stats()
+            lines.append(f"audio {audio['latency_ms']:.0f} ms  vozes {audio['busy_voices']}/{audio['voices']}  "
+                         f"roubos {audio['steals']}  atrasados {audio['late_frames']}")
+        if self.inputs is not None:
+            latency = self.inputs.stats()
+            lines.append(f"tecla->tela p50 {latency['p50_ms']:.1f} ms  p99 {latency['p99_ms']:.1f} ms")
+        for text, line in zip(self.texts, lines):
+            text.update_text(line)
@@ -0,0 +1,178 @@
+from pygame import Rect, display
+
+class Renderer:
+    """
+    Encapsula a superfície da tela e controla como cada frame é desenhado e
+    apresentado. Repassa qualquer outro atributo para a superfície, podendo ser
+    usado no lugar dela (game.screen.blit, game.screen.get_height, ...).
+
+    Os sprites não se desenham sozinhos: a etapa de renderização do jogo passa
+    as camadas para draw(), que monta os pares (imagem, posição) e os envia
+    com uma única chamada a Surface.blits.
+
+    No modo de retângulos sujos (dirty_rects) registra as áreas desenhadas em
+    cada frame, restaura o fundo apenas sob as áreas do frame anterior e envia
+    para a tela somente as regiões alteradas. Quando a área alterada passa de
+    full_frame_ratio da tela, apresenta o frame inteiro. As camadas estáticas
+    (barreiras, textos do HUD, vidas) ficam desenhadas em um fundo composto e
+    só são redesenhadas quando um item muda de posição, entra, sai ou é marcado
+    com dirty (a barreira erodida, o texto que trocou de conteúdo).
+
+    Atributos:
+        surface (Surface): Superfície real da tela
+        dirty_rects (bool): Ativa o modo de retângulos sujos
+        enabled (bool): Se False, nada é desenhado nem apresentado
+        full_frame_ratio (float): Fração da tela a partir da qual o frame é enviado inteiro
+        dirty (list): Retângulos desenhados no frame atual
+        previous (list): Retângulos desenhados no frame anterior
+        backdrop (Surface): Fundo com as camadas estáticas já desenhadas
+        static (dict): Itens estáticos desenhados no backdrop, com o retângulo de cada um
+        restored (list): Áreas do backdrop recompostas no frame atual
+        full_frames (int): Quantidade de frames apresentados inteiros
+        partial_frames (int): Quantidade de frames apresentados por retângulos
+    """
+
+    def __init__(self, surface, dirty_rects=False, full_frame_ratio=0.5, enabled=True):
+        """
+        Inicializa o renderizador.
+
+        Args:
+            surface (Surface): Superfície real da tela
+            dirty_rects (bool): Ativa o modo de retângulos sujos
+            full_frame_ratio (float): Fração da tela a partir da qual o frame é enviado inteiro
+            enabled (bool): Se False, nada é desenhado nem apresentado
+        """
+        self.surface = surface
+        self.dirty_rects = dirty_rects
+        self.enabled = enabled
+        self.full_frame_ratio = full_frame_ratio
+        self.dirty = []
+        # O primeiro frame precisa restaurar o fundo da tela inteira
+        self.previous = [surface.get_rect()]
+        self.background = None
+        self.backdrop = None
+        self.static = {}
+        self.restored = []
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def __getattr__(self, name):
+        # Demais métodos (get_height, fill, ...) vão direto para a superfície
+        return getattr(self.surface, name)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Desenha na tela registrando a área alterada.
+
+        Args:
+            source (Surface): Superfície a ser desenhada
+            dest (tuple or Rect): Posição de destino
+            area (Rect, optional): Parte da superfície de origem a desenhar
+            special_flags (int): Flags de mistura do Pygame
+
+        Returns:
+            Rect: Área da tela efetivamente alterada
+        """
+        rect = self.surface.blit(source, dest, area, special_flags)
+        if self.dirty_rects and rect.width and rect.height:
+            self.dirty.append(rect)
+        return rect
+
+    def draw(self, layers, positions=None):
+        """
+        Desenha camadas de sprites com uma única chamada a Surface.blits.
+        Cada item precisa de image e rect; itens com visible igual a False são ignorados.
+
+        Args:
+            layers (list): Camadas (grupos ou listas) na ordem de desenho, do fundo para a frente
+            positions (dict, optional): Posição (x, y) de desenho de alguns itens, usada
+                no lugar de rect (por exemplo, posições interpoladas entre passos lógicos)
+        """
+        if positions:
+            sequence = [(item.image, positions.get(item, item.rect)) for layer in layers
+                        for item in layer if getattr(item, 'visible', True)]
+        else:
+            sequence = [(item.image, item.rect) for layer in layers for item in layer
+                        if getattr(item, 'visible', True)]
+        rects = self.surface.blits(sequence, doreturn=self.dirty_rects)
+        if self.dirty_rects:
+            self.dirty.extend(rect for rect in rects if rect.width and rect.height)
+
+    def clear(self, background, static_layers=()):
+        """
+        Restaura o fundo antes de desenhar um novo frame, com as camadas estáticas
+        já desenhadas sobre ele.
+        No modo de retângulos sujos só as áreas do frame anterior e as dos itens
+        estáticos alterados são restauradas.
+
+        Args:
+            background (Surface): Imagem de fundo do tamanho da tela
+            static_layers (list): Camadas que raramente mudam, na ordem de desenho
+        """
+        if not self.dirty_rects:
+            self.surface.blit(background, (0, 0))
+            self.surface.blits([(item.image, item.rect) for layer in static_layers for item in layer
+                                if getattr(item, 'visible', True)], doreturn=False)
+            return
+
+        self._update_backdrop(background, static_layers)
+        for rect in self.previous + self.restored:
+            self.surface.blit(self.backdrop, rect, rect)
+
+    def _update_backdrop(self, background, static_layers):
+        """
+        Recompõe no backdrop apenas as áreas dos itens estáticos que mudaram desde o
+        frame anterior (ou o backdrop inteiro quando o fundo é outro).
+
+        Args:
+            background (Surface): Imagem de fundo do tamanho da tela
+            static_layers (list): Camadas estáticas, na ordem de desenho
+        """
+        if background is not self.background:
+            # Mesmo formato da tela, para que a mistura dê os mesmos pixels do desenho direto
+            self.backdrop = self.surface.copy()
+            self.backdrop.blit(background, (0, 0))
+            self.background = background
+            self.static = {}
+
+        items = [item for layer in static_layers for item in layer if getattr(item, 'visible', True)]
+        current = {item: Rect(item.rect) for item in items}
+        stale = [rect for item, rect in self.static.items()
+                 if current.get(item) != rect or getattr(item, 'dirty', False)]
+        stale += [rect for item, rect in current.items()
+                  if self.static.get(item) != rect or getattr(item, 'dirty', False)]
+        self.static = current
+        self.restored = stale
+        for rect in stale:
+            self.backdrop.set_clip(rect)
+            self.backdrop.blit(background, rect, rect)
+            self.backdrop.blits([(item.image, item.rect) for item in items
+                                 if item.rect.colliderect(rect)], doreturn=False)
+        self.backdrop.set_clip(None)
+        for item in items:
+            if getattr(item, 'dirty', False):
+                item.dirty = False
+
+    def present(self):
+        """Envia o frame atual para a tela, inteiro ou apenas as regiões alteradas."""
+        if not self.enabled:
+            return
+
+        if not self.dirty_rects:
+            display.update()
+            self.full_frames += 1
+            return
+
+        rects = self.previous + self.restored + self.dirty
+        screen_area = self.surface.get_width() * self.surface.get_height()
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+        if dirty_area >= screen_area * self.full_frame_ratio:
+            display.update()
+            self.full_frames += 1
+        else:
+            display.update(rects)
+            self.partial_frames += 1
+
+        self.previous = self.dirty
+        self.dirty = []
+        self.restored = []
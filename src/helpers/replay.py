@@ -0,0 +1,190 @@
+import struct
+import zlib
+
+from helpers.inputs import InputState
+
+# Cabeçalho: assinatura, versão, semente, intervalo entre checksums,
+# número de passos, número de sequências de entradas e de checksums
+HEADER = struct.Struct('<4sBQHIII')
+RUN = struct.Struct('<BH')
+CHECKSUM = struct.Struct('<II')
+MAGIC = b'SIRP'
+VERSION = 1
+
+# Bits de cada entrada no byte gravado por passo
+LEFT, RIGHT, SHOOT, START = 1, 2, 4, 8
+
+
+def encode_inputs(inputs):
+    """
+    Compacta o estado das entradas de um passo em um byte.
+
+    Args:
+        inputs (InputState): Entradas do passo
+
+    Returns:
+        int: Byte com um bit por entrada
+    """
+    return ((LEFT if inputs.left else 0) | (RIGHT if inputs.right else 0) |
+            (SHOOT if inputs.shoot else 0) | (START if inputs.start else 0))
+
+
+def decode_inputs(value):
+    """
+    Reconstrói o estado das entradas a partir do byte gravado.
+
+    Args:
+        value (int): Byte com um bit por entrada
+
+    Returns:
+        InputState: Entradas do passo
+    """
+    return InputState(bool(value & LEFT), bool(value & RIGHT),
+                      bool(value & SHOOT), bool(value & START))
+
+
+def state_checksum(game):
+    """
+    Calcula um checksum (CRC32) do estado lógico do jogo.
+    Considera pontuação, nave, formação, projéteis, barreiras e nave misteriosa.
+
+    Args:
+        game (SpaceInvaders): Jogo a ser verificado
+
+    Returns:
+        int: Checksum de 32 bits
+    """
+    flags = (game.main_screen, game.start_game, game.game_over)
+    crc = zlib.crc32(struct.pack('<3B', *flags))
+    if not hasattr(game, 'enemies'):
+        return crc  # Ainda no menu: nenhuma partida criada
+
+    crc = zlib.crc32(struct.pack('<iiiii', game.score, game.round, game.lives_lost,
+                                 game.player.rect.x, game.mystery_ship.rect.x), crc)
+    crc = zlib.crc32(game.enemies.positions.tobytes(), crc)
+    crc = zlib.crc32(game.enemies.alive.tobytes(), crc)
+    for group in (game.bullets, game.enemy_bullets):
+        for bullet in group:
+            crc = zlib.crc32(struct.pack('<ii', bullet.rect.x, bullet.rect.y), crc)
+    for blocker in game.all_blockers:
+        crc = zlib.crc32(blocker.cells.tobytes(), crc)
+    return crc
+
+
+class Replay:
+    """
+    Gravação compacta de uma sessão: semente, entradas de cada passo lógico e
+    checksums periódicos do estado. As entradas são guardadas com um byte por
+    passo e compactadas por sequências repetidas ao salvar.
+
+    Atributos:
+        seed (int): Semente do gerador aleatório da partida
+        interval (int): Número de passos entre checksums
+        inputs (bytearray): Entradas de cada passo
+        checksums (list): Pares (passo, checksum) gravados
+    """
+
+    def __init__(self, seed, interval=60):
+        """
+        Inicializa uma gravação vazia.
+
+        Args:
+            seed (int): Semente do gerador aleatório da partida
+            interval (int): Número de passos entre checksums
+        """
+        self.seed = seed
+        self.interval = interval
+        self.inputs = bytearray()
+        self.checksums = []
+
+    def record(self, inputs, game):
+        """
+        Registra as entradas de um passo já executado pelo jogo.
+
+        Args:
+            inputs (InputState): Entradas usadas no passo
+            game (SpaceInvaders): Jogo, para calcular o checksum periódico
+        """
+        self.inputs.append(encode_inputs(inputs))
+        tick = len(self.inputs)
+        if tick % self.interval == 0:
+            self.checksums.append((tick, state_checksum(game)))
+
+    def play(self, game, render=False, on_tick=None):
+        """
+        Reproduz a gravação o mais rápido possível em um jogo recém-criado com a mesma semente.
+
+        Args:
+            game (SpaceInvaders): Jogo criado com a semente da gravação
+            render (bool): Desenha e apresenta cada frame
+            on_tick (callable, optional): Chamado com o número do passo após cada passo
+
+        Returns:
+            int: Primeiro passo cujo checksum divergiu, ou None se a reprodução for fiel
+        """
+        expected = dict(self.checksums)
+        for tick, value in enumerate(self.inputs, 1):
+            game.step(decode_inputs(value))
+            if render:
+                game.render()
+                game.screen.present()
+            if on_tick is not None:
+                on_tick(tick)
+            checksum = expected.get(tick)
+            if checksum is not None and checksum != state_checksum(game):
+                return tick
+        return None
+
+    def save(self, path):
+        """
+        Salva a gravação em formato binário.
+
+        Args:
+            path (str): Caminho do arquivo de saída
+        """
+        runs = []
+        for value in self.inputs:
+            if runs and runs[-1][0] == value and runs[-1][1] < 0xFFFF:
+                runs[-1][1] += 1
+            else:
+                runs.append([value, 1])
+
+        with open(path, 'wb') as replay_file:
+            replay_file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.interval,
+                                          len(self.inputs), len(runs), len(self.checksums)))
+            replay_file.write(b''.join(RUN.pack(value, count) for value, count in runs))
+            replay_file.write(b''.join(CHECKSUM.pack(tick, checksum)
+                                       for tick, checksum in self.checksums))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Carrega uma gravação salva por save().
+
+        Args:
+            path (str): Caminho do arquivo
+
+        Returns:
+            Replay: Gravação carregada
+
+        Raises:
+            ValueError: Se o arquivo não for uma gravação válida
+        """
+        with open(path, 'rb') as replay_file:
+            data = replay_file.read()
+
+        magic, version, seed, interval, ticks, run_count, checksum_count = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} não é uma gravação válida')
+
+        replay = cls(seed, interval)
+        offset = HEADER.size
+        for value, count in RUN.iter_unpack(data[offset:offset + run_count * RUN.size]):
+            replay.inputs.extend(bytes([value]) * count)
+        offset += run_count * RUN.size
+        replay.checksums = list(CHECKSUM.iter_unpack(
+            data[offset:offset + checksum_count * CHECKSUM.size]))
+        if len(replay.inputs) != ticks:
+            raise ValueError(f'{path} está incompleto')
+        return replay
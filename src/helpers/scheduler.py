@@ -0,0 +1,176 @@
+import heapq
+from itertools import count
+
+
+class Timer:
+    """
+    Temporizador registrado em um Scheduler.
+
+    Atributos:
+        start (int): Instante de referência (ms); o disparo ocorre quando o tempo
+            decorrido desde start passa de delay
+        delay (int): Intervalo até o disparo (ms)
+        callback (callable): Função chamada com o tempo atual do jogo
+        repeat (bool): Se True, o temporizador é reagendado com start += delay
+            após cada disparo (cadência fixa)
+        active (bool): False depois de cancelado ou de disparado (sem repetição)
+        phase (str): Fase do medidor de frames atribuída ao callback (None usa a do agendador)
+    """
+
+    __slots__ = ('start', 'delay', 'callback', 'repeat', 'active', 'entry', 'phase')
+
+    def __init__(self, start, delay, callback, repeat=False, phase=None):
+        """
+        Inicializa o temporizador ativo.
+
+        Args:
+            start (int): Instante de referência (ms)
+            delay (int): Intervalo até o disparo (ms)
+            callback (callable): Função chamada com o tempo atual do jogo
+            repeat (bool): Reagenda o temporizador após cada disparo
+            phase (str, optional): Fase do medidor de frames atribuída ao callback
+        """
+        self.start = start
+        self.delay = delay
+        self.callback = callback
+        self.repeat = repeat
+        self.active = True
+        self.entry = None
+        self.phase = phase
+
+    @property
+    def due(self):
+        """Instante limite do temporizador: ele dispara no primeiro passo depois deste."""
+        return self.start + self.delay
+
+    def cancel(self):
+        """Cancela o temporizador; a entrada na fila é descartada quando chegar a sua vez."""
+        self.active = False
+
+
+class Scheduler:
+    """
+    Agendador central de temporizadores, baseado em uma fila de prioridade (heapq).
+    Em vez de cada entidade comparar o tempo atual com o seu próprio temporizador
+    a cada passo, os temporizadores ficam ordenados pelo instante de disparo e
+    run() só processa os que vencem, de modo que o custo por passo é proporcional
+    aos disparos, e não à quantidade de entidades.
+
+    Um temporizador dispara quando o tempo decorrido desde start é maior que
+    delay (mesma regra de "current_time - timer > intervalo" usada pelo jogo).
+    Cada temporizador dispara no máximo uma vez por chamada de run().
+
+    Com um medidor de frames, o tempo de cada callback com fase própria (marcha e
+    disparo dos inimigos, explosões) é atribuído a essa fase; o restante fica com
+    a fase do agendador.
+
+    Atributos:
+        queue (list): Heap de entradas (instante, sequência, temporizador)
+        fired (int): Quantidade de disparos executados
+        phase (str): Fase do medidor atribuída ao agendador e aos temporizadores sem fase
+    """
+
+    def __init__(self, phase='timers'):
+        """
+        Inicializa o agendador sem temporizadores.
+
+        Args:
+            phase (str): Fase do medidor atribuída ao agendador e aos temporizadores sem fase
+        """
+        self.phase = phase
+        self.queue = []
+        self.sequence = count()
+        self.fired = 0
+
+    def schedule(self, start, delay, callback, repeat=False, phase=None):
+        """
+        Registra um temporizador.
+
+        Args:
+            start (int): Instante de referência (ms), normalmente o tempo atual
+            delay (int): Intervalo até o disparo (ms)
+            callback (callable): Função chamada com o tempo atual do jogo
+            repeat (bool): Reagenda o temporizador após cada disparo
+            phase (str, optional): Fase do medidor de frames atribuída ao callback
+
+        Returns:
+            Timer: Temporizador criado, que pode ser cancelado ou reagendado
+        """
+        timer = Timer(start, delay, callback, repeat, phase)
+        self._push(timer)
+        return timer
+
+    def reschedule(self, timer, start=None, delay=None):
+        """
+        Altera o instante de referência e/ou o intervalo de um temporizador ativo.
+        A entrada anterior continua na fila, mas é ignorada.
+
+        Args:
+            timer (Timer): Temporizador criado por este agendador
+            start (int, optional): Novo instante de referência (ms)
+            delay (int, optional): Novo intervalo (ms)
+        """
+        if start is not None:
+            timer.start = start
+        if delay is not None:
+            timer.delay = delay
+        if timer.active:
+            self._push(timer)
+
+    def _push(self, timer):
+        timer.entry = next(self.sequence)
+        heapq.heappush(self.queue, (timer.due, timer.entry, timer))
+
+    def run(self, current_time, profiler=None):
+        """
+        Dispara, em ordem de instante, todos os temporizadores vencidos.
+        Temporizadores criados ou reagendados durante esta chamada só disparam
+        em uma chamada seguinte.
+
+        Args:
+            current_time (int): Tempo atual do jogo em milissegundos
+            profiler (FrameProfiler, optional): Medidor que recebe o tempo de cada
+                callback com fase própria
+        """
+        queue = self.queue
+        limit = next(self.sequence)
+        deferred = []
+        while queue and queue[0][0] < current_time:
+            item = heapq.heappop(queue)
+            due, entry, timer = item
+            if entry > limit:
+                deferred.append(item)
+                continue
+            if not timer.active or entry != timer.entry:
+                continue  # Cancelado ou reagendado
+
+            if timer.repeat:
+                timer.start += timer.delay
+                self._push(timer)
+            else:
+                timer.active = False
+            self.fired += 1
+            if profiler is not None and timer.phase is not None:
+                profiler.mark(self.phase)
+                timer.callback(current_time)
+                profiler.mark(timer.phase)
+            else:
+                timer.callback(current_time)
+
+        for item in deferred:
+            heapq.heappush(queue, item)
+
+    def clear(self):
+        """Cancela todos os temporizadores (usado ao reiniciar uma rodada)."""
+        for _, _, timer in self.queue:
+            timer.active = False
+        self.queue.clear()
+
+    def stats(self):
+        """
+        Retorna as estatísticas do agendador.
+
+        Returns:
+            dict: Disparos executados e entradas na fila
+        """
+        return {'fired': self.fired, 'pending': len(self.queue)}
@@ -0,0 +1,67 @@
+class Settings:
+    """
+    Parâmetros de dificuldade e do tamanho da arena do jogo.
+    Os valores padrão reproduzem o jogo original; outros valores permitem
+    ajustar a dificuldade, fazer varreduras de parâmetros e testes de estresse
+    com arenas, formações e quantidades de barreiras maiores.
+
+    Atributos:
+        alien_move_time (int): Intervalo entre passos da formação (ms)
+        alien_fast_count (int): Quantidade de aliens a partir da qual a formação acelera
+        alien_fast_move_time (int): Intervalo entre passos com poucos aliens (ms)
+        alien_last_move_time (int): Intervalo entre passos com um único alien (ms)
+        enemy_fire_interval (int): Intervalo mínimo entre disparos inimigos (ms)
+        player_bullet_speed (int): Velocidade dos projéteis do jogador (px por passo)
+        enemy_bullet_speed (int): Velocidade dos projéteis inimigos (px por passo)
+        mystery_move_time (int): Intervalo entre aparições da nave misteriosa (ms)
+        arena_width (int): Largura da arena (px)
+        arena_height (int): Altura da arena (px)
+        formation_columns (int): Colunas da formação de alienígenas
+        formation_rows (int): Linhas da formação de alienígenas
+        barrier_count (int): Quantidade de barreiras
+    """
+
+    def __init__(self, alien_move_time=600, alien_fast_count=10, alien_fast_move_time=400,
+                 alien_last_move_time=200, enemy_fire_interval=700, player_bullet_speed=15,
+                 enemy_bullet_speed=5, mystery_move_time=25000, arena_width=800,
+                 arena_height=600, formation_columns=10, formation_rows=3, barrier_count=4):
+        """
+        Inicializa os parâmetros, usando os valores do jogo original como padrão.
+
+        Args:
+            alien_move_time (int): Intervalo entre passos da formação (ms)
+            alien_fast_count (int): Quantidade de aliens a partir da qual a formação acelera
+            alien_fast_move_time (int): Intervalo entre passos com poucos aliens (ms)
+            alien_last_move_time (int): Intervalo entre passos com um único alien (ms)
+            enemy_fire_interval (int): Intervalo mínimo entre disparos inimigos (ms)
+            player_bullet_speed (int): Velocidade dos projéteis do jogador (px por passo)
+            enemy_bullet_speed (int): Velocidade dos projéteis inimigos (px por passo)
+            mystery_move_time (int): Intervalo entre aparições da nave misteriosa (ms)
+            arena_width (int): Largura da arena (px)
+            arena_height (int): Altura da arena (px)
+            formation_columns (int): Colunas da formação de alienígenas
+            formation_rows (int): Linhas da formação de alienígenas
+            barrier_count (int): Quantidade de barreiras
+        """
+        self.alien_move_time = alien_move_time
+        self.alien_fast_count = alien_fast_count
+        self.alien_fast_move_time = alien_fast_move_time
+        self.alien_last_move_time = alien_last_move_time
+        self.enemy_fire_interval = enemy_fire_interval
+        self.player_bullet_speed = player_bullet_speed
+        self.enemy_bullet_speed = enemy_bullet_speed
+        self.mystery_move_time = mystery_move_time
+        self.arena_width = arena_width
+        self.arena_height = arena_height
+        self.formation_columns = formation_columns
+        self.formation_rows = formation_rows
+        self.barrier_count = barrier_count
+
+    def as_dict(self):
+        """
+        Retorna os parâmetros como dicionário (útil para relatórios).
+
+        Returns:
+            dict: Parâmetros indexados pelo nome
+        """
+        return dict(vars(self))
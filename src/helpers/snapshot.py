@@ -0,0 +1,442 @@
+import struct
+
+import numpy as np
+from pygame import sprite
+
+from alien.alien import Alien
+from alien.alien_explosion import AlienExplosion
+from alien.alien_group import AliensGroup
+from helpers import constants
+from helpers.barrier import Barrier
+from helpers.bullet import Bullet
+from helpers.inputs import InputState
+from mystery.mystery import Mystery
+from mystery.mystery_explosion import MysteryExplosion
+from ship.ship import Ship
+from ship.ship_explosion import ShipExplosion
+
+# Cabeçalho: assinatura, versão, estados do jogo, passo do relógio,
+# posição inicial da formação e semente
+HEADER = struct.Struct('<4sBBIiQ')
+# Estado do gerador aleatório: 624 palavras do Mersenne Twister, a posição
+# atual e o valor guardado por gauss() (se houver)
+RANDOM = struct.Struct('<625I?d')
+# Partida: pontuação, rodada, vidas perdidas, último disparo inimigo, último abate,
+# próxima nota da música, estados da nave, vidas restantes e posição da nave
+MATCH = struct.Struct('<iHHiiBBBii')
+# Quantidades: naves misteriosas, quais estão em jogo, barreiras, projéteis do
+# jogador, projéteis inimigos, explosões e temporizadores
+COUNTS = struct.Struct('<BBHHHHH')
+# Formação: colunas, linhas, origem da grade, quadro, direção, contadores da marcha,
+# intervalo da marcha, base e colunas vivas extremas (seguida da máscara de vivos)
+FORMATION = struct.Struct('<HHiiBbiiiiiiiii')
+MYSTERY = struct.Struct('<iib???i')
+BULLET = struct.Struct('<iibhBB')
+# Barreira: posição, linhas, colunas e tamanho da célula (seguida da ocupação das células)
+BLOCKER = struct.Struct('<iiHHB')
+# Explosão: tipo, linha do alienígena ou pontuação exibida, posição,
+# imagem maior ou visível, e momento de criação
+EXPLOSION = struct.Struct('<BHii?i')
+# Temporizador: agendador, tipo e índice do dono, método, início, intervalo e repetição
+TIMER = struct.Struct('<BBHBii?')
+MAGIC = b'SISN'
+VERSION = 1
+
+# Bits dos estados do jogo no cabeçalho
+MAIN_SCREEN, START_GAME, GAME_OVER, MATCH_CREATED = 1, 2, 4, 8
+# Bits dos estados da partida
+MAKE_NEW_SHIP, SHIP_ALIVE, PLAYER_ALIVE, GAME_TIMER = 1, 2, 4, 8
+
+BULLET_IMAGES = ('laser', 'enemylaser')
+BULLET_SIDES = ('center', 'left', 'right')
+# Tipos de explosão e o conjunto de reutilização (SpritePool) de cada um no jogo
+EXPLOSION_TYPES = (AlienExplosion, MysteryExplosion, ShipExplosion)
+EXPLOSION_POOLS = ('alien_explosions', 'mystery_explosions', 'ship_explosions')
+ALIEN_EXPLOSION, MYSTERY_EXPLOSION, SHIP_EXPLOSION = range(3)
+
+# Donos dos temporizadores e os métodos que podem ser agendados
+TARGET_GAME, TARGET_ENEMIES, TARGET_MYSTERY, TARGET_EXPLOSION = range(4)
+CALLBACKS = ('play_main_music', 'make_enemies_shoot', 'create_new_ship', 'update',
+             '_start_moving', '_grow', '_hide', '_show', '_expire')
+# Fase do medidor de frames de cada dono de temporizador (o disparo inimigo pertence ao jogo)
+TIMER_PHASES = {TARGET_ENEMIES: 'enemies', TARGET_EXPLOSION: 'explosions'}
+
+# Atributos criados por uma partida, removidos ao restaurar um snapshot do menu inicial
+MATCH_ATTRIBUTES = ('player', 'player_group', 'explosions_group', 'bullets', 'enemy_bullets',
+                    'mystery_ship', 'mystery_group', 'enemies', 'all_sprites', 'all_blockers')
+
+
+def take_snapshot(game):
+    """
+    Serializa todo o estado lógico do jogo em um bloco binário compacto.
+    Guarda apenas números (posições, máscaras, contadores, temporizadores pendentes
+    e o estado do gerador aleatório); superfícies e sons são recriados a partir
+    deles na restauração.
+
+    Args:
+        game (SpaceInvaders): Jogo a ser salvo
+
+    Returns:
+        bytes: Snapshot, que pode ser restaurado com restore_snapshot()
+    """
+    match = hasattr(game, 'enemies')
+    flags = ((MAIN_SCREEN if game.main_screen else 0) | (START_GAME if game.start_game else 0) |
+             (GAME_OVER if game.game_over else 0) | (MATCH_CREATED if match else 0))
+    _, state, gauss = game.random.getstate()
+    parts = [HEADER.pack(MAGIC, VERSION, flags, game.game_clock.frame, game.enemy_position,
+                         game.seed),
+             RANDOM.pack(*state, gauss is not None, gauss or 0.0)]
+    if match:
+        _pack_match(game, parts)
+    return b''.join(parts)
+
+
+def _lives(game):
+    """Indicadores de vida, na ordem em que são removidos de trás para frente."""
+    return game.life1, game.life2, game.life3, game.life4
+
+
+def _pack_match(game, parts):
+    """
+    Serializa o estado da partida em andamento.
+
+    Args:
+        game (SpaceInvaders): Jogo com uma partida criada
+        parts (list): Blocos de bytes do snapshot, estendida no lugar
+    """
+    enemies = game.enemies
+    mysteries = [game.mystery_ship]
+    mysteries.extend(mystery for mystery in game.mystery_group if mystery is not game.mystery_ship)
+    explosions = game.explosions_group.sprites()
+
+    state = ((MAKE_NEW_SHIP if game.make_new_ship else 0) | (SHIP_ALIVE if game.ship_alive else 0) |
+             (PLAYER_ALIVE if game.player_group.has(game.player) else 0) |
+             (GAME_TIMER if hasattr(game, 'game_timer') else 0))
+    lives = sum(1 << index for index, life in enumerate(_lives(game)) if game.lives_group.has(life))
+    parts.append(MATCH.pack(game.score, game.round, game.lives_lost, game.timer,
+                            getattr(game, 'game_timer', 0), game.note_index, state, lives,
+                            game.player.rect.x, game.player.rect.y))
+
+    # Só os temporizadores ativos, na ordem da fila, com o dono identificado por índice;
+    # os de objetos que não fazem mais parte do jogo são descartados
+    targets = {id(game): (TARGET_GAME, 0), id(enemies): (TARGET_ENEMIES, 0)}
+    targets.update((id(mystery), (TARGET_MYSTERY, index)) for index, mystery in enumerate(mysteries))
+    targets.update((id(explosion), (TARGET_EXPLOSION, index))
+                   for index, explosion in enumerate(explosions))
+    timers = []
+    for number, scheduler in enumerate((game.timers, game.late_timers)):
+        for _, entry, timer in sorted(scheduler.queue, key=lambda item: item[:2]):
+            if not timer.active or entry != timer.entry:
+                continue
+            target = targets.get(id(timer.callback.__self__))
+            if target is not None:
+                timers.append(TIMER.pack(number, *target, CALLBACKS.index(timer.callback.__name__),
+                                         timer.start, timer.delay, timer.repeat))
+
+    in_group = sum(1 << index for index, mystery in enumerate(mysteries)
+                   if game.mystery_group.has(mystery))
+    parts.append(COUNTS.pack(len(mysteries), in_group, len(game.all_blockers), len(game.bullets),
+                             len(game.enemy_bullets), len(explosions), len(timers)))
+
+    left, top = enemies.positions[0, 0].tolist()
+    parts.append(FORMATION.pack(enemies.columns, enemies.rows, left, top, enemies.frame,
+                                enemies.direction, enemies.left_moves, enemies.right_moves,
+                                enemies.left_add_move, enemies.right_add_move, enemies.move_number,
+                                enemies.move_time, enemies.bottom, enemies.leftmost_alive_column,
+                                enemies.rightmost_alive_column))
+    parts.append(np.packbits(enemies.alive).tobytes())
+
+    for mystery in mysteries:
+        parts.append(MYSTERY.pack(mystery.rect.x, mystery.rect.y, mystery.direction, mystery.moving,
+                                  mystery.play_sound, mystery.visible, mystery.timer))
+    for blocker in game.all_blockers:
+        rows, columns = blocker.cells.shape
+        parts.append(BLOCKER.pack(blocker.rect.x, blocker.rect.y, rows, columns, blocker.cell_size))
+        parts.append(np.packbits(blocker.cells).tobytes())
+    for group in (game.bullets, game.enemy_bullets):
+        for bullet in group:
+            parts.append(BULLET.pack(bullet.rect.x, bullet.rect.y, bullet.direction, bullet.speed,
+                                     BULLET_IMAGES.index(bullet.filename),
+                                     BULLET_SIDES.index(bullet.side)))
+    for explosion in explosions:
+        kind = EXPLOSION_TYPES.index(type(explosion))
+        if kind == SHIP_EXPLOSION:
+            detail, shown = 0, explosion.visible
+        elif kind == MYSTERY_EXPLOSION:
+            detail, shown = int(explosion.text.message), explosion.visible
+        else:
+            detail, shown = explosion.row, explosion.image is explosion.image2
+        parts.append(EXPLOSION.pack(kind, detail, explosion.rect.x, explosion.rect.y, shown,
+                                    explosion.timer))
+    parts.extend(timers)
+
+
+def _unpack_mask(blob, offset, shape):
+    """
+    Lê uma máscara booleana compactada com np.packbits.
+
+    Returns:
+        tuple: (máscara, posição logo depois dela no snapshot)
+    """
+    count = shape[0] * shape[1]
+    size = (count + 7) // 8
+    bits = np.unpackbits(np.frombuffer(blob, dtype=np.uint8, count=size, offset=offset),
+                         count=count)
+    return bits.reshape(shape).view(bool), offset + size
+
+
+def _empty_group(game, name):
+    """Esvazia o grupo do jogo com o nome informado, criando-o se ainda não existir."""
+    group = getattr(game, name, None)
+    if group is None:
+        group = sprite.Group()
+        setattr(game, name, group)
+    else:
+        group.empty()
+    return group
+
+
+def _sync_group(game, name, members):
+    """
+    Deixa no grupo do jogo exatamente os sprites informados, alterando apenas as
+    diferenças (restaurar um estado próximo do atual não esvazia nem reconstrói o grupo).
+
+    Args:
+        game (SpaceInvaders): Jogo dono do grupo
+        name (str): Nome do grupo no jogo (criado se ainda não existir)
+        members (list): Sprites que devem ficar no grupo
+    """
+    group = getattr(game, name, None)
+    if group is None:
+        group = sprite.Group()
+        setattr(game, name, group)
+    # Os métodos internos evitam o caminho lento de Group.add/remove para sprites
+    # que não herdam de Sprite (os alienígenas)
+    wanted = set(members)
+    for member in [member for member in group if member not in wanted]:
+        group.remove_internal(member)
+        member.remove_internal(group)
+    for member in members:
+        if not group.has_internal(member):
+            group.add_internal(member)
+            member.add_internal(group)
+    return group
+
+
+def restore_snapshot(game, blob):
+    """
+    Restaura no jogo o estado salvo por take_snapshot().
+    O jogo precisa ter sido criado com os mesmos parâmetros (Settings). Os objetos
+    existentes (nave, formação, naves misteriosas, barreiras, explosões) são reaproveitados
+    quando possível, e os temporizadores pendentes são registrados novamente na
+    mesma ordem, de modo que os passos seguintes são idênticos aos do jogo salvo.
+
+    Args:
+        game (SpaceInvaders): Jogo que recebe o estado
+        blob (bytes): Snapshot criado por take_snapshot()
+
+    Raises:
+        ValueError: Se os dados não forem um snapshot válido
+    """
+    magic, version, flags, frame, enemy_position, seed = HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('os dados não são um snapshot válido')
+    values = RANDOM.unpack_from(blob, HEADER.size)
+    game.random.setstate((3, values[:625], values[626] if values[625] else None))
+
+    game.game_clock.frame = frame
+    game.current_time = game.game_clock.get_ticks()
+    game.enemy_position = enemy_position
+    game.seed = seed
+    game.main_screen = bool(flags & MAIN_SCREEN)
+    game.start_game = bool(flags & START_GAME)
+    game.game_over = bool(flags & GAME_OVER)
+    game.previous_positions = {}
+
+    game.timers.clear()
+    game.late_timers.clear()
+    if flags & MATCH_CREATED:
+        _unpack_match(game, blob, HEADER.size + RANDOM.size)
+    else:
+        # Snapshot do menu inicial, antes de qualquer partida
+        if hasattr(game, 'explosions_group'):
+            game.explosions_group.empty()
+        for name in MATCH_ATTRIBUTES:
+            vars(game).pop(name, None)
+
+
+def _restore_formation(game, columns, rows, alive):
+    """
+    Restaura os alienígenas vivos na formação atual, criando ou removendo apenas os
+    que mudaram (o índice da formação é atualizado a cada alteração). Uma nova
+    formação só é criada se não houver uma com as mesmas dimensões.
+
+    Args:
+        game (SpaceInvaders): Jogo que recebe o estado
+        columns (int): Colunas da formação salva
+        rows (int): Linhas da formação salva
+        alive (ndarray): Alienígenas vivos, formato (linhas, colunas)
+
+    Returns:
+        AliensGroup: Formação com exatamente os alienígenas vivos informados; os
+            limites e contadores da marcha ficam para quem chama restaurar
+    """
+    enemies = getattr(game, 'enemies', None)
+    if enemies is None or (enemies.rows, enemies.columns) != (rows, columns):
+        enemies = AliensGroup(columns, rows, game)
+    changed = alive != enemies.alive
+    # Primeiro os que voltam, para que nenhuma coluna fique vazia só de passagem
+    enemies.add([Alien(row, column, enemies)
+                 for row, column in np.argwhere(changed & alive).tolist()])
+    for row, column in np.argwhere(changed & ~alive).tolist():
+        enemies.aliens[row][column].kill()
+    return enemies
+
+
+def _unpack_match(game, blob, offset):
+    """
+    Recria a partida salva por _pack_match().
+
+    Args:
+        game (SpaceInvaders): Jogo que recebe o estado
+        blob (bytes): Snapshot
+        offset (int): Posição do estado da partida no snapshot
+    """
+    (score, round_number, lives_lost, timer, game_timer, note_index, state, lives,
+     player_x, player_y) = MATCH.unpack_from(blob, offset)
+    offset += MATCH.size
+    (mystery_count, in_group, blocker_count, bullet_count, enemy_bullet_count, explosion_count,
+     timer_count) = COUNTS.unpack_from(blob, offset)
+    offset += COUNTS.size
+
+    if not hasattr(game, 'sounds'):
+        game.create_audio()
+    game.score = score
+    game.round = round_number
+    game.lives_lost = lives_lost
+    game.timer = timer
+    if state & GAME_TIMER:
+        game.game_timer = game_timer
+    else:
+        vars(game).pop('game_timer', None)
+    game.note_index = note_index
+    game.make_new_ship = bool(state & MAKE_NEW_SHIP)
+    game.ship_alive = bool(state & SHIP_ALIVE)
+    game.keys = InputState()
+
+    # Objetos reaproveitados, obtidos antes de os grupos serem esvaziados
+    mysteries = []
+    if hasattr(game, 'mystery_ship'):
+        mysteries.append(game.mystery_ship)
+        mysteries.extend(mystery for mystery in game.mystery_group
+                         if mystery is not game.mystery_ship)
+
+    player = getattr(game, 'player', None)
+    if player is None:
+        player = Ship(game)
+    player.rect.topleft = (player_x, player_y)
+    game.player = player
+    player_group = _empty_group(game, 'player_group')
+    if state & PLAYER_ALIVE:
+        player_group.add(player)
+
+    game.lives_group.empty()
+    game.lives_group.add([life for index, life in enumerate(_lives(game)) if lives & (1 << index)])
+
+    # Formação: a grade é regular, então bastam a origem e a máscara de vivos
+    (columns, rows, left, top, frame, direction, left_moves, right_moves, left_add_move,
+     right_add_move, move_number, move_time, bottom, leftmost, rightmost) = \
+        FORMATION.unpack_from(blob, offset)
+    alive, offset = _unpack_mask(blob, offset + FORMATION.size, (rows, columns))
+    enemies = _restore_formation(game, columns, rows, alive)
+    enemies.place(left, top)
+    enemies.frame = frame
+    enemies.direction = direction
+    enemies.left_moves = left_moves
+    enemies.right_moves = right_moves
+    enemies.left_add_move = left_add_move
+    enemies.right_add_move = right_add_move
+    enemies.move_number = move_number
+    enemies.move_time = move_time
+    enemies.bottom = bottom
+    enemies.leftmost_alive_column = leftmost
+    enemies.rightmost_alive_column = rightmost
+    enemies.alive_columns = [column for column in range(columns) if enemies.column_counts[column]]
+    game.enemies = enemies
+
+    mystery_group = _empty_group(game, 'mystery_group')
+    for index in range(mystery_count):
+        if index == len(mysteries):
+            mysteries.append(Mystery(game))
+        mystery = mysteries[index]
+        (x, y, mystery.direction, mystery.moving, mystery.play_sound, mystery.visible,
+         mystery.timer) = MYSTERY.unpack_from(blob, offset)
+        offset += MYSTERY.size
+        mystery.rect.topleft = (x, y)
+        if in_group & (1 << index):
+            mystery_group.add(mystery)
+    del mysteries[mystery_count:]
+    game.mystery_ship = mysteries[0]
+
+    current = game.all_blockers.sprites() if hasattr(game, 'all_blockers') else []
+    blockers = []
+    for index in range(blocker_count):
+        x, y, rows, columns, cell_size = BLOCKER.unpack_from(blob, offset)
+        cells, offset = _unpack_mask(blob, offset + BLOCKER.size, (rows, columns))
+        blocker = current[index] if index < len(current) else None
+        if blocker is None or blocker.cells.shape != (rows, columns) or blocker.cell_size != cell_size:
+            blocker = Barrier(x, y, rows, columns, cell_size, constants.GREEN_COLOR, game)
+        blocker.rect.topleft = (x, y)
+        blocker.set_cells(cells)
+        blockers.append(blocker)
+    if blockers != current:
+        game.all_blockers = sprite.Group(*blockers)
+
+    for name, count in (('bullets', bullet_count), ('enemy_bullets', enemy_bullet_count)):
+        bullets = []
+        for _ in range(count):
+            x, y, direction, speed, image, side = BULLET.unpack_from(blob, offset)
+            offset += BULLET.size
+            bullets.append(Bullet(x, y, direction, speed, BULLET_IMAGES[image], BULLET_SIDES[side],
+                                  game))
+        _empty_group(game, name).add(bullets)
+
+    # Explosões voltam para os conjuntos e são retiradas de novo, na ordem salva
+    explosions_group = _empty_group(game, 'explosions_group')
+    explosions = []
+    for _ in range(explosion_count):
+        kind, detail, x, y, shown, started = EXPLOSION.unpack_from(blob, offset)
+        offset += EXPLOSION.size
+        explosion = getattr(game, EXPLOSION_POOLS[kind]).take(explosions_group)
+        if kind == SHIP_EXPLOSION:
+            explosion.restore(x, y, shown, started)
+        else:
+            explosion.restore(detail, x, y, shown, started)
+        explosions.append(explosion)
+
+    # Mesma composição de all_sprites que a partida mantém (a ordem só afeta o desenho)
+    _sync_group(game, 'all_sprites', [*player_group, *enemies, *game.lives_group, *mystery_group,
+                                      *game.bullets, *game.enemy_bullets])
+
+    # Temporizadores: os criados acima são descartados e os salvos são registrados
+    # na ordem original, preservando a ordem de disparo dos que vencem juntos
+    game.timers.clear()
+    game.late_timers.clear()
+    schedulers = (game.timers, game.late_timers)
+    targets = {TARGET_GAME: [game], TARGET_ENEMIES: [enemies], TARGET_MYSTERY: mysteries,
+               TARGET_EXPLOSION: explosions}
+    music_timer = None
+    for _ in range(timer_count):
+        number, kind, index, method, start, delay, repeat = TIMER.unpack_from(blob, offset)
+        offset += TIMER.size
+        callback = getattr(targets[kind][index], CALLBACKS[method])
+        phase = 'enemies' if callback.__name__ == 'make_enemies_shoot' else TIMER_PHASES.get(kind)
+        scheduled = schedulers[number].schedule(start, delay, callback, repeat, phase)
+        if kind == TARGET_ENEMIES:
+            enemies.march_timer = scheduled
+        elif callback.__name__ == 'play_main_music':
+            music_timer = scheduled
+    enemies.tempo_timers = [enemies.march_timer]
+    if music_timer is not None:
+        enemies.tempo_timers.append(music_timer)
+        game.music_timer = music_timer
@@ -1,13 +1,95 @@
+from collections import OrderedDict
 from pygame import *
 
+# Fontes já abertas, indexadas por (arquivo, tamanho)
+_FONTS = {}
+
+
+def get_font(text_font, size):
+    """
+    Retorna uma fonte compartilhada, abrindo o arquivo apenas na primeira vez.
+
+    Args:
+        text_font (str): Caminho para o arquivo de fonte ou nome da fonte do sistema
+        size (int): Tamanho da fonte em pixels
+
+    Returns:
+        Font: Objeto de fonte do Pygame
+    """
+    key = (text_font, size)
+    text_object = _FONTS.get(key)
+    if text_object is None:
+        text_object = _FONTS[key] = font.Font(text_font, size)
+    return text_object
+
+
+class RenderCache:
+    """
+    Cache LRU de textos já renderizados.
+    As superfícies retornadas são compartilhadas e não devem ser alteradas.
+
+    Atributos:
+        max_size (int): Número máximo de superfícies mantidas
+        surfaces (OrderedDict): Superfícies indexadas por (fonte, tamanho, texto, cor)
+        hits (int): Quantidade de renderizações evitadas
+        misses (int): Quantidade de renderizações feitas
+    """
+
+    def __init__(self, max_size=128):
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            max_size (int): Número máximo de superfícies mantidas
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text_font, size, message, color):
+        """
+        Retorna a superfície com o texto renderizado, usando o cache quando possível.
+
+        Args:
+            text_font (str): Caminho para o arquivo de fonte
+            size (int): Tamanho da fonte em pixels
+            message (str): Texto a ser renderizado
+            color (tuple): Cor do texto no formato RGB
+
+        Returns:
+            Surface: Superfície compartilhada com o texto
+        """
+        key = (text_font, size, message, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = get_font(text_font, size).render(message, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Descarta o menos usado recentemente
+        return surface
+
+
+RENDER_CACHE = RenderCache()
+
+
 class Text:
     """
     Classe para renderização e exibição de texto na tela usando Pygame.
+    Fontes e textos renderizados são compartilhados através de get_font e RENDER_CACHE.
     
     Atributos:
         font (Font): Objeto de fonte do Pygame
         surface (Surface): Superfície contendo o texto renderizado
         rect (Rect): Retângulo que define a posição e área do texto
+        message (str): Texto exibido
+        color (tuple): Cor do texto no formato RGB
+        dirty (bool): O texto mudou desde o último desenho (o renderizador o redesenha)
     """
 
     def __init__(self, text_font, size, message, color, xpos, ypos):
@@ -22,14 +104,24 @@ class Text:
             xpos (int): Posição horizontal do texto
             ypos (int): Posição vertical do texto
         """
-        # Inicializa a fonte com o arquivo e tamanho especificados
-        self.font = font.Font(text_font, size)
+        # Obtém a fonte compartilhada com o arquivo e tamanho especificados
+        self.text_font = text_font
+        self.size = size
+        self.font = get_font(text_font, size)
         
         # Renderiza o texto na superfície
-        self.surface = self.font.render(message, True, color)
+        self.message = message
+        self.color = color
+        self.surface = RENDER_CACHE.render(text_font, size, message, color)
         
         # Define a posição do texto na tela
         self.rect = self.surface.get_rect(topleft=(xpos, ypos))
+        self.dirty = False
+
+    @property
+    def image(self):
+        """Superfície do texto, permitindo desenhá-lo junto com os sprites."""
+        return self.surface
 
     def draw(self, surface):
         """
@@ -43,13 +135,20 @@ class Text:
     def update_text(self, new_message, new_color=None):
         """
         Atualiza o texto exibido e opcionalmente uma nova cor.
+        Não faz nada se o texto e a cor forem os mesmos já exibidos.
 
         Args:
             new_message (str): Novo texto a ser exibido
             new_color (tuple, optional): Nova cor do texto. Mantém a atual se None.
         """
-        color = new_color if new_color is not None else self.surface.get_at((0, 0))[:3]
-        self.surface = self.font.render(new_message, True, color)
+        color = new_color if new_color is not None else self.color
+        if new_message == self.message and color == self.color:
+            return
+
+        self.message = new_message
+        self.color = color
+        self.surface = RENDER_CACHE.render(self.text_font, self.size, new_message, color)
         # Mantém a posição original do retângulo
         original_pos = self.rect.topleft
-        self.rect = self.surface.get_rect(topleft=original_pos)
\ No newline at end of file
+        self.rect = self.surface.get_rect(topleft=original_pos)
+        self.dirty = True
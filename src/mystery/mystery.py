@@ -1,5 +1,5 @@
-from pygame import sprite, transform, time, mixer
-from helpers import constants
+from pygame import sprite
+from helpers.assets import ATLAS
 
 class Mystery(sprite.Sprite):
     """
@@ -8,13 +8,16 @@ class Mystery(sprite.Sprite):
 
     Atributos:
         image (Surface): Imagem redimensionada da nave misteriosa
+        mask (Mask): Máscara de pixels compartilhada da imagem (colisões precisas)
         rect (Rect): Área e posição da nave na tela
         row (int): Linha fixa onde a nave se move (normalmente no topo)
         move_time (int): Intervalo de tempo entre movimentos (em ms)
         direction (int): Direção do movimento (1 = direita, -1 = esquerda)
         timer (int): Momento do último movimento
+        moving (bool): Indica se a nave está atravessando a tela
         sound (Sound): Efeito sonoro quando a nave aparece
         play_sound (bool): Flag para controlar a reprodução do som
+        visible (bool): Indica se a nave deve ser desenhada neste frame
         game (object): Referência ao objeto principal do jogo
     """
 
@@ -28,22 +31,37 @@ class Mystery(sprite.Sprite):
         super().__init__()  # Inicializa a classe base Sprite
 
         # Configuração visual
-        self.image = transform.scale(constants.IMAGES['mystery'], (75, 35))
+        self.image = ATLAS.get('mystery', (75, 35))
+        self.mask = ATLAS.mask('mystery', (75, 35))
         self.rect = self.image.get_rect(topleft=(-80, 45))  # Posição inicial fora da tela
         self.row = 5  # Linha fixa de movimento (topo)
 
         # Configuração de movimento
-        self.move_time = 25000  # 25 segundos entre aparições
+        self.move_time = game.settings.mystery_move_time  # 25 segundos entre aparições (padrão)
         self.direction = 1  # Começa movendo para a direita
-        self.timer = time.get_ticks()  # Inicia o temporizador
+        self.timer = game.game_clock.get_ticks()  # Inicia o temporizador
+        self.moving = False  # Só se move depois que o agendador libera a passagem
 
         # Configuração de áudio
-        self.sound = mixer.Sound(constants.SOUND_PATH + 'mystery_entered.wav')
-        self.sound.set_volume(0.3)  # Volume reduzido
+        self.sound = game.load_sound('mystery_entered', 0.3)  # Volume reduzido
         self.play_sound = True  # Permite tocar o som na próxima entrada
+        self.visible = False  # Só aparece enquanto estiver se movendo
+
+        # Limite direito da arena (800px no jogo original)
+        self.arena_width = game.settings.arena_width
 
         # Referência do jogo
         self.game = game
+        game.timers.schedule(self.timer, self.move_time, self._start_moving)
+
+    def _start_moving(self, current_time):
+        """
+        Libera a passagem da nave (chamado pelo agendador após o tempo de espera).
+
+        Args:
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
+        self.moving = True
 
     def update(self, keys, current_time, *args):
         """
@@ -54,17 +72,17 @@ class Mystery(sprite.Sprite):
             current_time (int): Tempo atual do jogo em milissegundos
             *args: Argumentos variáveis para compatibilidade
         """
-        elapsed_time = current_time - self.timer
-        reset_timer = False
+        self.visible = False
 
-        # Só começa a mover após o tempo de espera
-        if elapsed_time > self.move_time:
+        # Só se move depois do tempo de espera
+        if self.moving:
             self._handle_movement(current_time)
-            reset_timer = self._check_boundaries(current_time)
 
-        # Reinicia o temporizador se necessário
-        if elapsed_time > self.move_time and reset_timer:
-            self.timer = current_time
+            # Ao sair da tela, volta a esperar pela próxima passagem
+            if self._check_boundaries(current_time):
+                self.timer = current_time
+                self.moving = False
+                self.game.timers.schedule(current_time, self.move_time, self._start_moving)
 
     def _handle_movement(self, current_time):
         """
@@ -74,21 +92,21 @@ class Mystery(sprite.Sprite):
             current_time (int): Tempo atual do jogo em milissegundos
         """
         # Toca o som quando a nave entra na tela
-        if (self.rect.x < 0 or self.rect.x > 800) and self.play_sound:
-            self.sound.play()
+        if (self.rect.x < 0 or self.rect.x > self.arena_width) and self.play_sound:
+            self.game.audio.play(self.sound)
             self.play_sound = False
 
         # Movimento para a direita
-        if self.rect.x < 840 and self.direction == 1:
-            self.sound.fadeout(4000)  # Fadeout do som
+        if self.rect.x < self.arena_width + 40 and self.direction == 1:
+            self.game.audio.fadeout(self.sound, 4000)  # Fadeout do som (uma vez por passagem)
             self.rect.x += 2  # Velocidade de movimento
-            self.game.screen.blit(self.image, self.rect)
+            self.visible = True
 
         # Movimento para a esquerda
         if self.rect.x > -100 and self.direction == -1:
-            self.sound.fadeout(4000)  # Fadeout do som
+            self.game.audio.fadeout(self.sound, 4000)  # Fadeout do som (uma vez por passagem)
             self.rect.x -= 2  # Velocidade de movimento
-            self.game.screen.blit(self.image, self.rect)
+            self.visible = True
 
     def _check_boundaries(self, current_time):
         """
@@ -103,7 +121,7 @@ class Mystery(sprite.Sprite):
         reset_timer = False
         
         # Saiu pelo lado direito
-        if self.rect.x > 830:
+        if self.rect.x > self.arena_width + 30:
             self.play_sound = True
             self.direction = -1  # Inverte para esquerda
             reset_timer = True
@@ -1,4 +1,4 @@
-from pygame import sprite, time
+from pygame import sprite
 from helpers import constants
 from helpers.text import Text
 
@@ -9,50 +9,91 @@ class MysteryExplosion(sprite.Sprite):
 
     Atributos:
         text (Text): Objeto de texto que mostra a pontuação
+        image (Surface): Superfície do texto da pontuação
+        rect (Rect): Área e posição do texto na tela
+        visible (bool): Indica se o texto deve ser desenhado neste frame
         timer (int): Momento em que a explosão foi criada (em milissegundos)
         game (object): Referência ao objeto principal do jogo
     """
 
-    def __init__(self, game, mystery, score, *groups):
+    def __init__(self, game, mystery=None, score=0, *groups):
         """
         Inicializa o efeito de explosão do alienígena.
 
         Args:
             game (object): Referência ao objeto do jogo principal
-            mystery (sprite.Sprite): alienígena que foi destruído
+            mystery (sprite.Sprite): alienígena que foi destruído (None cria o efeito
+                ainda sem uso, para um SpritePool)
             score (int): Pontuação a ser exibida
             *groups: Grupos de sprites aos quais esta explosão será adicionada
         """
-        super().__init__(*groups)  # Inicializa a classe base Sprite
+        super().__init__()  # Inicializa a classe base Sprite
 
-        # Cria o texto que mostra a pontuação obtida
+        # Cria uma única vez o texto que mostra a pontuação obtida
         self.text = Text(
             text_font=constants.FONT, 
             size=20, 
             message=str(score), 
             color=constants.WHITE_COLOR,
-            xpos=mystery.rect.x + 20,  # Centralizado horizontalmente
-            ypos=mystery.rect.y + 6    # Centralizado verticalmente
+            xpos=0,
+            ypos=0
         )
-
-        # Configura o temporizador para controlar a animação
-        self.timer = time.get_ticks()
         self.game = game
 
-    def update(self, current_time, *args):
+        if mystery is not None:
+            self.reset(mystery, score)
+            self.add(*groups)
+
+    def reset(self, mystery, score):
         """
-        Atualiza a animação da explosão com base no tempo atual.
+        Reinicia o efeito para uma nova nave destruída, reaproveitando o texto.
 
         Args:
-            current_time (int): Tempo atual do jogo em milissegundos
-            *args: Argumentos variáveis para compatibilidade
+            mystery (sprite.Sprite): alienígena que foi destruído
+            score (int): Pontuação a ser exibida
         """
-        elapsed_time = current_time - self.timer
-
-        # Animação de piscar (visível nos intervalos 0-200ms e 400-600ms)
-        if elapsed_time <= 200 or 400 < elapsed_time <= 600:
-            self.text.draw(self.game.screen)
-        
-        # Remove o efeito após 600ms
-        elif elapsed_time > 600:
-            self.kill()
\ No newline at end of file
+        self.text.update_text(str(score))
+        self.text.rect.topleft = (mystery.rect.x + 20,  # Centralizado horizontalmente
+                                  mystery.rect.y + 6)   # Centralizado verticalmente
+
+        self.image = self.text.surface
+        self.rect = self.text.rect
+        self.visible = True
+
+        # Registra no agendador a animação de piscar (visível nos intervalos
+        # 0-200ms e 400-600ms) e a remoção após 600ms
+        self.timer = self.game.game_clock.get_ticks()
+        self.game.timers.schedule(self.timer, 200, self._hide, phase='explosions')
+        self.game.timers.schedule(self.timer, 400, self._show, phase='explosions')
+        self.game.timers.schedule(self.timer, 600, self._expire, phase='explosions')
+
+    def restore(self, score, x, y, visible, timer):
+        """
+        Restaura o estado salvo em um snapshot, sem registrar temporizadores
+        (o snapshot registra os que estavam pendentes).
+
+        Args:
+            score (int): Pontuação exibida
+            x (int): Posição horizontal do texto
+            y (int): Posição vertical do texto
+            visible (bool): Se o texto está visível neste momento do piscar
+            timer (int): Momento em que a explosão foi criada (em milissegundos)
+        """
+        self.text.update_text(str(score))
+        self.text.rect.topleft = (x, y)
+        self.image = self.text.surface
+        self.rect = self.text.rect
+        self.visible = visible
+        self.timer = timer
+
+    def _hide(self, current_time):
+        """Esconde o texto (primeira etapa do piscar)."""
+        self.visible = False
+
+    def _show(self, current_time):
+        """Mostra o texto novamente (segunda etapa do piscar)."""
+        self.visible = True
+
+    def _expire(self, current_time):
+        """Remove o efeito, devolvendo-o ao SpritePool."""
+        self.kill()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pygame import *
-from helpers import constants
+from helpers.assets import ATLAS
 
 class Ship(sprite.Sprite):
     """
@@ -18,12 +18,18 @@ class Ship(sprite.Sprite):
         sprite.Sprite.__init__(self)
         
         # Carrega a imagem da nave a partir das constantes do jogo
-        self.image = constants.IMAGES['ship']
+        self.image = ATLAS.get('ship')
+        # Máscara de pixels compartilhada, usada na detecção de colisões precisa
+        self.mask = ATLAS.mask('ship')
         
         # Define o retângulo de colisão e posição inicial
-        # Posição inicial: x=385 (centralizado horizontalmente considerando uma tela de ~800px)
-        # y=550 (próximo à parte inferior da tela)
-        self.rect = self.image.get_rect(topleft=(385, 550))
+        # Posição inicial: x=385 (centralizado horizontalmente em uma arena de 800px)
+        # y=550 (próximo à parte inferior de uma arena de 600px)
+        arena_width = game.settings.arena_width
+        self.rect = self.image.get_rect(topleft=(arena_width // 2 - 15,
+                                                 game.settings.arena_height - 50))
+        # Limite direito de movimento (740px na arena original)
+        self.right_limit = arena_width - 60
         
         # Configura a velocidade de movimento da nave
         self.speed = speed
@@ -35,6 +41,7 @@ class Ship(sprite.Sprite):
         """
         Atualiza o estado da nave a cada frame do jogo.
         Responsável por processar entrada do jogador e movimentação.
+        O desenho é feito depois, pela etapa de renderização do jogo.
         
         Parâmetros:
             keys (list): Lista de estados das teclas pressionadas
@@ -46,10 +53,6 @@ class Ship(sprite.Sprite):
             self.rect.x -= self.speed  # Move a nave para esquerda
         
         # Movimentação para a direita
-        # Verifica se tecla direita está pressionada E se a nave não passou do limite direito (740px)
-        if keys[K_RIGHT] and self.rect.x < 740:
-            self.rect.x += self.speed  # Move a nave para direita
-        
-        # Desenha a nave na tela do jogo
-        # Utiliza a superfície de tela armazenada no objeto game principal
-        self.game.screen.blit(self.image, self.rect)
\ No newline at end of file
+        # Verifica se tecla direita está pressionada E se a nave não passou do limite direito
+        if keys[K_RIGHT] and self.rect.x < self.right_limit:
+            self.rect.x += self.speed  # Move a nave para direita
\ No newline at end of file
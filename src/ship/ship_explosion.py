@@ -1,53 +1,79 @@
 from pygame import *
-from helpers import constants
+from helpers.assets import ATLAS
 
 class ShipExplosion(sprite.Sprite):
     """
     Classe que representa a animação de explosão da nave do jogador.
     Herda de pygame.sprite.Sprite para funcionalidades básicas de sprites.
     
-    Controla a exibição temporizada da explosão e sua remoção automática.
+    Controla a exibição temporizada da explosão e sua remoção automática,
+    disparadas pelo agendador do jogo.
     """
     
-    def __init__(self, game, ship, *groups):
+    def __init__(self, game, ship=None, *groups):
         """
         Inicializa a explosão da nave.
         
         Parâmetros:
             game (object): Referência ao objeto principal do jogo
-            ship (Ship): Objeto da nave que está explodindo
+            ship (Ship): Objeto da nave que está explodindo (None cria a explosão
+                ainda sem uso, para um SpritePool)
             *groups: Grupos de sprites aos quais esta explosão deve pertencer
         """
-        super(ShipExplosion, self).__init__(*groups)
+        super(ShipExplosion, self).__init__()
         
         # Usa a mesma imagem da nave para a explosão
-        self.image = constants.IMAGES['ship']
+        self.image = ATLAS.get('ship')
+
+        # Referência ao jogo principal
+        self.game = game
+
+        if ship is not None:
+            self.reset(ship)
+            self.add(*groups)
+
+    def reset(self, ship):
+        """
+        Reinicia a explosão para uma nova nave, permitindo reutilizar o objeto.
         
+        Parâmetros:
+            ship (Ship): Objeto da nave que está explodindo
+        """
         # Posiciona a explosão no mesmo local da nave
         self.rect = self.image.get_rect(topleft=(ship.rect.x, ship.rect.y))
         
         # Marca o tempo inicial para controle da animação
-        self.timer = time.get_ticks()
+        self.timer = self.game.game_clock.get_ticks()
         
-        # Referência ao jogo principal para acesso à tela
-        self.game = game
+        # Só é desenhada entre 300ms e 600ms e é removida após 900ms
+        self.visible = False
+        self.game.timers.schedule(self.timer, 300, self._show, phase='explosions')
+        self.game.timers.schedule(self.timer, 600, self._hide, phase='explosions')
+        self.game.timers.schedule(self.timer, 900, self._expire, phase='explosions')
 
-    def update(self, current_time, *args):
+    def restore(self, x, y, visible, timer):
         """
-        Atualiza o estado da explosão a cada frame.
-        Controla a exibição temporizada e remove a explosão quando completa.
+        Restaura o estado salvo em um snapshot, sem registrar temporizadores
+        (o snapshot registra os que estavam pendentes).
         
         Parâmetros:
-            current_time (int): Tempo atual do jogo em milissegundos
-            *args: Argumentos adicionais (não utilizados)
+            x (int): Posição horizontal da explosão
+            y (int): Posição vertical da explosão
+            visible (bool): Se a explosão está sendo exibida
+            timer (int): Momento em que a explosão foi criada (em milissegundos)
         """
-        # Calcula quanto tempo passou desde o início da explosão
-        elapsed_time = current_time - self.timer
-        
-        # Fase 1: Exibe a explosão entre 300ms e 600ms (0.3s a 0.6s)
-        if 300 < elapsed_time <= 600:
-            self.game.screen.blit(self.image, self.rect)
-        
-        # Fase 2: Remove a explosão após 900ms (0.9s)
-        elif elapsed_time > 900:
-            self.kill()  # Remove o sprite de todos os grupos
\ No newline at end of file
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.visible = visible
+        self.timer = timer
+
+    def _show(self, current_time):
+        """Fase 1: exibe a explosão a partir de 300ms."""
+        self.visible = True
+
+    def _hide(self, current_time):
+        """Esconde a explosão a partir de 600ms."""
+        self.visible = False
+
+    def _expire(self, current_time):
+        """Fase 2: remove a explosão após 900ms (0.9s), devolvendo-a ao SpritePool."""
+        self.kill()  # Remove o sprite de todos os grupos
\ No newline at end of file
@@ -2,7 +2,8 @@ from pygame import *
 from helpers import constants
 from helpers.text import Text
 from helpers.life import Life
-from helpers.blocker import Blocker
+from helpers.barrier import Barrier
+from helpers.collision import CollisionGrid
 from helpers.bullet import Bullet
 from alien.alien import Alien
 from alien.alien_explosion import AlienExplosion
@@ -11,9 +12,40 @@ from mystery.mystery import Mystery
 from mystery.mystery_explosion import MysteryExplosion
 from ship.ship import Ship
 from ship.ship_explosion import ShipExplosion
-from random import choice
+from helpers.assets import ATLAS, DEFAULT_VARIANTS
+from helpers.audio import AUDIO_BUFFER, DEFAULT_SOUNDS, SOUND_BANK, VoiceMixer, load_sound
+from helpers.capture import FrameRecorder
+from helpers.clock import VirtualClock
+from helpers.inputs import InputSampler, InputState
+from helpers.pool import SpritePool
+from helpers.profiler import COUNTED_GROUPS, FrameProfiler, PerfOverlay
+from helpers.renderer import Renderer
+from helpers.replay import Replay
+from helpers.scheduler import Scheduler
+from helpers.settings import Settings
+from helpers.snapshot import restore_snapshot, take_snapshot
+from random import Random, randrange
+from time import perf_counter
+import argparse
 import sys
 
+# Pares de camadas testados a cada frame pela detecção de colisões
+COLLISION_PAIRS = [('bullets', 'enemy_bullets'),
+                   ('enemies', 'bullets'),
+                   ('mystery', 'bullets'),
+                   ('player', 'enemy_bullets'),
+                   ('enemies', 'player'),
+                   ('bullets', 'blockers'),
+                   ('enemy_bullets', 'blockers'),
+                   ('enemies', 'blockers')]
+# Pares resolvidos também pelas máscaras de pixels (as barreiras testam as próprias células)
+PRECISE_PAIRS = frozenset(pair for pair in COLLISION_PAIRS if 'blockers' not in pair)
+
+# Máximo de passos lógicos executados em um único frame para recuperar atrasos;
+# o tempo excedente é descartado (o jogo desacelera em vez de travar)
+MAX_CATCH_UP_STEPS = 5
+
+
 class SpaceInvaders(object):
     """
     Classe principal do jogo Space Invaders.
@@ -24,7 +56,8 @@ class SpaceInvaders(object):
     - Sistema de pontuação e vidas
     """
     
-    def __init__(self, frequency, size, channels, buffer):
+    def __init__(self, frequency, size, channels, buffer, headless=None, seed=None,
+                 dirty_rects=False, render=True, settings=None, voices=8):
         """
         Inicializa o jogo com configurações de áudio e prepara os recursos iniciais.
         
@@ -33,20 +66,86 @@ class SpaceInvaders(object):
             size (int): Tamanho do buffer de áudio
             channels (int): Número de canais de áudio
             buffer (int): Tamanho do buffer de áudio
+            headless (bool): Executa sem janela e sem áudio, com relógio virtual.
+                Se None, usa constants.HEADLESS.
+            seed (int): Semente do gerador aleatório (None para semente aleatória)
+            dirty_rects (bool): Apresenta apenas as regiões alteradas de cada frame
+            render (bool): Se False, a etapa de renderização é ignorada por completo
+            settings (Settings): Parâmetros de dificuldade (None usa os valores originais)
+            voices (int): Vozes simultâneas para efeitos sonoros (a música tem canal reservado)
         """
-        # Configuração inicial do mixer de áudio
-        mixer.pre_init(frequency, size, channels, buffer)
-        init()
+        self.settings = settings if settings is not None else Settings()
+        self.headless = constants.HEADLESS if headless is None else headless
+
+        # Lê as imagens em segundo plano enquanto o áudio e a janela são inicializados
+        constants.IMAGES.preload()
+
+        if self.headless:
+            # Sem mixer: apenas o necessário para superfícies e fontes
+            display.init()
+            font.init()
+        else:
+            # Configuração inicial do mixer de áudio
+            mixer.pre_init(frequency, size, channels, buffer)
+            init()
+        # Vozes do mixer: canal reservado para a marcha e efeitos com limite de vozes
+        self.audio = VoiceMixer(buffer, voices, enabled=not self.headless)
         
-        # Configurações básicas do jogo
-        self.clock = time.Clock()
-        self.screen = constants.SCREEN
+        # Configurações básicas do jogo: entradas lidas logo antes da lógica
+        # (a espera entre frames também recolhe os eventos, marcando sua chegada)
+        self.input_sampler = InputSampler()
+        # A arena pode ser maior que a janela original nos testes de estresse
+        arena = (self.settings.arena_width, self.settings.arena_height)
+        surface = constants.SCREEN if arena == constants.SCREEN_SIZE else display.set_mode(arena)
+        self.screen = Renderer(surface, dirty_rects, enabled=render)
+        # Barreiras mantêm a mesma distância da base da arena
+        self.blockers_position = self.settings.arena_height - (constants.SCREEN_SIZE[1] -
+                                                               constants.BLOCKERS_POSITION)
+        self.invasion_line = self.settings.arena_height - (constants.SCREEN_SIZE[1] -
+                                                           constants.INVASION_LINE)
+
+        # Fonte de tempo e aleatoriedade compartilhada por todas as entidades.
+        # O tempo do jogo só avança a cada chamada de step(), em passos fixos de 1/60 s.
+        self.game_clock = VirtualClock()
+        self.seed = seed if seed is not None else randrange(2 ** 32)
+        self.random = Random(self.seed)
+
+        # Detecção de colisões compartilhada por todos os frames
+        self.collisions = CollisionGrid()
+
+        # Agendadores de temporizadores: timers dispara no início de cada passo
+        # (marcha, música, nave misteriosa e explosões); late_timers dispara depois
+        # das colisões, pois depende delas (disparo inimigo e nova nave)
+        self.timers = Scheduler()
+        self.late_timers = Scheduler()
+
+        # Medição do tempo de cada fase do frame e painel de desempenho (F3)
+        self.profiler = FrameProfiler()
+
+        # Posições dos sprites móveis antes do último passo lógico (interpolação)
+        self.previous_positions = {}
+
+        # Explosões reutilizadas entre rodadas em vez de recriadas a cada abate
+        self.alien_explosions = SpritePool(lambda: AlienExplosion(self))
+        self.mystery_explosions = SpritePool(lambda: MysteryExplosion(self))
+        self.ship_explosions = SpritePool(lambda: ShipExplosion(self))
         
         # Carrega imagens de fundo
         self.welcome_screen = image.load(constants.IMAGE_PATH + 'welcome.png').convert()
         self.background = image.load(constants.IMAGE_PATH + 'background.jpg').convert()
+        if arena != constants.SCREEN_SIZE:
+            self.welcome_screen = transform.scale(self.welcome_screen, arena)
+            self.background = transform.scale(self.background, arena)
+
+        # Gera antecipadamente as imagens redimensionadas compartilhadas
+        ATLAS.warm(DEFAULT_VARIANTS)
+
+        # Decodifica os sons uma única vez; as rodadas seguintes apenas os reutilizam
+        if self.audio.enabled:
+            SOUND_BANK.warm(DEFAULT_SOUNDS)
         
         # Estados do jogo
+        self.current_time = 0
         self.start_game = False
         self.main_screen = True
         self.game_over = False
@@ -56,26 +155,40 @@ class SpaceInvaders(object):
         
         # Elementos de texto da interface
         self._setup_text_elements()
+        self.perf_overlay = PerfOverlay(self.profiler, audio=self.audio, inputs=self.input_sampler)
         
         # Sistema de vidas
         self._setup_lives_system()
         
     def _setup_text_elements(self):
         """Configura todos os elementos de texto usados no jogo."""
-        self.welcome_text = Text(constants.FONT, 50, 'Bem-vindo(a)', constants.WHITE_COLOR, 190, 300)
+        # As mensagens mantêm a posição em relação ao centro da arena e o HUD
+        # acompanha as bordas (posições originais para a arena de 800x600)
+        width, height = self.settings.arena_width, self.settings.arena_height
+        center_x = (width - constants.SCREEN_SIZE[0]) // 2
+        center_y = (height - constants.SCREEN_SIZE[1]) // 2
+        self.welcome_text = Text(constants.FONT, 50, 'Bem-vindo(a)', constants.WHITE_COLOR,
+                                 190 + center_x, 300 + center_y)
         self.title_text2 = Text(constants.FONT, 25, 'Pressione qualquer tecla para continuar', 
-                             constants.WHITE_COLOR, 80, 400)
-        self.game_over_text = Text(constants.FONT, 50, 'Fim do Jogo!', constants.WHITE_COLOR, 250, 270)
-        self.next_round_text= Text(constants.FONT, 50, 'Proxima rodada', constants.WHITE_COLOR, 240, 270)
+                             constants.WHITE_COLOR, 80 + center_x, 400 + center_y)
+        self.game_over_text = Text(constants.FONT, 50, 'Fim do Jogo!', constants.WHITE_COLOR,
+                                   250 + center_x, 270 + center_y)
+        self.next_round_text= Text(constants.FONT, 50, 'Proxima rodada', constants.WHITE_COLOR,
+                                   240 + center_x, 270 + center_y)
         self.score_text = Text(constants.FONT, 20, 'Score', constants.WHITE_COLOR, 5, 5)
-        self.lives_text = Text(constants.FONT, 20, 'Vidas ', constants.WHITE_COLOR, 610, 5)
+        self.lives_text = Text(constants.FONT, 20, 'Vidas ', constants.WHITE_COLOR, width - 190, 5)
+        # Pontuação: só é renderizada novamente quando o valor muda
+        self.score_text2 = Text(constants.FONT, 20, '0', constants.GREEN_COLOR, 85, 5)
+        self.hud_texts = [self.score_text, self.score_text2, self.lives_text]
     
     def _setup_lives_system(self):
         """Configura o sistema de vidas do jogador."""
-        self.life1 = Life(690, 3, self)
-        self.life2 = Life(710, 3, self)
-        self.life3 = Life(730, 3, self)
-        self.life4 = Life(750, 3, self)
+        # Ícones alinhados à borda direita da arena (x = 690 a 750 na arena original)
+        right = self.settings.arena_width - 110
+        self.life1 = Life(right, 3, self)
+        self.life2 = Life(right + 20, 3, self)
+        self.life3 = Life(right + 40, 3, self)
+        self.life4 = Life(right + 60, 3, self)
         self.lives_group = sprite.Group(self.life1, self.life2, self.life3, self.life4)
 
     def reset(self, score):
@@ -85,12 +198,19 @@ class SpaceInvaders(object):
         Parâmetros:
             score (int): Pontuação atual a ser mantida
         """
+        # Temporizadores da rodada anterior deixam de valer
+        self.timers.clear()
+        self.late_timers.clear()
+
         # Configuração do jogador
         self.player = Ship(self)
         self.player_group = sprite.Group(self.player)
         
-        # Grupos de sprites
+        # Grupos de sprites (explosões da rodada anterior voltam para os conjuntos)
+        if hasattr(self, 'explosions_group'):
+            self.explosions_group.empty()
         self.explosions_group = sprite.Group()
+        self._warm_effect_pools()
         self.bullets = sprite.Group()
         self.enemy_bullets = sprite.Group()
         
@@ -104,68 +224,91 @@ class SpaceInvaders(object):
                                       self.lives_group, self.mystery_ship)
         
         # Controles e temporizadores
-        self.keys = key.get_pressed()
-        self.timer = time.get_ticks()
-        self.note_timer = time.get_ticks()
-        self.ship_timer = time.get_ticks()
+        self.keys = InputState()
+        self.timer = self.game_clock.get_ticks()
         
         # Estado do jogo
         self.score = score
+        self.round += 1
         self.create_audio()
         self.make_new_ship = False
         self.ship_alive = True
 
-    def make_blockers(self, number):
+        # A música acompanha o ritmo da marcha; o disparo inimigo tem intervalo próprio
+        self.music_timer = self.timers.schedule(self.timer, self.enemies.move_time,
+                                                self.play_main_music, repeat=True)
+        self.enemies.tempo_timers.append(self.music_timer)
+        self.late_timers.schedule(self.timer, self.settings.enemy_fire_interval,
+                                  self.make_enemies_shoot, phase='enemies')
+
+    def _warm_effect_pools(self):
+        """
+        Prepara explosões suficientes para uma rodada intensa, evitando criar
+        objetos (e superfícies de texto) durante o jogo.
+        """
+        self.alien_explosions.warm(16)
+        self.mystery_explosions.warm(2)
+        self.ship_explosions.warm(2)
+
+    def make_blockers(self, number, cell_size=constants.BLOCKER_CELL_SIZE):
         """
-        Cria barreiras de proteção para o jogador.
+        Cria uma barreira de proteção para o jogador.
         
         Parâmetros:
             number (int): Índice da barreira (0-3)
+            cell_size (int): Tamanho de cada célula destrutível em pixels
             
         Retorna:
-            sprite.Group: Grupo contendo os blocos da barreira
+            Barrier: Barreira com todas as células intactas
+        """
+        width, height = constants.BLOCKER_SIZE
+        spacing = self.settings.arena_width // self.settings.barrier_count
+        return Barrier(50 + (spacing * number), self.blockers_position,
+                       height // cell_size, width // cell_size, cell_size,
+                       constants.GREEN_COLOR, self)
+
+    def load_sound(self, name, volume):
+        """
+        Carrega um efeito sonoro respeitando o modo headless (e a falta de dispositivo de áudio).
+
+        Parâmetros:
+            name (str): Nome do arquivo de som sem extensão
+            volume (float): Volume entre 0.0 e 1.0
+
+        Retorna:
+            Sound: Som carregado (ou mudo quando o áudio está desabilitado)
         """
-        blocker_group = sprite.Group()
-        for row in range(4):
-            for column in range(9):
-                blocker = Blocker(10, constants.GREEN_COLOR, row, column, self)
-                blocker.rect.x = 50 + (200 * number) + (column * blocker.width)
-                blocker.rect.y = constants.BLOCKERS_POSITION + (row * blocker.height)
-                blocker_group.add(blocker)
-        return blocker_group
+        return load_sound(name, volume, enabled=self.audio.enabled)
 
     def create_audio(self):
-        """Configura todos os efeitos sonoros e músicas do jogo."""
+        """
+        Configura todos os efeitos sonoros e músicas do jogo.
+        Os sons vêm do registro compartilhado, então chamar a cada rodada não acessa o disco.
+        """
         self.sounds = {}
         for sound_name in ['shoot', 'shoot2', 'invader_killed', 'mystery_killed',
                          'ship_explosion']:
-            self.sounds[sound_name] = mixer.Sound(
-                constants.SOUND_PATH + '{}.wav'.format(sound_name))
-            self.sounds[sound_name].set_volume(0.2)
+            self.sounds[sound_name] = self.load_sound(sound_name, 0.2)
 
-        self.music_notes = [mixer.Sound(constants.SOUND_PATH + '{}.wav'.format(i)) for i
-                         in range(4)]
-        for sound in self.music_notes:
-            sound.set_volume(0.5)
+        self.music_notes = [self.load_sound(str(i), 0.5) for i in range(4)]
 
         self.note_index = 0
 
     def play_main_music(self, current_time):
         """
         Toca as notas musicais características do jogo de forma sequencial.
+        Chamado pelo agendador no mesmo ritmo da marcha da formação.
         
         Parâmetros:
             current_time (int): Tempo atual do jogo em milissegundos
         """
-        if current_time - self.note_timer > self.enemies.move_time:
-            self.note = self.music_notes[self.note_index]
-            if self.note_index < 3:
-                self.note_index += 1
-            else:
-                self.note_index = 0
+        self.note = self.music_notes[self.note_index]
+        if self.note_index < 3:
+            self.note_index += 1
+        else:
+            self.note_index = 0
 
-            self.note.play()
-            self.note_timer += self.enemies.move_time
+        self.audio.play_note(self.note)
 
     @staticmethod
     def should_exit(evt):
@@ -180,61 +323,101 @@ class SpaceInvaders(object):
         """
         return evt.type == QUIT or (evt.type == KEYUP and evt.key == K_ESCAPE)
 
-    def check_input(self):
-        """Verifica e processa todas as entradas do jogador."""
-        self.keys = key.get_pressed()
-        for e in event.get():
+    def read_input(self):
+        """
+        Lê a fila de eventos do Pygame e o estado do teclado (nesta ordem, para
+        que o estado das setas já inclua os eventos mais recentes).
+        
+        Retorna:
+            InputState: Estado das entradas para o próximo passo lógico
+        """
+        events, keys = self.input_sampler.poll()
+        inputs = InputState(left=keys[K_LEFT], right=keys[K_RIGHT])
+        for _, e in events:
             if self.should_exit(e):
                 sys.exit()
-            if e.type == KEYDOWN:
-                if e.key == K_SPACE:
-                    self._handle_shooting()
+            if e.type == KEYDOWN and e.key == K_SPACE:
+                inputs.shoot = True
+            if e.type == KEYDOWN and e.key == K_F3:
+                self.perf_overlay.toggle()
+            if e.type == KEYUP:
+                inputs.start = True
+        return inputs
+
+    def check_input(self, inputs):
+        """
+        Processa as entradas do jogador durante a partida.
+        
+        Parâmetros:
+            inputs (InputState): Estado das entradas neste passo
+        """
+        self.keys = inputs
+        if inputs.shoot:
+            self._handle_shooting()
 
     def _handle_shooting(self):
         """Controla a lógica de disparo do jogador."""
         if len(self.bullets) == 0 and self.ship_alive:
+            speed = self.settings.player_bullet_speed
             if self.score < 1000:
                 # Tiro único para pontuação baixa
                 bullet = Bullet(self.player.rect.x + 23,
                               self.player.rect.y + 5, -1,
-                              15, 'laser', 'center', self)
+                              speed, 'laser', 'center', self)
                 self.bullets.add(bullet)
                 self.all_sprites.add(self.bullets)
-                self.sounds['shoot'].play()
+                self.audio.play(self.sounds['shoot'])
             else:
                 # Tiros duplos como recompensa por alta pontuação
                 left_bullet = Bullet(self.player.rect.x + 8,
                                   self.player.rect.y + 5, -1,
-                                  15, 'laser', 'left', self)
+                                  speed, 'laser', 'left', self)
                 right_bullet = Bullet(self.player.rect.x + 38,
                                    self.player.rect.y + 5, -1,
-                                   15, 'laser', 'right', self)
+                                   speed, 'laser', 'right', self)
                 self.bullets.add(left_bullet)
                 self.bullets.add(right_bullet)
                 self.all_sprites.add(self.bullets)
-                self.sounds['shoot2'].play()
+                self.audio.play(self.sounds['shoot2'])
 
     def make_enemies(self):
-        """Cria o grupo de inimigos na formação inicial."""
-        enemies = AliensGroup(10, 3, self)
-        for row in range(3):
-            for column in range(10):
-                enemy = Alien(row, column, self)
-                enemy.rect.x = 157 + (column * 50)
-                enemy.rect.y = self.enemy_position + (row * 45)
-                enemies.add(enemy)
+        """
+        Cria o grupo de inimigos na formação inicial, centralizada na arena.
+        O tamanho da formação vem de settings (10x3 no jogo original).
+        """
+        columns = self.settings.formation_columns
+        rows = self.settings.formation_rows
+        width = (columns - 1) * constants.ALIEN_SPACING[0] + constants.ALIEN_SIZE[0]
+        left = (self.settings.arena_width - width) // 2 + 2
+        enemies = AliensGroup(columns, rows, self)
+        enemies.place(left, self.enemy_position)
+        for row in range(rows):
+            for column in range(columns):
+                enemies.add(Alien(row, column, enemies))
 
         self.enemies = enemies
 
-    def make_enemies_shoot(self):
-        """Faz com que os inimigos atirem aleatoriamente."""
-        if (time.get_ticks() - self.timer) > 700 and self.enemies:
-            enemy = self.enemies.random_bottom_alien()
-            self.enemy_bullets.add(
-                Bullet(enemy.rect.x + 14, enemy.rect.y + 20, 1, 5,
-                     'enemylaser', 'center', self))
-            self.all_sprites.add(self.enemy_bullets)
-            self.timer = time.get_ticks()
+    def make_enemies_shoot(self, current_time):
+        """
+        Faz com que os inimigos atirem aleatoriamente.
+        Chamado pelo agendador depois das colisões; cada disparo agenda o próximo.
+        Sem inimigos a rodada está terminando, e reset() agenda um novo disparo.
+        
+        Parâmetros:
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
+        if not self.enemies:
+            return
+
+        enemy = self.enemies.random_bottom_alien()
+        self.enemy_bullets.add(
+            Bullet(enemy.rect.x + 14, enemy.rect.y + 20, 1,
+                 self.settings.enemy_bullet_speed,
+                 'enemylaser', 'center', self))
+        self.all_sprites.add(self.enemy_bullets)
+        self.timer = current_time
+        self.late_timers.schedule(current_time, self.settings.enemy_fire_interval,
+                                  self.make_enemies_shoot, phase='enemies')
 
     def calculate_score(self, row):
         """
@@ -249,50 +432,89 @@ class SpaceInvaders(object):
         scores = {0: 30,
                  1: 20,
                  2: 20,
-                 5: choice([50, 100, 150, 300])  # Nave especial tem pontuação variável
+                 5: self.random.choice([50, 100, 150, 300])  # Nave especial tem pontuação variável
                 }
 
-        score = scores[row]
+        score = scores.get(row, scores[2])  # Linhas extras valem como a última
         self.score += score
         return score
 
-    def check_collisions(self):
-        """Verifica e processa todas as colisões entre os elementos do jogo."""
+    def check_collisions(self, current_time):
+        """
+        Verifica e processa todas as colisões entre os elementos do jogo.
+        
+        Parâmetros:
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
+        # Calcula todos os contatos do frame de uma só vez (a formação responde às
+        # consultas por aritmética de grade, e os retângulos que se tocam são
+        # confirmados pelas máscaras de pixels)
+        self.collisions.build({'bullets': self.bullets,
+                               'enemy_bullets': self.enemy_bullets,
+                               'mystery': self.mystery_group,
+                               'player': self.player_group,
+                               'blockers': self.all_blockers}, COLLISION_PAIRS,
+                              indexes={'enemies': self.enemies}, precise=PRECISE_PAIRS)
+
         # Colisão entre tiros do jogador e inimigos
-        sprite.groupcollide(self.bullets, self.enemy_bullets, True, True)
+        self.collisions.collide('bullets', 'enemy_bullets', True, True)
 
         # Jogador acertou inimigo comum
-        for enemy in sprite.groupcollide(self.enemies, self.bullets, True, True).keys():
-            self.sounds['invader_killed'].play()
+        for enemy in self.collisions.collide('enemies', 'bullets', True, True).keys():
+            self.audio.play(self.sounds['invader_killed'])
             self.calculate_score(enemy.row)
-            AlienExplosion(self, enemy, self.explosions_group)
-            self.game_timer = time.get_ticks()
+            self.alien_explosions.acquire(self.explosions_group, enemy)
+            self.game_timer = current_time
 
         # Jogador acertou nave especial
-        for mystery in sprite.groupcollide(self.mystery_group, self.bullets, True, True).keys():
-            mystery.sound.stop()
-            self.sounds['mystery_killed'].play()
+        for mystery in self.collisions.collide('mystery', 'bullets', True, True).keys():
+            self.audio.stop(mystery.sound)
+            self.audio.play(self.sounds['mystery_killed'])
             score = self.calculate_score(mystery.row)
-            MysteryExplosion(self, mystery, score, self.explosions_group)
+            self.mystery_explosions.acquire(self.explosions_group, mystery, score)
             newShip = Mystery(self)          
             self.all_sprites.add(newShip)
             self.mystery_group.add(newShip)
 
         # Jogador foi atingido
-        self._handle_player_hit()
+        self._handle_player_hit(current_time)
 
         # Verifica se inimigos chegaram muito perto da base
         self._check_enemy_invasion()
 
         # Colisões com as barreiras de proteção
-        sprite.groupcollide(self.bullets, self.all_blockers, True, True)
-        sprite.groupcollide(self.enemy_bullets, self.all_blockers, True, True)
-        if self.enemies.bottom >= constants.BLOCKERS_POSITION:
-            sprite.groupcollide(self.enemies, self.all_blockers, False, True)
-
-    def _handle_player_hit(self):
-        """Processa quando o jogador é atingido por um tiro inimigo."""
-        for player in sprite.groupcollide(self.player_group, self.enemy_bullets, True, True).keys():
+        self._erode_blockers('bullets', True)
+        self._erode_blockers('enemy_bullets', True)
+        if self.enemies.bottom >= self.blockers_position:
+            self._erode_blockers('enemies', False)
+
+    def _erode_blockers(self, layer, kill):
+        """
+        Destrói as células das barreiras atingidas pelos sprites de uma camada.
+        
+        Parâmetros:
+            layer (str): Camada de colisão dos sprites que podem atingir as barreiras
+            kill (bool): Remove o sprite que atingiu alguma célula intacta
+        """
+        hits = {}
+        for item, blocker in self.collisions.contacts[(layer, 'blockers')]:
+            if item.alive():
+                hits[item] = blocker.erode(item.rect) or hits.get(item, False)
+
+        if kill:
+            for item, hit in hits.items():
+                if hit:
+                    item.kill()
+
+    def _handle_player_hit(self, current_time):
+        """
+        Processa quando o jogador é atingido por um tiro inimigo.
+        
+        Parâmetros:
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
+        for player in self.collisions.collide('player', 'enemy_bullets', True, True).keys():
+            self.lives_lost += 1
             # Remove uma vida na sequência (da direita para esquerda)
             if self.life4.alive():
                 self.life4.kill()
@@ -306,101 +528,289 @@ class SpaceInvaders(object):
                 self.game_over = True
                 self.start_game = False
                 
-            self.sounds['ship_explosion'].play()
-            ShipExplosion(self, player, self.explosions_group)
+            self.audio.play(self.sounds['ship_explosion'])
+            self.ship_explosions.acquire(self.explosions_group, player)
             self.make_new_ship = True
-            self.shipTimer = time.get_ticks()
+            self.late_timers.schedule(current_time, 900, self.create_new_ship)
             self.ship_alive = False
 
     def _check_enemy_invasion(self):
         """Verifica se os inimigos invadiram a área do jogador."""
-        if self.enemies.bottom >= 540:
-            sprite.groupcollide(self.enemies, self.player_group, True, True)
-            if not self.player.alive() or self.enemies.bottom >= 600:
+        if self.enemies.bottom >= self.invasion_line:
+            self.collisions.collide('enemies', 'player', True, True)
+            if not self.player.alive() or self.enemies.bottom >= self.settings.arena_height:
                 self.game_over = True
                 self.start_game = False
 
-    def create_new_ship(self, createShip, current_time):
+    def create_new_ship(self, current_time):
         """
-        Cria uma nova nave para o jogador após ser destruída.
+        Cria uma nova nave para o jogador, 900 ms após ser destruída (chamado pelo agendador).
         
         Parâmetros:
-            createShip (bool): Flag indicando se deve criar nova nave
             current_time (int): Tempo atual do jogo em milissegundos
         """
-        if createShip and (current_time - self.shipTimer > 900):
-            self.player = Ship(self)
-            self.all_sprites.add(self.player)
-            self.player_group.add(self.player)
-            self.make_new_ship = False
-            self.ship_alive = True
+        self.player = Ship(self)
+        self.all_sprites.add(self.player)
+        self.player_group.add(self.player)
+        self.make_new_ship = False
+        self.ship_alive = True
 
     def create_game_over(self, current_time):
         """
-        Mostra a tela de game over com efeito de piscar.
+        Volta ao menu principal depois da tela de game over.
         
         Parâmetros:
             current_time (int): Tempo atual do jogo em milissegundos
         """
+        if current_time - self.timer > 3000:
+            self.main_screen = True
+
+    def run(self, record_path=None, profile_path=None, max_fps=60, capture_path=None):
+        """
+        Loop principal do jogo.
+        A lógica avança em passos fixos (1/60 s): o tempo real decorrido é acumulado
+        e consumido em quantos passos couberem, até MAX_CATCH_UP_STEPS por frame.
+        O desenho acontece uma vez por frame, com os sprites móveis interpolados
+        entre os dois últimos passos, de modo que a velocidade do jogo não depende
+        da taxa de frames.
+        
+        Parâmetros:
+            record_path (str): Se informado, grava as entradas da sessão neste arquivo
+                ao sair do jogo
+            profile_path (str): Se informado, exporta as medições de cada frame
+                (CSV ou JSON, pela extensão) ao sair do jogo
+            max_fps (int): Limite de frames desenhados por segundo (0 para não limitar)
+            capture_path (str): Se informado, grava cada frame apresentado nesta pasta
+                (anel em memória mapeada esvaziado para blocos compactados)
+        """
+        replay = Replay(self.seed) if record_path else None
+        recorder = FrameRecorder(capture_path, self.screen.surface) if capture_path else None
+        profiler = self.profiler
+        step_time = 1 / self.game_clock.fps
+        accumulator = 0.0
+        previous = perf_counter()
+        pending = None
+        try:
+            while True:
+                frame_start = perf_counter()
+                profiler.begin_frame()
+                self.audio.begin_frame()
+                inputs = self.read_input()
+                if pending is not None:
+                    # Eventos de frames em que nenhum passo lógico foi executado
+                    inputs.shoot = inputs.shoot or pending.shoot
+                    inputs.start = inputs.start or pending.start
+                profiler.mark('input')
+
+                # Acumula o tempo real, descartando o excesso além do limite de recuperação
+                now = perf_counter()
+                accumulator = min(accumulator + now - previous, MAX_CATCH_UP_STEPS * step_time)
+                previous = now
+
+                steps = 0
+                while accumulator >= step_time:
+                    self._capture_positions()
+                    self.step(inputs)
+                    if replay is not None:
+                        replay.record(inputs, self)
+                    accumulator -= step_time
+                    steps += 1
+                    # Disparo e início valem apenas para o primeiro passo do frame
+                    inputs = InputState(inputs.left, inputs.right)
+                pending = inputs if not steps else None
+                profiler.mark('logic')
+
+                self.render(accumulator / step_time)
+                profiler.mark('render')
+                self.screen.present()
+                profiler.mark('present')
+                if steps:
+                    # As teclas lidas neste frame já estão na tela
+                    self.input_sampler.presented()
+                if recorder is not None:
+                    recorder.capture(self.screen.surface)
+                    profiler.mark('record')
+                profiler.end_frame(self.sprite_counts())
+                if max_fps:
+                    self.input_sampler.wait(frame_start + 1 / max_fps)
+        finally:
+            if replay is not None:
+                replay.save(record_path)
+            if profile_path is not None:
+                profiler.export(profile_path, audio=self.audio.stats(),
+                                input_latency=self.input_sampler.stats())
+            if recorder is not None:
+                recorder.close()
+
+    def sprite_counts(self):
+        """
+        Conta os sprites de cada grupo principal do jogo.
+        
+        Retorna:
+            dict: Quantidade de sprites por nome de grupo (zero fora da partida)
+        """
+        return {name: len(getattr(self, name, ())) for name in COUNTED_GROUPS}
+
+    def step(self, inputs):
+        """
+        Avança o jogo em exatamente um passo lógico.
+        Cada chamada equivale a 1/60 s de jogo simulado, independente do tempo
+        real gasto.
+        
+        Parâmetros:
+            inputs (InputState): Estado das entradas do jogador neste passo
+        """
+        self.game_clock.tick()
+        current_time = self.current_time = self.game_clock.get_ticks()
+
+        if self.main_screen:
+            self._show_main_menu(inputs)
+        elif self.start_game:
+            self._run_game_logic(inputs, current_time)
+        elif self.game_over:
+            self._handle_game_over(current_time)
+
+    def snapshot(self):
+        """
+        Salva todo o estado lógico do jogo em um bloco binário compacto, sem
+        superfícies nem sons (ver helpers/snapshot.py).
+        
+        Retorna:
+            bytes: Snapshot que pode ser restaurado com restore()
+        """
+        return take_snapshot(self)
+
+    def restore(self, blob):
+        """
+        Volta o jogo ao estado salvo por snapshot(), deste ou de outro jogo criado
+        com os mesmos parâmetros. Os passos seguintes são idênticos aos do jogo salvo.
+        
+        Parâmetros:
+            blob (bytes): Snapshot criado por snapshot()
+        """
+        restore_snapshot(self, blob)
+
+    def start_new_game(self):
+        """Inicia uma nova partida a partir do menu principal."""
+        # Cria as barreiras apenas em um novo jogo (não em nova rodada)
+        self.all_blockers = sprite.Group(*(self.make_blockers(number)
+                                           for number in range(self.settings.barrier_count)))
+        self.lives_group.add(self.life1, self.life2, self.life3, self.life4)
+        # Estatísticas da partida
+        self.round = 0
+        self.lives_lost = 0
+        self.reset(0)
+        self.start_game = True
+        self.main_screen = False
+
+    def _capture_positions(self):
+        """Guarda a posição dos sprites móveis antes de um passo lógico, para a interpolação."""
+        if not self.start_game:
+            self.previous_positions = {}
+            return
+        self.previous_positions = {sprite: sprite.rect.topleft
+                                   for group in (self.bullets, self.enemy_bullets,
+                                                 self.player_group, self.mystery_group)
+                                   for sprite in group}
+
+    def _interpolated_positions(self, alpha):
+        """
+        Calcula as posições de desenho dos sprites móveis entre os dois últimos passos.
+        
+        Parâmetros:
+            alpha (float): Fração do próximo passo já decorrida (0 a 1)
+            
+        Retorna:
+            dict: Posição (x, y) de cada sprite móvel
+        """
+        positions = {}
+        for sprite, (x0, y0) in self.previous_positions.items():
+            x1, y1 = sprite.rect.topleft
+            positions[sprite] = (round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha))
+        return positions
+
+    def render(self, alpha=None):
+        """
+        Etapa de renderização: desenha o estado atual do jogo, sem alterá-lo.
+        Não faz nada quando a renderização está desabilitada.
+        
+        Parâmetros:
+            alpha (float): Fração do próximo passo lógico já decorrida, usada para
+                interpolar os sprites móveis (None desenha as posições atuais)
+        """
+        if not self.screen.enabled:
+            return
+
+        if self.main_screen:
+            self._draw_main_menu()
+        elif self.start_game:
+            if not self.enemies and not self.explosions_group:
+                self._draw_round_transition()
+            else:
+                self._draw_game(None if alpha is None else self._interpolated_positions(alpha))
+        elif self.game_over:
+            self._draw_game_over()
+
+        if self.perf_overlay.visible:
+            self.perf_overlay.update()
+            self.screen.draw([self.perf_overlay.texts])
+
+    def _draw_main_menu(self):
+        """Desenha a tela principal do menu."""
+        self.screen.blit(self.welcome_screen, (0, 0))
+        self.screen.draw([[self.welcome_text, self.title_text2]])
+
+    def _draw_game(self, positions=None):
+        """
+        Desenha a partida em andamento, camada por camada.
+        
+        Parâmetros:
+            positions (dict): Posições interpoladas dos sprites móveis (opcional)
+        """
+        self.score_text2.update_text(str(self.score))
+        # Barreiras, HUD e vidas ficam no fundo: no modo de retângulos sujos só são
+        # redesenhados quando mudam; a cada frame apenas os sprites móveis são desenhados
+        self.screen.clear(self.background, [self.all_blockers, self.hud_texts, self.lives_group])
+        self.screen.draw([self.player_group, self.enemies, self.mystery_group, self.bullets,
+                          self.enemy_bullets, self.explosions_group], positions)
+
+    def _draw_round_transition(self):
+        """Desenha a tela de transição entre rodadas."""
+        self.screen.blit(self.background, (0, 0))
+        self.score_text2.update_text(str(self.score))
+        self.screen.draw([self.hud_texts, [self.next_round_text], self.lives_group])
+
+    def _draw_game_over(self):
+        """Desenha a tela de game over com efeito de piscar."""
         self.screen.blit(self.background, (0, 0))
-        passed = current_time - self.timer
+        passed = self.current_time - self.timer
         
         # Efeito de piscar do texto "Game Over"
-        if passed < 750:
-            self.game_over_text.draw(self.screen)
-        elif 750 < passed < 1500:
-            self.screen.blit(self.background, (0, 0))
-        elif 1500 < passed < 2250:
+        if passed < 750 or 1500 < passed < 2250:
             self.game_over_text.draw(self.screen)
-        elif 2250 < passed < 2750:
-            self.screen.blit(self.background, (0, 0))
-        elif passed > 3000:
-            self.main_screen = True
-
-        for e in event.get():
-            if self.should_exit(e):
-                sys.exit()
 
-    def run(self):
-        """Loop principal do jogo."""
-        while True:
-            if self.main_screen:
-                self._show_main_menu()
-            elif self.start_game:
-                self._run_game_logic()
-            elif self.game_over:
-                self._handle_game_over()
-                
-            display.update()
-            self.clock.tick(60)
+    def _show_main_menu(self, inputs):
+        """
+        Processa o menu principal.
+        
+        Parâmetros:
+            inputs (InputState): Estado das entradas neste passo
+        """
+        if inputs.start:
+            self.start_new_game()
 
-    def _show_main_menu(self):
-        """Exibe a tela principal do menu."""
-        self.screen.blit(self.welcome_screen, (0, 0))
-        self.welcome_text.draw(self.screen)               
-        self.title_text2.draw(self.screen)
+    def _run_game_logic(self, inputs, current_time):
+        """
+        Executa a lógica principal do jogo.
         
-        for e in event.get():
-            if self.should_exit(e):
-                sys.exit()
-            if e.type == KEYUP:
-                # Cria as barreiras apenas em um novo jogo (não em nova rodada)
-                self.all_blockers = sprite.Group(self.make_blockers(0),
-                                              self.make_blockers(1),
-                                              self.make_blockers(2),
-                                              self.make_blockers(3))
-                self.lives_group.add(self.life1, self.life2, self.life3, self.life4)
-                self.reset(0)
-                self.start_game = True
-                self.main_screen = False
-
-    def _run_game_logic(self):
-        """Executa a lógica principal do jogo."""
+        Parâmetros:
+            inputs (InputState): Estado das entradas neste passo
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
         if not self.enemies and not self.explosions_group:
             # Fase concluída - prepara próxima rodada
-            current_time = time.get_ticks()
             if current_time - self.game_timer < 3000:
-                self._display_round_transition(current_time)
+                self._display_round_transition(inputs, current_time)
             if current_time - self.game_timer > 3000:
                 # Move os inimigos mais para baixo na próxima rodada
                 self.enemy_position += constants.ENEMY_MOVE_DOWN
@@ -408,48 +818,63 @@ class SpaceInvaders(object):
                 self.game_timer += 3000
         else:
             # Jogo em andamento
-            current_time = time.get_ticks()
-            self.play_main_music(current_time)
-            self.screen.blit(self.background, (0, 0))
-            self._update_game_elements(current_time)
+            self._update_game_elements(inputs, current_time)
 
-    def _display_round_transition(self, current_time):
-        """Mostra a tela de transição entre rodadas."""
-        self.screen.blit(self.background, (0, 0))
-        self.score_text2 = Text(constants.FONT, 20, str(self.score),
-                             constants.GREEN_COLOR, 85, 5)
-        self.score_text.draw(self.screen)
-        self.score_text2.draw(self.screen)
-        self.next_round_text.draw(self.screen)
-        self.lives_text.draw(self.screen)
-        self.lives_group.update()
-        self.check_input()
-
-    def _update_game_elements(self, current_time):
+    def _display_round_transition(self, inputs, current_time):
+        """Processa a transição entre rodadas."""
+        self.check_input(inputs)
+
+    def _update_game_elements(self, inputs, current_time):
         """Atualiza todos os elementos do jogo durante a partida."""
-        self.all_blockers.update(self.screen)
-        self.score_text2 = Text(constants.FONT, 20, str(self.score), constants.GREEN_COLOR,
-                             85, 5)
-        self.score_text.draw(self.screen)
-        self.score_text2.draw(self.screen)
-        self.lives_text.draw(self.screen)
-        self.check_input()
-        self.enemies.update(current_time)
-        self.all_sprites.update(self.keys, current_time)
-        self.explosions_group.update(current_time)
-        self.check_collisions()
-        self.create_new_ship(self.make_new_ship, current_time)
-        self.make_enemies_shoot()
-
-    def _handle_game_over(self):
-        """Lida com a lógica de fim de jogo."""
-        current_time = time.get_ticks()
+        self.check_input(inputs)
+        self.profiler.mark('logic')
+        # A marcha e as explosões são medidas como fases próprias dentro do agendador
+        self.timers.run(current_time, self.profiler)
+        self.profiler.mark('timers')
+        # Só os sprites que se movem a cada passo são atualizados
+        for group in (self.player_group, self.mystery_group, self.bullets, self.enemy_bullets):
+            group.update(self.keys, current_time)
+        self.profiler.mark('sprites')
+        self.check_collisions(current_time)
+        self.profiler.mark('collisions')
+        self.late_timers.run(current_time, self.profiler)
+        self.profiler.mark('timers')
+
+    def _handle_game_over(self, current_time):
+        """
+        Lida com a lógica de fim de jogo.
+        
+        Parâmetros:
+            current_time (int): Tempo atual do jogo em milissegundos
+        """
         # Reseta a posição inicial dos inimigos
         self.enemy_position = constants.ENEMY_DEFAULT_POSITION
         self.create_game_over(current_time)
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Space Invaders')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='apresenta apenas as regiões alteradas de cada frame')
+    parser.add_argument('--record', metavar='ARQUIVO',
+                        help='grava as entradas da sessão para reprodução posterior')
+    parser.add_argument('--seed', type=int, help='semente do gerador aleatório')
+    parser.add_argument('--profile', metavar='ARQUIVO',
+                        help='exporta o tempo de cada fase dos frames (.csv ou .json) ao sair')
+    parser.add_argument('--capture', metavar='PASTA',
+                        help='grava cada frame apresentado em blocos compactados nesta pasta')
+    parser.add_argument('--fps', type=int, default=60,
+                        help='limite de frames desenhados por segundo (0 para não limitar); '
+                             'a lógica sempre avança 60 passos por segundo')
+    parser.add_argument('--audio-buffer', type=int, default=AUDIO_BUFFER,
+                        help='buffer do dispositivo de áudio em amostras (menor = menos latência; '
+                             'aumente se o som falhar)')
+    parser.add_argument('--voices', type=int, default=8,
+                        help='sons simultâneos; acima disso o mais antigo é interrompido')
+    args = parser.parse_args()
+
     # Inicializa o jogo com configurações de áudio padrão
-    game = SpaceInvaders(44100, -16, 1, 4096)
-    game.run()
\ No newline at end of file
+    game = SpaceInvaders(44100, -16, 1, args.audio_buffer, dirty_rects=args.dirty_rects,
+                         seed=args.seed, voices=args.voices)
+    game.run(record_path=args.record, profile_path=args.profile, max_fps=args.fps,
+             capture_path=args.capture)
\ No newline at end of file
@@ -0,0 +1,37 @@
+import os
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pytest
+from pygame import mixer
+
+from helpers.audio import VoiceMixer
+
+
+@pytest.fixture
+def voice_mixer():
+    """Mixer real (driver de áudio mudo) com um canal reservado e quatro vozes de efeito."""
+    mixer.init(44100, -16, 1, 512)
+    if mixer.get_init() is None:
+        pytest.skip('mixer indisponível')
+    yield VoiceMixer(voices=4, reserved=1)
+    mixer.quit()
+
+
+def long_sound():
+    """Som de dois segundos de silêncio, que mantém a voz ocupada durante o teste."""
+    return mixer.Sound(buffer=bytes(44100 * 2 * 2))
+
+
+def test_full_effect_pool_never_touches_music_channels(voice_mixer):
+    sounds = [long_sound() for _ in range(7)]
+    for sound in sounds:
+        voice_mixer.begin_frame()
+        voice_mixer.play(sound)
+        assert not any(channel.get_busy() for channel in voice_mixer.music_channels)
+
+    assert voice_mixer.steals == 3
+    assert voice_mixer.stats()['busy_voices'] == 4
+    # As três vozes roubadas foram as iniciadas primeiro, na ordem em que começaram
+    playing = [channel.get_sound() for channel in voice_mixer.effect_channels]
+    assert playing == [sounds[4], sounds[5], sounds[6], sounds[3]]
@@ -0,0 +1,82 @@
+"""
+Políticas que controlam a nave do jogador em partidas automatizadas.
+Uma política recebe o jogo e retorna o InputState do próximo passo.
+"""
+from random import Random
+
+from helpers.inputs import InputState
+
+
+class IdlePolicy:
+    """Não faz nada: útil para medir a dificuldade sem intervenção do jogador."""
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, game):
+        return InputState()
+
+
+class RandomPolicy:
+    """
+    Pressiona teclas aleatoriamente, com semente própria.
+
+    Atributos:
+        random (Random): Gerador aleatório da política
+        shoot_chance (float): Probabilidade de disparar em cada passo
+    """
+
+    def __init__(self, seed=None, shoot_chance=0.2):
+        self.random = Random(seed)
+        self.shoot_chance = shoot_chance
+
+    def __call__(self, game):
+        direction = self.random.choice((-1, 0, 1))
+        return InputState(left=direction == -1, right=direction == 1,
+                          shoot=self.random.random() < self.shoot_chance)
+
+
+class TrackingPolicy:
+    """
+    Bot simples: desvia dos projéteis inimigos próximos, posiciona a nave sob o
+    alienígena vivo mais baixo e mais próximo e dispara quando está alinhado.
+
+    Atributos:
+        tolerance (int): Distância horizontal (px) considerada alinhada
+        danger_margin (int): Distância (px) até a base da arena a partir da qual um
+            projétil inimigo é uma ameaça
+    """
+
+    def __init__(self, seed=None, tolerance=6, danger_margin=170):
+        self.tolerance = tolerance
+        self.danger_margin = danger_margin
+
+    def __call__(self, game):
+        if not game.start_game or not game.enemies:
+            return InputState()
+
+        ship_x = game.player.rect.centerx
+        danger_height = game.settings.arena_height - self.danger_margin
+        for bullet in game.enemy_bullets:
+            if bullet.rect.bottom > danger_height and abs(bullet.rect.centerx - ship_x) < 40:
+                # Foge para o lado oposto ao projétil, respeitando os limites da tela
+                escape_left = bullet.rect.centerx >= ship_x and game.player.rect.x > 60
+                return InputState(left=escape_left, right=not escape_left)
+
+        # O alienígena mais baixo está sempre na base de alguma coluna viva
+        enemies = game.enemies
+        candidates = (enemies.aliens[enemies.column_bottoms[column]][column]
+                      for column in enemies.alive_columns)
+        target = min(candidates, key=lambda alien: (-alien.rect.bottom,
+                                                    abs(alien.rect.centerx - ship_x)))
+        offset = target.rect.centerx - ship_x
+        aligned = abs(offset) <= self.tolerance
+        return InputState(left=offset < -self.tolerance, right=offset > self.tolerance,
+                          shoot=aligned)
+
+
+POLICIES = {
+    'idle': IdlePolicy,
+    'random': RandomPolicy,
+    'tracking': TrackingPolicy,
+}
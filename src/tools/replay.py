@@ -0,0 +1,59 @@
+"""
+Reproduz uma sessão gravada com --record o mais rápido possível.
+
+A partida é recriada com a semente gravada e avançada passo a passo com as
+entradas registradas. A reprodução para no primeiro passo cujo checksum de
+estado não confere com o gravado.
+
+Uso (a partir da pasta src):
+    python -m tools.replay sessao.rep [--render] [--capture PASTA]
+"""
+import argparse
+import os
+import sys
+from time import perf_counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reprodução de sessões gravadas')
+    parser.add_argument('path', help='arquivo gravado com --record')
+    parser.add_argument('--render', action='store_true',
+                        help='abre uma janela e desenha cada frame (sem limitar a velocidade)')
+    parser.add_argument('--capture', metavar='PASTA',
+                        help='grava cada frame desenhado nesta pasta (implica --render)')
+    args = parser.parse_args()
+    args.render = args.render or args.capture is not None
+
+    if not args.render:
+        os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+    from helpers.audio import AUDIO_BUFFER
+    from helpers.capture import FrameRecorder
+    from helpers.replay import Replay
+    from space_invaders import SpaceInvaders
+
+    replay = Replay.load(args.path)
+    game = SpaceInvaders(44100, -16, 1, AUDIO_BUFFER, headless=not args.render, seed=replay.seed,
+                         render=args.render)
+
+    recorder = FrameRecorder(args.capture, game.screen.surface) if args.capture else None
+    on_tick = (lambda tick: recorder.capture(game.screen.surface)) if recorder else None
+
+    start = perf_counter()
+    diverged = replay.play(game, render=args.render, on_tick=on_tick)
+    elapsed = perf_counter() - start
+    if recorder is not None:
+        stats = recorder.close()
+        print(f"{stats['frames']} frames gravados em {args.capture} "
+              f"(média {stats['mean_ms']:.2f} ms por frame, {stats['stalls']} esperas)")
+
+    ticks = len(replay.inputs) if diverged is None else diverged
+    print(f'{ticks} passos em {elapsed:.2f} s ({ticks / max(elapsed, 1e-9):.0f} passos/s), '
+          f'pontuação {game.score}')
+    if diverged is not None:
+        print(f'divergência no passo {diverged}', file=sys.stderr)
+        sys.exit(1)
+    print('reprodução fiel: todos os checksums conferem')
+
+
+if __name__ == '__main__':
+    main()
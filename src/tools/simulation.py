@@ -0,0 +1,61 @@
+"""
+Funções para executar partidas completas sem janela, usadas pelas ferramentas
+de varredura de parâmetros, estresse e benchmarks.
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+from helpers.settings import Settings
+from space_invaders import SpaceInvaders
+from tools.policies import POLICIES
+
+
+def make_game(seed=None, settings=None, render=False, **kwargs):
+    """
+    Cria um jogo headless pronto para ser avançado com step().
+
+    Args:
+        seed (int): Semente do gerador aleatório do jogo
+        settings (Settings): Parâmetros de dificuldade
+        render (bool): Mantém a etapa de renderização habilitada
+        **kwargs: Demais argumentos repassados para SpaceInvaders
+
+    Returns:
+        SpaceInvaders: Jogo já iniciado (fora do menu principal)
+    """
+    game = SpaceInvaders(44100, -16, 1, 4096, headless=True, seed=seed,
+                         render=render, settings=settings, **kwargs)
+    game.start_new_game()
+    return game
+
+
+def play_game(seed=None, settings=None, policy='tracking', max_frames=60 * 60 * 30):
+    """
+    Joga uma partida completa com uma política automática.
+
+    Args:
+        seed (int): Semente do jogo e da política
+        settings (dict or Settings): Parâmetros de dificuldade
+        policy (str): Nome da política em tools.policies.POLICIES
+        max_frames (int): Limite de passos lógicos da partida
+
+    Returns:
+        dict: Resultado com pontuação, rodadas, vidas perdidas e passos executados
+    """
+    if isinstance(settings, dict):
+        settings = Settings(**settings)
+    game = make_game(seed, settings)
+    controller = POLICIES[policy](seed)
+
+    frames = 0
+    while frames < max_frames and game.start_game:
+        game.step(controller(game))
+        frames += 1
+
+    return {
+        'score': game.score,
+        'rounds': game.round,
+        'lives_lost': game.lives_lost,
+        'frames': frames,
+        'game_over': game.game_over,
+    }
@@ -0,0 +1,190 @@
+"""
+Modo de estresse: arena, formação e barreiras maiores que as do jogo original.
+
+Cria uma partida headless com os tamanhos informados, mede a memória ocupada
+por entidade (alienígenas e barreiras), tanto a alocada ao criá-las (tracemalloc)
+quanto o tamanho real de cada instância, e a vazão de passos lógicos controlados
+por um bot, mostrando onde o motor deixa de escalar.
+
+Uso (a partir da pasta src):
+    python -m tools.stress --arena 10400x5000 --formation 200x100 --barriers 16
+
+A formação precisa caber na arena: com 200x100 alienígenas ela ocupa cerca de
+10000x4500 px, e em uma arena menor a partida terminaria já no primeiro passo.
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+import argparse
+import sys
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from helpers import constants
+from helpers.settings import Settings
+from tools.policies import POLICIES
+from tools.simulation import make_game
+
+
+def parse_size(value):
+    """
+    Converte um texto no formato LARGURAxALTURA.
+
+    Args:
+        value (str): Texto como '1920x1080'
+
+    Returns:
+        tuple: (largura, altura) em inteiros
+    """
+    width, height = value.lower().split('x')
+    return int(width), int(height)
+
+
+def traced(function):
+    """
+    Executa uma função medindo a memória alocada por ela com tracemalloc.
+
+    Args:
+        function (callable): Função sem argumentos
+
+    Returns:
+        tuple: (retorno da função, bytes alocados e ainda em uso)
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = function()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+
+def instance_bytes(entity):
+    """
+    Mede o tamanho real de uma instância: o objeto, seu dicionário de atributos
+    (se houver) e os contêineres que só ela referencia (conjunto ou tupla de
+    grupos, arrays). Objetos compartilhados, como imagens e a formação, ficam de fora.
+
+    Args:
+        entity (object): Instância a medir
+
+    Returns:
+        int: Bytes ocupados pela instância
+    """
+    size = sys.getsizeof(entity)
+    values = [getattr(entity, name) for cls in type(entity).__mro__
+              for name in getattr(cls, '__slots__', ()) if hasattr(entity, name)]
+    if hasattr(entity, '__dict__'):
+        size += sys.getsizeof(entity.__dict__)
+        values += vars(entity).values()
+    return size + sum(sys.getsizeof(value) for value in values
+                      if isinstance(value, (tuple, list, set, dict, np.ndarray)))
+
+
+def memory_report(game):
+    """
+    Mede a memória por entidade recriando a formação e as barreiras do jogo.
+    A memória de pixels das superfícies (alocada pelo SDL, fora do alcance do
+    tracemalloc) é somada à parte para as barreiras. Além do total alocado por
+    entidade (que inclui os arrays da formação), informa o tamanho real de uma
+    instância (ver instance_bytes).
+
+    Args:
+        game (SpaceInvaders): Jogo já iniciado com os tamanhos desejados
+
+    Returns:
+        dict: Quantidade, bytes alocados e bytes da instância de cada tipo
+    """
+    def build_formation():
+        game.make_enemies()
+        game.all_sprites.add(game.enemies)
+        return game.enemies
+
+    formation, formation_bytes = traced(build_formation)
+    count = game.settings.barrier_count
+    barriers, barrier_bytes = traced(lambda: [game.make_blockers(number) for number in range(count)])
+    pixel_bytes = sum(barrier.image.get_bytesize() * barrier.image.get_width() *
+                      barrier.image.get_height() for barrier in barriers)
+
+    alien = next(iter(formation), None)
+    return {
+        'aliens': len(formation),
+        'bytes_per_alien': formation_bytes / max(len(formation), 1),
+        'alien_instance_bytes': instance_bytes(alien) if alien is not None else 0,
+        'barriers': count,
+        'bytes_per_barrier': (barrier_bytes + pixel_bytes) / max(count, 1),
+        'barrier_instance_bytes': instance_bytes(barriers[0]) if barriers else 0,
+    }
+
+
+def formation_extent(settings):
+    """
+    Calcula o espaço ocupado pela formação inicial e o limite que ela precisa respeitar.
+
+    Args:
+        settings (Settings): Tamanhos da arena e da formação
+
+    Returns:
+        tuple: (largura da formação, base da formação, linha de invasão da arena) em px
+    """
+    width = (settings.formation_columns - 1) * constants.ALIEN_SPACING[0] + constants.ALIEN_SIZE[0]
+    bottom = (constants.ENEMY_DEFAULT_POSITION +
+              (settings.formation_rows - 1) * constants.ALIEN_SPACING[1] + constants.ALIEN_SIZE[1])
+    invasion_line = settings.arena_height - (constants.SCREEN_SIZE[1] - constants.INVASION_LINE)
+    return width, bottom, invasion_line
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de estresse com arenas e formações grandes')
+    parser.add_argument('--arena', type=parse_size, default=(800, 600), help='LARGURAxALTURA da arena')
+    parser.add_argument('--formation', type=parse_size, default=(10, 3),
+                        help='COLUNASxLINHAS da formação')
+    parser.add_argument('--barriers', type=int, default=4, help='quantidade de barreiras')
+    parser.add_argument('--steps', type=int, default=600, help='passos lógicos medidos')
+    parser.add_argument('--policy', default='tracking', help='idle, random ou tracking')
+    parser.add_argument('--render', action='store_true', help='inclui a renderização em cada passo')
+    parser.add_argument('--seed', type=int, default=0, help='semente da partida')
+    args = parser.parse_args()
+
+    settings = Settings(arena_width=args.arena[0], arena_height=args.arena[1],
+                        formation_columns=args.formation[0], formation_rows=args.formation[1],
+                        barrier_count=args.barriers)
+    # Uma formação que não cabe já começa além da linha de invasão: a partida
+    # acabaria no primeiro passo e as medidas não representariam nada
+    width, bottom, invasion_line = formation_extent(settings)
+    if width > settings.arena_width or bottom >= invasion_line:
+        parser.error(f'a formação não cabe na arena: ocupa {width} px de largura (máximo '
+                     f'{settings.arena_width}) e termina em y={bottom} (a linha de invasão '
+                     f'fica em y={invasion_line})')
+
+    start = perf_counter()
+    game = make_game(args.seed, settings, render=args.render)
+    build_time = perf_counter() - start
+
+    report = memory_report(game)
+    print(f"{'entidade':<12} {'quantidade':>10} {'bytes/entidade':>15} {'bytes/instância':>16}")
+    print(f"{'alienígena':<12} {report['aliens']:>10} {report['bytes_per_alien']:>15.0f} "
+          f"{report['alien_instance_bytes']:>16}")
+    print(f"{'barreira':<12} {report['barriers']:>10} {report['bytes_per_barrier']:>15.0f} "
+          f"{report['barrier_instance_bytes']:>16}")
+
+    # Recomeça a partida para medir a vazão com o estado original
+    game.start_new_game()
+    controller = POLICIES[args.policy](args.seed)
+    steps = 0
+    start = perf_counter()
+    while steps < args.steps and not game.game_over:
+        game.step(controller(game))
+        if args.render:
+            game.render()
+        steps += 1
+    elapsed = perf_counter() - start
+
+    print(f'criação da partida: {build_time * 1000:.0f} ms')
+    print(f'{steps} passos em {elapsed:.2f} s ({steps / max(elapsed, 1e-9):.0f} passos/s), '
+          f'{len(game.enemies)} alienígenas vivos')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+"""
+Varredura de parâmetros de dificuldade com várias partidas em paralelo.
+
+Cada processo de trabalho executa um jogo headless por vez, controlado por
+uma política automática, e devolve o resultado assim que a partida termina.
+Os resultados são emitidos como linhas JSON à medida que chegam e, ao final,
+agregados por combinação de parâmetros. Processos que travam ou excedem o
+tempo limite são encerrados e substituídos, e a partida é registrada como falha.
+
+Uso (a partir da pasta src):
+    python -m tools.sweep --param alien_move_time=400,600,800 \\
+        --param enemy_fire_interval=500,700 --games 8 --workers 8
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import traceback
+from multiprocessing.connection import wait
+from statistics import mean
+from time import monotonic
+
+from helpers.settings import Settings
+
+
+def parse_param(text):
+    """
+    Converte 'nome=v1,v2,...' em (nome, [valores]).
+
+    Args:
+        text (str): Definição do parâmetro na linha de comando
+
+    Returns:
+        tuple: Nome do parâmetro e lista de valores inteiros
+    """
+    name, _, values = text.partition('=')
+    if name not in Settings().as_dict() or not values:
+        raise argparse.ArgumentTypeError(f'parâmetro inválido: {text}')
+    return name, [int(value) for value in values.split(',')]
+
+
+def build_tasks(params, games, policy, max_frames, seed):
+    """
+    Gera uma tarefa para cada partida de cada combinação de parâmetros.
+
+    Args:
+        params (list): Pares (nome, valores) a combinar
+        games (int): Partidas por combinação
+        policy (str): Nome da política que controla a nave
+        max_frames (int): Limite de passos por partida
+        seed (int): Semente base das partidas
+
+    Returns:
+        list: Tarefas (dicionários) a serem executadas
+    """
+    names = [name for name, _ in params]
+    tasks = []
+    for combination in itertools.product(*[values for _, values in params]):
+        settings = dict(zip(names, combination))
+        for game_index in range(games):
+            tasks.append({'id': len(tasks), 'settings': settings, 'seed': seed + game_index,
+                          'policy': policy, 'max_frames': max_frames})
+    return tasks
+
+
+def worker_main(connection):
+    """
+    Laço de um processo de trabalho: recebe tarefas, joga e devolve resultados.
+
+    Args:
+        connection (Connection): Canal com o processo principal
+    """
+    os.environ['SPACE_INVADERS_HEADLESS'] = '1'
+    from tools.simulation import play_game
+
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        start = monotonic()
+        try:
+            result = play_game(task['seed'], task['settings'], task['policy'], task['max_frames'])
+            result['status'] = 'ok'
+        except Exception:
+            result = {'status': 'error', 'error': traceback.format_exc()}
+        result['elapsed'] = monotonic() - start
+        connection.send(result)
+
+
+class Worker:
+    """
+    Processo de trabalho e a tarefa que ele está executando.
+
+    Atributos:
+        process (Process): Processo do sistema operacional
+        connection (Connection): Canal com o processo
+        task (dict): Tarefa em execução (None se ocioso)
+        deadline (float): Momento limite para a tarefa atual
+    """
+
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.task = None
+        self.deadline = None
+
+    def assign(self, task, timeout):
+        self.task = task
+        self.deadline = monotonic() + timeout
+        self.connection.send(task)
+
+    def stop(self, force=False):
+        if force:
+            # SIGKILL: o SDL intercepta o SIGTERM e o transforma em evento QUIT
+            self.process.kill()
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+        self.process.join(1)
+
+
+def run_sweep(tasks, workers, timeout):
+    """
+    Executa as tarefas em um conjunto de processos, produzindo resultados conforme chegam.
+
+    Args:
+        tasks (list): Tarefas geradas por build_tasks
+        workers (int): Número de processos de trabalho
+        timeout (float): Tempo máximo (s) de uma partida
+
+    Yields:
+        dict: Resultado de cada tarefa, com a tarefa de origem
+    """
+    context = multiprocessing.get_context('spawn')
+    pending = list(reversed(tasks))
+    pool = [Worker(context) for _ in range(min(workers, len(tasks)))]
+
+    def finish(worker, result):
+        result.update(task=worker.task['id'], settings=worker.task['settings'],
+                      seed=worker.task['seed'])
+        worker.task = None
+        return result
+
+    try:
+        while pending or any(worker.task for worker in pool):
+            for worker in pool:
+                if worker.task is None and pending:
+                    worker.assign(pending.pop(), timeout)
+
+            busy = [worker for worker in pool if worker.task]
+            ready = wait([w.connection for w in busy] + [w.process.sentinel for w in busy],
+                         timeout=0.5)
+
+            for index, worker in enumerate(pool):
+                if worker.task is None:
+                    continue
+                if worker.connection in ready:
+                    try:
+                        yield finish(worker, worker.connection.recv())
+                        continue
+                    except EOFError:
+                        pass  # O processo morreu enquanto enviava o resultado
+                if worker.process.sentinel in ready or not worker.process.is_alive():
+                    status = {'status': 'crashed', 'exitcode': worker.process.exitcode}
+                elif monotonic() > worker.deadline:
+                    status = {'status': 'timeout'}
+                else:
+                    continue
+                # Substitui o processo que falhou por um novo
+                worker.stop(force=True)
+                yield finish(worker, status)
+                pool[index] = Worker(context)
+    finally:
+        for worker in pool:
+            worker.stop(force=worker.task is not None)
+
+
+def summarize(results):
+    """
+    Agrega os resultados por combinação de parâmetros.
+
+    Args:
+        results (list): Resultados produzidos por run_sweep
+
+    Returns:
+        list: Um resumo (dicionário) por combinação
+    """
+    groups = {}
+    for result in results:
+        key = json.dumps(result['settings'], sort_keys=True)
+        groups.setdefault(key, []).append(result)
+
+    summary = []
+    for key, group in groups.items():
+        finished = [result for result in group if result['status'] == 'ok']
+        entry = {'settings': json.loads(key), 'games': len(group),
+                 'failures': len(group) - len(finished)}
+        for field in ('score', 'rounds', 'lives_lost', 'frames'):
+            values = [result[field] for result in finished]
+            entry[f'mean_{field}'] = mean(values) if values else None
+        summary.append(entry)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Varredura de parâmetros de dificuldade')
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        help='parâmetro de Settings e valores, ex.: alien_move_time=400,600')
+    parser.add_argument('--games', type=int, default=4, help='partidas por combinação')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='processos paralelos')
+    parser.add_argument('--policy', default='tracking', help='idle, random ou tracking')
+    parser.add_argument('--max-frames', type=int, default=60 * 60 * 30,
+                        help='limite de passos lógicos por partida')
+    parser.add_argument('--timeout', type=float, default=300, help='tempo máximo (s) por partida')
+    parser.add_argument('--seed', type=int, default=0, help='semente base das partidas')
+    parser.add_argument('--output', help='arquivo JSON lines para os resultados (padrão: stdout)')
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.param, args.games, args.policy, args.max_frames, args.seed)
+    output = open(args.output, 'w') if args.output else sys.stdout
+    results = []
+    start = monotonic()
+    try:
+        for result in run_sweep(tasks, args.workers, args.timeout):
+            results.append(result)
+            output.write(json.dumps(result) + '\n')
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = monotonic() - start
+    frames = sum(result.get('frames', 0) for result in results)
+    print(f'{len(results)} partidas, {frames} passos em {elapsed:.1f} s '
+          f'({frames / elapsed:.0f} passos/s)', file=sys.stderr)
+    for entry in summarize(results):
+        print(json.dumps(entry), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
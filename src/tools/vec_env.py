@@ -0,0 +1,951 @@
+"""
+Ambiente vetorizado para aprendizado por reforço: N partidas independentes
+avançam juntas, um passo fixo de 1/60 s por chamada de step(), dentro de um
+único processo.
+
+O estado de todas as partidas fica em arrays NumPy (uma estrutura de arrays:
+posição da nave, origem e máscara da formação, projéteis, máscaras das
+barreiras, pontuação, vidas, temporizadores), e cada regra do jogo é aplicada
+a todas as partidas de uma só vez. As regras reproduzem as de SpaceInvaders
+(check_collisions, AliensGroup.update, make_enemies_shoot, temporizadores):
+com a mesma semente e as mesmas ações, cada partida segue exatamente o jogo
+original, o que pode ser conferido com --verify.
+
+As observações, recompensas e fins de partida ficam em um bloco de memória
+compartilhada (multiprocessing.shared_memory). O estado visível das partidas
+é formado por visões desse bloco, então step() não copia nem aloca as
+observações: quem treina lê sempre os mesmos arrays, inclusive a partir de
+outro processo (VecSpaceInvaders.attach).
+
+Uso (a partir da pasta src):
+    python -m tools.vec_env --envs 1024 --steps 2000
+    python -m tools.vec_env --verify 8
+"""
+import os
+os.environ.setdefault('SPACE_INVADERS_HEADLESS', '1')
+
+import argparse
+from multiprocessing import shared_memory
+from random import Random, randrange
+from time import perf_counter
+
+import numpy as np
+
+from alien.alien import Alien
+from helpers import constants
+from helpers.assets import ATLAS
+from helpers.collision import overlap_table
+from helpers.settings import Settings
+
+# Ações: combinação de bits das teclas pressionadas no passo (0 a 7)
+LEFT = 1
+RIGHT = 2
+SHOOT = 4
+
+# Pontuações sorteadas pela nave misteriosa (um sorteio a cada abate, como em calculate_score)
+MYSTERY_SCORES = [50, 100, 150, 300]
+# Passos lógicos por segundo simulado (mesmo valor de VirtualClock)
+FPS = 60
+
+
+def enemy_bullet_slots(settings):
+    """
+    Calcula quantos projéteis inimigos podem estar na tela ao mesmo tempo.
+
+    Args:
+        settings (Settings): Parâmetros do jogo
+
+    Returns:
+        int: Vagas para projéteis inimigos em cada partida
+    """
+    travel = settings.arena_height // settings.enemy_bullet_speed + 2
+    interval = max(settings.enemy_fire_interval * FPS // 1000, 1)
+    return travel // interval + 2
+
+
+def observation_layout(settings):
+    """
+    Descreve os campos da observação de cada partida, na ordem em que ficam no bloco.
+
+    Args:
+        settings (Settings): Parâmetros do jogo
+
+    Returns:
+        list: Pares (nome, formato) de cada campo (formato () para escalares)
+    """
+    slots = enemy_bullet_slots(settings)
+    cell = constants.BLOCKER_CELL_SIZE
+    barrier_shape = (settings.barrier_count, constants.BLOCKER_SIZE[1] // cell,
+                     constants.BLOCKER_SIZE[0] // cell)
+    return [('score', ()), ('lives', ()), ('round', ()),
+            ('ship_x', ()), ('ship_alive', ()),
+            ('formation_x', ()), ('formation_y', ()), ('direction', ()),
+            ('mystery_x', ()), ('mystery_moving', ()),
+            ('player_bullet_x', (2,)), ('player_bullet_y', (2,)), ('player_bullet_alive', (2,)),
+            ('enemy_bullet_x', (slots,)), ('enemy_bullet_y', (slots,)),
+            ('enemy_bullet_alive', (slots,)),
+            ('aliens', (settings.formation_rows, settings.formation_columns)),
+            ('barriers', barrier_shape)]
+
+
+def shared_buffers(buffer, num_envs, layout):
+    """
+    Cria as visões NumPy do bloco compartilhado: observações (int32), recompensas
+    (float32) e fins de partida (bool), nessa ordem.
+
+    Args:
+        buffer (memoryview): Memória do bloco (SharedMemory.buf)
+        num_envs (int): Quantidade de partidas
+        layout (list): Campos da observação (observation_layout)
+
+    Returns:
+        tuple: (observações (N, tamanho), recompensas (N,), fins (N,))
+    """
+    size = sum(int(np.prod(shape)) for _, shape in layout)
+    observations = np.ndarray((num_envs, size), dtype=np.int32, buffer=buffer)
+    offset = observations.nbytes
+    rewards = np.ndarray((num_envs,), dtype=np.float32, buffer=buffer, offset=offset)
+    offset += rewards.nbytes
+    dones = np.ndarray((num_envs,), dtype=bool, buffer=buffer, offset=offset)
+    return observations, rewards, dones
+
+
+def shared_size(num_envs, layout):
+    """Tamanho em bytes do bloco compartilhado de num_envs partidas."""
+    size = sum(int(np.prod(shape)) for _, shape in layout)
+    return num_envs * (size * 4 + 4 + 1)
+
+
+def observation_fields(observations, layout):
+    """
+    Separa a matriz de observações em um array por campo, sem cópias.
+
+    Args:
+        observations (ndarray): Matriz (N, tamanho) de observações
+        layout (list): Campos da observação (observation_layout)
+
+    Returns:
+        dict: Visão (N, *formato) de cada campo, indexada pelo nome
+    """
+    fields = {}
+    offset = 0
+    for name, shape in layout:
+        size = int(np.prod(shape))
+        # Dividir o último eixo (contíguo dentro de cada linha) sempre devolve uma visão
+        view = observations[:, offset:offset + size]
+        fields[name] = view[:, 0] if not shape else view.reshape((len(observations),) + shape)
+        offset += size
+    return fields
+
+
+class VecSpaceInvaders:
+    """
+    N partidas de Space Invaders avançando juntas, com o estado em arrays.
+
+    Cada partida usa o próprio gerador aleatório (Random(seed + índice)), consumido
+    na mesma ordem do jogo original, e recomeça sozinha ao terminar: a observação
+    devolvida no passo do fim já é a da nova partida.
+
+    Atributos:
+        num_envs (int): Quantidade de partidas
+        settings (Settings): Parâmetros comuns a todas as partidas
+        observations (ndarray): Observações (N, tamanho), int32, em memória compartilhada
+        rewards (ndarray): Pontos obtidos no último passo (N,), float32, compartilhado
+        dones (ndarray): Partidas que terminaram no último passo (N,), compartilhado
+        layout (list): Campos da observação (observation_layout)
+        episode_scores (ndarray): Pontuação final da última partida concluída de cada ambiente
+        episode_rounds (ndarray): Rodadas da última partida concluída de cada ambiente
+        episode_lives_lost (ndarray): Vidas perdidas na última partida concluída
+        episodes (int): Quantidade de partidas concluídas
+    """
+
+    def __init__(self, num_envs, settings=None, seed=None):
+        """
+        Cria as partidas, já iniciadas (fora do menu principal).
+
+        Args:
+            num_envs (int): Quantidade de partidas
+            settings (Settings): Parâmetros do jogo (None usa os valores originais)
+            seed (int): Semente base; a partida i usa seed + i (None para semente aleatória)
+        """
+        self.num_envs = n = num_envs
+        self.settings = settings = settings if settings is not None else Settings()
+        self.seed = seed if seed is not None else randrange(2 ** 32)
+        self.randoms = [Random(self.seed + index) for index in range(n)]
+
+        # Geometria (a mesma dos sprites do jogo)
+        self.width, self.height = settings.arena_width, settings.arena_height
+        self.ship_size = constants.IMAGES['ship'].get_size()
+        self.ship_y = self.height - 50
+        self.ship_start = self.width // 2 - 15
+        self.ship_right_limit = self.width - 60
+        self.laser_size = constants.IMAGES['laser'].get_size()
+        self.enemy_laser_size = constants.IMAGES['enemylaser'].get_size()
+        self.mystery_size = (75, 35)
+        self.mystery_y = 45
+
+        # Narrowphase das colisões: a sobreposição das máscaras de pixels (as mesmas
+        # máscaras compartilhadas do jogo) fica pré-calculada para cada deslocamento
+        laser, enemy_laser = ATLAS.mask('laser'), ATLAS.mask('enemylaser')
+        ship, mystery = ATLAS.mask('ship'), ATLAS.mask('mystery', self.mystery_size)
+        self.laser_hits = overlap_table(laser, enemy_laser)
+        self.mystery_hits = overlap_table(mystery, laser)
+        self.ship_hits = overlap_table(ship, enemy_laser)
+        # Alienígenas: uma tabela por linha de imagens (0 a 2) e quadro de animação
+        self.alien_laser_hits = np.array([[overlap_table(alien, laser)
+                                           for alien in Alien.row_masks(row)]
+                                          for row in range(3)])
+        self.alien_ship_hits = np.array([[overlap_table(alien, ship)
+                                          for alien in Alien.row_masks(row)]
+                                         for row in range(3)])
+
+        self.rows, self.columns = settings.formation_rows, settings.formation_columns
+        formation_width = ((self.columns - 1) * constants.ALIEN_SPACING[0] +
+                           constants.ALIEN_SIZE[0])
+        self.formation_left = (self.width - formation_width) // 2 + 2
+        self.base_moves = max((self.width - formation_width) // 10 - 1, 0)
+        # Pontos por linha da formação (linhas extras valem como a última)
+        self.row_scores = np.array([30] + [20] * (self.rows - 1), dtype=np.int64)
+
+        cell = constants.BLOCKER_CELL_SIZE
+        self.cell_size = cell
+        self.barrier_width, self.barrier_height = constants.BLOCKER_SIZE
+        spacing = self.width // settings.barrier_count
+        self.barrier_x = [50 + spacing * number for number in range(settings.barrier_count)]
+        self.barrier_y = self.height - (constants.SCREEN_SIZE[1] - constants.BLOCKERS_POSITION)
+        # Altura da base da formação a partir da qual os alienígenas invadem a área do jogador
+        self.invasion_line = self.height - (constants.SCREEN_SIZE[1] - constants.INVASION_LINE)
+
+        # Bloco compartilhado: o estado visível das partidas são visões dele
+        self.layout = observation_layout(settings)
+        self.shared = shared_memory.SharedMemory(create=True, size=shared_size(n, self.layout))
+        self.observations, self.rewards, self.dones = shared_buffers(self.shared.buf, n,
+                                                                     self.layout)
+        # score, lives, ship_x, aliens, barriers, ... (um atributo por campo do layout)
+        vars(self).update(observation_fields(self.observations, self.layout))
+
+        # Estado interno (temporizadores e controle da marcha), fora da observação
+        def zeros():
+            return np.zeros(n, dtype=np.int64)
+        self.frame = zeros()
+        self.time = zeros()
+        self.game_timer = zeros()
+        self.enemy_position = zeros()
+        self.lives_lost = zeros()
+        self.march_start = zeros()
+        self.move_time = zeros()
+        self.move_number = zeros()
+        self.left_moves = zeros()
+        self.right_moves = zeros()
+        self.leftmost = zeros()
+        self.rightmost = zeros()
+        self.alien_bottom = zeros()
+        self.alien_count = zeros()
+        self.alien_frame = zeros()
+        self.mystery_direction = zeros()
+        self.mystery_wait = zeros()
+        self.fire_start = zeros()
+        self.fire_active = np.zeros(n, dtype=bool)
+        self.respawn_start = zeros()
+        self.respawn_pending = np.zeros(n, dtype=bool)
+        self.explosions_due = zeros()
+
+        self.episode_scores = zeros()
+        self.episode_rounds = zeros()
+        self.episode_lives_lost = zeros()
+        self.episodes = 0
+
+        self.reset()
+
+    @staticmethod
+    def attach(name, num_envs, settings=None):
+        """
+        Abre, em outro processo, o bloco compartilhado de um ambiente existente.
+
+        Args:
+            name (str): Nome do bloco (VecSpaceInvaders.shared.name)
+            num_envs (int): Quantidade de partidas do ambiente
+            settings (Settings): Os mesmos parâmetros usados pelo ambiente
+
+        Returns:
+            tuple: (SharedMemory, observações, recompensas, fins); o chamador deve
+                descartar os arrays antes de fechar o bloco
+        """
+        layout = observation_layout(settings if settings is not None else Settings())
+        shared = shared_memory.SharedMemory(name=name)
+        return (shared,) + shared_buffers(shared.buf, num_envs, layout)
+
+    def close(self):
+        """Libera o bloco compartilhado (as visões deixam de ser válidas)."""
+        if self.shared is None:
+            return
+        for name, _ in self.layout:
+            delattr(self, name)
+        self.observations = self.rewards = self.dones = None
+        self.shared.close()
+        self.shared.unlink()
+        self.shared = None
+
+    def reset(self):
+        """
+        Recomeça todas as partidas.
+
+        Returns:
+            ndarray: Observações iniciais (o mesmo array devolvido por step())
+        """
+        self._reset_games(np.arange(self.num_envs))
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.observations
+
+    def _reset_games(self, games):
+        """Inicia novas partidas (como start_new_game em um jogo recém-criado)."""
+        self.frame[games] = 0
+        self.time[games] = 0
+        self.score[games] = 0
+        self.lives[games] = 4
+        self.round[games] = 0
+        self.lives_lost[games] = 0
+        self.enemy_position[games] = constants.ENEMY_DEFAULT_POSITION
+        self.game_timer[games] = 0
+        self.explosions_due[games] = -1
+        self.barriers[games] = 1
+        self._reset_rounds(games)
+
+    def _reset_rounds(self, games):
+        """Começa uma nova rodada nas partidas indicadas (como SpaceInvaders.reset)."""
+        now = self.time[games]
+        self.ship_x[games] = self.ship_start
+        self.ship_alive[games] = 1
+        self.player_bullet_alive[games] = 0
+        self.enemy_bullet_alive[games] = 0
+        self.mystery_x[games] = -80
+        self.mystery_direction[games] = 1
+        self.mystery_moving[games] = 0
+        self.mystery_wait[games] = now
+
+        self.aliens[games] = 1
+        self.alien_count[games] = self.rows * self.columns
+        self.formation_x[games] = self.formation_left
+        self.formation_y[games] = self.enemy_position[games]
+        self.direction[games] = 1
+        self.alien_frame[games] = 0
+        self.move_number[games] = self.base_moves // 2
+        self.left_moves[games] = self.base_moves
+        self.right_moves[games] = self.base_moves
+        self.leftmost[games] = 0
+        self.rightmost[games] = self.columns - 1
+        self.move_time[games] = self.settings.alien_move_time
+        self.march_start[games] = now
+        self.alien_bottom[games] = (self.enemy_position[games] +
+                                    (self.rows - 1) * constants.ALIEN_SPACING[1] +
+                                    constants.ALIEN_SIZE[1])
+
+        self.fire_start[games] = now
+        self.fire_active[games] = True
+        self.respawn_pending[games] = False
+        self.round[games] += 1
+
+    def step(self, actions):
+        """
+        Avança todas as partidas em um passo lógico.
+
+        Args:
+            actions (ndarray): Ação de cada partida (N,), combinação de LEFT, RIGHT e SHOOT
+
+        Returns:
+            tuple: (observações, recompensas, fins), sempre os mesmos arrays compartilhados
+        """
+        actions = np.asarray(actions)
+        previous_score = self.score.astype(np.int64)
+        previous = self.time
+        self.frame += 1
+        now = self.time = self.frame * 1000 // FPS
+
+        # Sem alienígenas e sem explosões: transição de rodada (3 s após o último abate).
+        # Uma explosão sai da tela no primeiro passo depois do seu limite.
+        idle = (self.alien_count == 0) & (self.explosions_due < previous)
+        advance = np.flatnonzero(idle & (now - self.game_timer > 3000))
+        if len(advance):
+            self.enemy_position[advance] += constants.ENEMY_MOVE_DOWN
+            self._reset_rounds(advance)
+            self.game_timer[advance] += 3000
+
+        playing = ~idle
+        self._check_input(playing, actions)
+        self._run_timers(playing, now)
+        self._update_sprites(playing, actions, now)
+        game_over = self._check_collisions(playing, now)
+        self._run_late_timers(playing, now)
+
+        np.subtract(self.score, previous_score, out=self.rewards, casting='unsafe')
+        self.dones[:] = game_over
+        finished = np.flatnonzero(game_over)
+        if len(finished):
+            self.episode_scores[finished] = self.score[finished]
+            self.episode_rounds[finished] = self.round[finished]
+            self.episode_lives_lost[finished] = self.lives_lost[finished]
+            self.episodes += len(finished)
+            self._reset_games(finished)
+        return self.observations, self.rewards, self.dones
+
+    def _check_input(self, playing, actions):
+        """Dispara o projétil do jogador (tiro duplo a partir de 1000 pontos)."""
+        shoot = (playing & (actions & SHOOT != 0) & (self.ship_alive != 0) &
+                 ~self.player_bullet_alive.any(1))
+        if not shoot.any():
+            return
+        double = shoot & (self.score >= 1000)
+        x = self.player_bullet_x
+        np.copyto(x[:, 0], np.where(double, self.ship_x + 8, self.ship_x + 23), where=shoot)
+        np.copyto(x[:, 1], self.ship_x + 38, where=double)
+        self.player_bullet_y[shoot] = self.ship_y + 5
+        self.player_bullet_alive[:, 0] |= shoot
+        self.player_bullet_alive[:, 1] |= double
+
+    def _run_timers(self, playing, now):
+        """Temporizadores do início do passo: marcha da formação e nave misteriosa."""
+        march = playing & (self.march_start + self.move_time < now)
+        if march.any():
+            self.march_start += np.where(march, self.move_time, 0)
+            self._march(march)
+
+        start = playing & (self.mystery_moving == 0) & (
+            self.mystery_wait + self.settings.mystery_move_time < now)
+        self.mystery_moving[start] = 1
+
+    def _march(self, march):
+        """Um passo da marcha nas partidas indicadas (como AliensGroup.update)."""
+        left_add = 5 * self.leftmost
+        right_add = 5 * (self.columns - 1 - self.rightmost)
+        max_move = np.where(self.direction == 1, self.right_moves + right_add,
+                            self.left_moves + left_add)
+        reverse = march & (self.move_number >= max_move)
+        lateral = march & ~reverse
+        # Os dois movimentos alternam a imagem da formação
+        self.alien_frame ^= march
+
+        # Inverte a direção e desce
+        np.negative(self.direction, out=self.direction, where=reverse)
+        adjustment = self.base_moves + np.where(self.direction == 1, right_add, left_add)
+        np.copyto(self.left_moves, adjustment, where=reverse)
+        np.copyto(self.right_moves, adjustment, where=reverse)
+        self.move_number[reverse] = 0
+        self.formation_y += reverse * constants.ENEMY_MOVE_DOWN
+        descended = np.flatnonzero(reverse)
+        if len(descended):
+            self.alien_bottom[descended] = self._bounding_bottom(descended)
+
+        # Move lateralmente
+        self.formation_x += lateral * 10 * self.direction
+        self.move_number += lateral
+
+    def _bounding_bottom(self, games):
+        """Base da caixa envolvente dos alienígenas vivos (0 sem alienígenas)."""
+        rows = self.aliens[games].any(2)
+        bottom_row = self.rows - 1 - rows[:, ::-1].argmax(1)
+        bottom = (self.formation_y[games] + bottom_row * constants.ALIEN_SPACING[1] +
+                  constants.ALIEN_SIZE[1])
+        return np.where(rows.any(1), bottom, 0)
+
+    def _update_sprites(self, playing, actions, now):
+        """Movimento da nave, da nave misteriosa e dos projéteis."""
+        ship = playing & (self.ship_alive != 0)
+        left = ship & (actions & LEFT != 0) & (self.ship_x > 10)
+        self.ship_x -= left * 4
+        right = ship & (actions & RIGHT != 0) & (self.ship_x < self.ship_right_limit)
+        self.ship_x += right * 4
+
+        moving = playing & (self.mystery_moving != 0)
+        if moving.any():
+            forward = moving & (self.mystery_direction == 1) & (self.mystery_x < self.width + 40)
+            self.mystery_x += forward * 2
+            backward = moving & (self.mystery_direction == -1) & (self.mystery_x > -100)
+            self.mystery_x -= backward * 2
+            # Ao sair da tela, inverte a direção e volta a esperar pela próxima passagem
+            out_right = moving & (self.mystery_x > self.width + 30)
+            out_left = moving & ~out_right & (self.mystery_x < -90)
+            self.mystery_direction[out_right] = -1
+            self.mystery_direction[out_left] = 1
+            ended = out_right | out_left
+            self.mystery_moving[ended] = 0
+            np.copyto(self.mystery_wait, now, where=ended)
+
+        for x, y, alive, speed in (
+                (self.player_bullet_x, self.player_bullet_y, self.player_bullet_alive,
+                 -self.settings.player_bullet_speed),
+                (self.enemy_bullet_x, self.enemy_bullet_y, self.enemy_bullet_alive,
+                 self.settings.enemy_bullet_speed)):
+            flying = playing[:, None] & (alive != 0)
+            y += flying * speed
+            alive[flying & ((y < 15) | (y > self.height))] = 0
+
+    def _check_collisions(self, playing, now):
+        """
+        Resolve as colisões do passo na mesma ordem de SpaceInvaders.check_collisions.
+
+        Returns:
+            ndarray: Partidas que terminaram neste passo
+        """
+        pbx, pby, pba = self.player_bullet_x, self.player_bullet_y, self.player_bullet_alive
+        ebx, eby, eba = self.enemy_bullet_x, self.enemy_bullet_y, self.enemy_bullet_alive
+        # Projéteis do jogador contra projéteis inimigos: o primeiro tiro destrói todos
+        # os que toca; o segundo, apenas os que ainda restarem
+        active = playing[:, None] & (pba != 0)
+        if active.any() and eba.any():
+            overlap = (active[:, :, None] & (eba != 0)[:, None, :] &
+                       _touches(self.laser_hits, self.enemy_laser_size, pbx[:, :, None],
+                                pby[:, :, None], ebx[:, None, :], eby[:, None, :]))
+            first = overlap[:, 0]
+            second = overlap[:, 1] & ~first
+            eba[first | second] = 0
+            pba[:, 0] &= ~first.any(1)
+            pba[:, 1] &= ~second.any(1)
+
+        # Projéteis do jogador contra a formação: cada tiro abate o primeiro alienígena
+        # (na ordem da formação) que toca, e um alienígena pode absorver os dois tiros
+        victims = np.full((self.num_envs, 2), -1, dtype=np.int64)
+        for slot in range(2):
+            games = np.flatnonzero(playing & (pba[:, slot] != 0))
+            if len(games):
+                victims[games, slot] = self._first_alien(games, pbx[games, slot],
+                                                         pby[games, slot], self.laser_size,
+                                                         self.alien_laser_hits)
+        hit = victims >= 0
+        if hit.any():
+            pba[hit] = 0
+            victims[:, 1][victims[:, 1] == victims[:, 0]] = -1
+            self._kill_aliens(victims, now)
+
+        # Projéteis do jogador contra a nave misteriosa
+        touched = (playing[:, None] & (pba != 0) &
+                   _touches(self.mystery_hits, self.laser_size, self.mystery_x[:, None],
+                            self.mystery_y, pbx, pby))
+        if touched.any():
+            pba[touched] = 0
+            for game in np.flatnonzero(touched.any(1)).tolist():
+                self.score[game] += self.randoms[game].choice(MYSTERY_SCORES)
+            killed = touched.any(1)
+            np.maximum(self.explosions_due, now + 600, out=self.explosions_due, where=killed)
+            self.mystery_x[killed] = -80
+            self.mystery_direction[killed] = 1
+            self.mystery_moving[killed] = 0
+            np.copyto(self.mystery_wait, now, where=killed)
+
+        # Jogador atingido: perde uma vida (ou a partida, sem vidas restantes)
+        struck = (playing[:, None] & (self.ship_alive != 0)[:, None] & (eba != 0) &
+                  _touches(self.ship_hits, self.enemy_laser_size, self.ship_x[:, None],
+                           self.ship_y, ebx, eby))
+        game_over = np.zeros(self.num_envs, dtype=bool)
+        ship_hit = struck.any(1)
+        if ship_hit.any():
+            eba[struck] = 0
+            self.lives_lost += ship_hit
+            game_over |= ship_hit & (self.lives == 0)
+            self.lives -= ship_hit & (self.lives > 0)
+            np.maximum(self.explosions_due, now + 900, out=self.explosions_due, where=ship_hit)
+            np.copyto(self.respawn_start, now, where=ship_hit)
+            self.respawn_pending |= ship_hit
+            self.ship_alive[ship_hit] = 0
+
+        # Invasão: a formação chegou à área do jogador
+        invading = np.flatnonzero(playing & (self.alien_bottom >= self.invasion_line))
+        if len(invading):
+            touching = self._first_alien(invading, self.ship_x[invading], self.ship_y,
+                                         self.ship_size, self.alien_ship_hits) >= 0
+            game_over[invading] |= ((self.ship_alive[invading] == 0) | touching |
+                                    (self.alien_bottom[invading] >= self.height))
+
+        # Erosão das barreiras, projétil a projétil na ordem dos grupos
+        for x, y, alive, (width, height) in ((pbx, pby, pba, self.laser_size),
+                                             (ebx, eby, eba, self.enemy_laser_size)):
+            for slot in range(alive.shape[1]):
+                games = np.flatnonzero(playing & (alive[:, slot] != 0) &
+                                       (y[:, slot] + height > self.barrier_y) &
+                                       (y[:, slot] < self.barrier_y + self.barrier_height))
+                if len(games):
+                    eroded = self._erode(games, x[games, slot], y[games, slot], width, height)
+                    alive[games[eroded], slot] = 0
+        low = np.flatnonzero(playing & (self.alien_bottom >= self.barrier_y) &
+                             (self.alien_count > 0))
+        if len(low):
+            self._erode_by_aliens(low)
+
+        return game_over
+
+    def _first_alien(self, games, x, y, size, tables):
+        """
+        Encontra, por aritmética de grade, o primeiro alienígena vivo (na ordem da
+        formação) que toca o sprite de cada partida indicada: os retângulos se
+        intersectam e as máscaras de pixels se sobrepõem.
+
+        Args:
+            games (ndarray): Índices das partidas
+            x, y (ndarray or int): Canto superior esquerdo dos sprites
+            size (tuple): Tamanho (largura, altura) dos sprites
+            tables (ndarray): Tabelas de sobreposição (overlap_table) dos alienígenas com
+                o sprite, por linha de imagens e quadro de animação
+
+        Returns:
+            ndarray: Índice linha * colunas + coluna do alienígena, ou -1
+        """
+        spacing_x, spacing_y = constants.ALIEN_SPACING
+        alien_w, alien_h = constants.ALIEN_SIZE
+        width, height = size
+        x, y = np.broadcast_arrays(x, y, games)[:2]
+        left = self.formation_x[games]
+        top = self.formation_y[games]
+        frame = self.alien_frame[games]
+        first_column = (x - left - alien_w) // spacing_x + 1
+        last_column = (x + width - 1 - left) // spacing_x
+        first_row = (y - top - alien_h) // spacing_y + 1
+        last_row = (y + height - 1 - top) // spacing_y
+
+        found = np.full(len(games), -1, dtype=np.int64)
+        window_rows = (height + alien_h - 2) // spacing_y + 1
+        window_columns = (width + alien_w - 2) // spacing_x + 1
+        # Percorre a janela de trás para frente: o primeiro alienígena sobrescreve os demais
+        for i in reversed(range(window_rows)):
+            row = first_row + i
+            for j in reversed(range(window_columns)):
+                column = first_column + j
+                inside = ((row >= 0) & (row <= last_row) & (row < self.rows) &
+                          (column >= 0) & (column <= last_column) & (column < self.columns))
+                row_index = np.clip(row, 0, self.rows - 1)
+                column_index = np.clip(column, 0, self.columns - 1)
+                inside &= self.aliens[games, row_index, column_index] != 0
+                # Narrowphase só para os retângulos que se tocam
+                touching = np.flatnonzero(inside)
+                if len(touching):
+                    rows = row_index[touching]
+                    columns = column_index[touching]
+                    inside[touching] = _table_lookup(
+                        tables, size, x[touching] - left[touching] - columns * spacing_x,
+                        y[touching] - top[touching] - rows * spacing_y,
+                        (np.minimum(rows, 2), frame[touching]))
+                found = np.where(inside, row_index * self.columns + column_index, found)
+        return found
+
+    def _kill_aliens(self, victims, now):
+        """
+        Remove os alienígenas abatidos, soma os pontos e atualiza o ritmo da marcha.
+
+        Args:
+            victims (ndarray): Índices (N, 2) dos alienígenas abatidos por tiro, ou -1
+            now (ndarray): Tempo atual de cada partida
+        """
+        for slot in range(2):
+            games = np.flatnonzero(victims[:, slot] >= 0)
+            rows, columns = np.divmod(victims[games, slot], self.columns)
+            self.aliens[games, rows, columns] = 0
+            self.score[games] += self.row_scores[rows]
+        kills = (victims >= 0).sum(1)
+        games = np.flatnonzero(kills)
+        # calculate_score sorteia a pontuação da nave misteriosa a cada abate
+        for game, count in zip(games.tolist(), kills[games].tolist()):
+            choice = self.randoms[game].choice
+            for _ in range(count):
+                choice(MYSTERY_SCORES)
+
+        self.game_timer[games] = now[games]
+        self.explosions_due[games] = np.maximum(self.explosions_due[games], now[games] + 400)
+        count = self.alien_count[games] - kills[games]
+        self.alien_count[games] = count
+        settings = self.settings
+        self.move_time[games] = np.where(
+            count == 1, settings.alien_last_move_time,
+            np.where(count <= settings.alien_fast_count, settings.alien_fast_move_time,
+                     self.move_time[games]))
+
+        # Colunas vivas extremas (sem alienígenas, a coluna mais à direita recua até 0)
+        columns = self.aliens[games].any(1)
+        remaining = columns.any(1)
+        self.leftmost[games] = np.where(remaining, columns.argmax(1), self.leftmost[games])
+        self.rightmost[games] = np.where(remaining, self.columns - 1 - columns[:, ::-1].argmax(1), 0)
+
+    def _erode(self, games, x, y, width, height):
+        """
+        Destrói as células das barreiras sob os retângulos (como Barrier.erode).
+
+        Args:
+            games (ndarray): Índices das partidas
+            x, y (ndarray): Canto superior esquerdo dos retângulos
+            width, height (int): Tamanho dos retângulos
+
+        Returns:
+            ndarray: True onde alguma célula intacta foi destruída
+        """
+        cell = self.cell_size
+        top = self.barrier_y
+        bottom = top + self.barrier_height
+        window_rows = (height + cell - 2) // cell + 1
+        window_columns = (width + cell - 2) // cell + 1
+        clip_top = np.maximum(y, top)
+        clip_bottom = np.minimum(y + height, bottom)
+        first_row = (clip_top - top) // cell
+        stop_row = (clip_bottom - 1 - top) // cell + 1
+
+        eroded = np.zeros(len(games), dtype=bool)
+        for number, left in enumerate(self.barrier_x):
+            right = left + self.barrier_width
+            clip_left = np.maximum(x, left)
+            clip_right = np.minimum(x + width, right)
+            touching = np.flatnonzero((clip_left < clip_right) & (clip_top < clip_bottom))
+            if not len(touching):
+                continue
+            first_column = (clip_left[touching] - left) // cell
+            stop_column = (clip_right[touching] - 1 - left) // cell + 1
+            rows, stops = first_row[touching], stop_row[touching]
+            masks = self.barriers[games[touching], number]
+
+            cells = []
+            for i in range(window_rows):
+                for j in range(window_columns):
+                    row, column = rows + i, first_column + j
+                    valid = (row < stops) & (column < stop_column)
+                    cells.append((valid, np.minimum(row, masks.shape[1] - 1),
+                                  np.minimum(column, masks.shape[2] - 1)))
+            index = np.arange(len(touching))
+            hit = np.zeros(len(touching), dtype=bool)
+            for valid, row, column in cells:
+                hit |= valid & (masks[index, row, column] != 0)
+            for valid, row, column in cells:
+                clear = valid & hit
+                masks[index[clear], row[clear], column[clear]] = 0
+            self.barriers[games[touching], number] = masks
+            eroded[touching] |= hit
+        return eroded
+
+    def _erode_by_aliens(self, games):
+        """Destrói as células das barreiras sob os alienígenas vivos (sem removê-los)."""
+        spacing_x, spacing_y = constants.ALIEN_SPACING
+        alien_w, alien_h = constants.ALIEN_SIZE
+        cell = self.cell_size
+        cell_rows, cell_columns = self.barriers.shape[2:]
+        alien_x = (self.formation_x[games, None] +
+                   np.arange(self.columns) * spacing_x)[:, None, :]
+        alien_y = (self.formation_y[games, None] + np.arange(self.rows) * spacing_y)[:, None, :]
+        cell_y = (self.barrier_y + np.arange(cell_rows) * cell)[None, :, None]
+        # Linhas de células x linhas da formação que se sobrepõem verticalmente
+        overlap_y = ((alien_y < cell_y + cell) & (alien_y + alien_h > cell_y)).astype(np.int64)
+        aliens = self.aliens[games].astype(np.int64)
+        for number, left in enumerate(self.barrier_x):
+            cell_x = (left + np.arange(cell_columns) * cell)[None, :, None]
+            overlap_x = ((alien_x < cell_x + cell) &
+                         (alien_x + alien_w > cell_x)).astype(np.int64)
+            covered = np.einsum('gir,grc,gjc->gij', overlap_y, aliens, overlap_x) > 0
+            masks = self.barriers[games, number]
+            masks[covered] = 0
+            self.barriers[games, number] = masks
+
+    def _run_late_timers(self, playing, now):
+        """Temporizadores depois das colisões: disparo inimigo e nova nave do jogador."""
+        self._compact_enemy_bullets()
+
+        fire = playing & self.fire_active & (self.fire_start + self.settings.enemy_fire_interval
+                                             < now)
+        if fire.any():
+            # Sem alienígenas a rodada está terminando: o disparo só volta na próxima
+            self.fire_active[fire & (self.alien_count == 0)] = False
+            games = np.flatnonzero(fire & (self.alien_count > 0))
+            if len(games):
+                alive_columns = self.aliens[games].any(1)
+                columns = np.array([self.randoms[game].choice(np.flatnonzero(row).tolist())
+                                    for game, row in zip(games.tolist(), alive_columns)],
+                                   dtype=np.int64)
+                column_aliens = self.aliens[games, :, columns]
+                rows = self.rows - 1 - column_aliens[:, ::-1].argmax(1)
+                slots = self.enemy_bullet_alive[games].sum(1)
+                free = slots < self.enemy_bullet_alive.shape[1]
+                games, rows, columns, slots = games[free], rows[free], columns[free], slots[free]
+                spacing_x, spacing_y = constants.ALIEN_SPACING
+                self.enemy_bullet_x[games, slots] = (self.formation_x[games] +
+                                                     columns * spacing_x + 14)
+                self.enemy_bullet_y[games, slots] = (self.formation_y[games] +
+                                                     rows * spacing_y + 20)
+                self.enemy_bullet_alive[games, slots] = 1
+            np.copyto(self.fire_start, now, where=fire)
+
+        respawn = playing & self.respawn_pending & (self.respawn_start + 900 < now)
+        if respawn.any():
+            self.ship_x[respawn] = self.ship_start
+            self.ship_alive[respawn] = 1
+            self.respawn_pending[respawn] = False
+
+    def _compact_enemy_bullets(self):
+        """Mantém os projéteis inimigos vivos no início das vagas, na ordem de disparo."""
+        alive = self.enemy_bullet_alive != 0
+        games = np.flatnonzero((~alive[:, :-1] & alive[:, 1:]).any(1))
+        if not len(games):
+            return
+        order = np.argsort(~alive[games], axis=1, kind='stable')
+        for field in (self.enemy_bullet_x, self.enemy_bullet_y, self.enemy_bullet_alive):
+            field[games] = np.take_along_axis(field[games], order, 1)
+
+
+def _table_lookup(table, size_b, dx, dy, keys=()):
+    """
+    Consulta uma tabela de overlap_table para os deslocamentos (dx, dy) do segundo
+    sprite em relação ao primeiro; fora da tabela os retângulos nem se tocam.
+
+    Args:
+        table (ndarray): Tabela (..., largura, altura)
+        size_b (tuple): Tamanho do segundo sprite
+        dx, dy (ndarray or int): Deslocamentos
+        keys (tuple): Índices das dimensões iniciais da tabela (por exemplo, linha e quadro)
+    """
+    columns, rows = table.shape[-2:]
+    dx, dy, *keys = np.broadcast_arrays(dx + size_b[0] - 1, dy + size_b[1] - 1, *keys)
+    inside = (dx >= 0) & (dx < columns) & (dy >= 0) & (dy < rows)
+    # A tabela só é consultada onde os retângulos se tocam
+    touching = np.flatnonzero(inside)
+    if len(touching):
+        inside.flat[touching] = table[tuple(key.flat[touching] for key in keys) +
+                                      (dx.flat[touching], dy.flat[touching])]
+    return inside
+
+
+def _touches(table, size_b, x_a, y_a, x_b, y_b):
+    """
+    Colisão precisa entre sprites: os retângulos se intersectam (mesma regra de
+    Rect.colliderect) e as máscaras de pixels se sobrepõem.
+
+    Args:
+        table (ndarray): Tabela de overlap_table(máscara_a, máscara_b)
+        size_b (tuple): Tamanho do segundo sprite
+        x_a, y_a, x_b, y_b (ndarray or int): Posições dos sprites
+    """
+    return _table_lookup(table, size_b, x_b - x_a, y_b - y_a)
+
+
+def game_state(game):
+    """
+    Extrai de um SpaceInvaders o mesmo estado que o ambiente vetorizado mantém.
+
+    Args:
+        game (SpaceInvaders): Jogo em andamento
+
+    Returns:
+        tuple: Estado comparável com vec_state
+    """
+    mystery = next(iter(game.mystery_group))
+    return (game.score, len(game.lives_group), game.round,
+            game.player.rect.x, int(game.ship_alive),
+            tuple(game.enemies.positions[0, 0].tolist()),
+            mystery.rect.x, int(mystery.moving),
+            tuple(bullet.rect.topleft for bullet in game.bullets),
+            tuple(bullet.rect.topleft for bullet in game.enemy_bullets),
+            game.enemies.alive.tobytes(),
+            b''.join(blocker.cells.tobytes() for blocker in game.all_blockers))
+
+
+def vec_state(env, index):
+    """
+    Extrai o estado de uma partida do ambiente vetorizado.
+
+    Args:
+        env (VecSpaceInvaders): Ambiente
+        index (int): Índice da partida
+
+    Returns:
+        tuple: Estado comparável com game_state
+    """
+    def bullets(x, y, alive):
+        return tuple((int(x[index, slot]), int(y[index, slot]))
+                     for slot in range(alive.shape[1]) if alive[index, slot])
+
+    return (int(env.score[index]), int(env.lives[index]), int(env.round[index]),
+            int(env.ship_x[index]), int(env.ship_alive[index]),
+            (int(env.formation_x[index]), int(env.formation_y[index])),
+            int(env.mystery_x[index]), int(env.mystery_moving[index]),
+            bullets(env.player_bullet_x, env.player_bullet_y, env.player_bullet_alive),
+            bullets(env.enemy_bullet_x, env.enemy_bullet_y, env.enemy_bullet_alive),
+            env.aliens[index].astype(bool).tobytes(),
+            env.barriers[index].astype(bool).tobytes())
+
+
+def verify(games, steps, seed=0, settings=None):
+    """
+    Joga as mesmas partidas no jogo original e no ambiente vetorizado, com as
+    ações do bot, e compara o estado passo a passo.
+
+    Args:
+        games (int): Quantidade de partidas
+        steps (int): Limite de passos por partida
+        seed (int): Semente base (a partida i usa seed + i nos dois lados)
+        settings (Settings): Parâmetros do jogo
+
+    Returns:
+        tuple: (passos comparados, primeira divergência como (partida, passo) ou None)
+    """
+    from tools.policies import POLICIES
+    from tools.simulation import make_game
+
+    env = VecSpaceInvaders(games, settings, seed)
+    try:
+        originals = [make_game(seed + index, settings) for index in range(games)]
+        controllers = [POLICIES['tracking' if index % 2 else 'random'](seed + index)
+                       for index in range(games)]
+        running = np.ones(games, dtype=bool)
+        actions = np.zeros(games, dtype=np.int64)
+        compared = 0
+        for step in range(steps):
+            for index in np.flatnonzero(running).tolist():
+                inputs = controllers[index](originals[index])
+                actions[index] = (LEFT * inputs.left + RIGHT * inputs.right +
+                                  SHOOT * inputs.shoot)
+                originals[index].step(inputs)
+            env.step(actions)
+            for index in np.flatnonzero(running).tolist():
+                game = originals[index]
+                if game.game_over:
+                    if not env.dones[index] or env.episode_scores[index] != game.score:
+                        return compared, (index, step)
+                    running[index] = False
+                elif env.dones[index] or game_state(game) != vec_state(env, index):
+                    return compared, (index, step)
+                compared += 1
+            if not running.any():
+                break
+        return compared, None
+    finally:
+        env.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ambiente vetorizado de Space Invaders')
+    parser.add_argument('--envs', type=int, default=1024, help='partidas simultâneas')
+    parser.add_argument('--steps', type=int, default=2000, help='passos medidos')
+    parser.add_argument('--seed', type=int, default=0, help='semente base')
+    parser.add_argument('--verify', type=int, metavar='PARTIDAS',
+                        help='compara o estado com o jogo original em PARTIDAS partidas')
+    args = parser.parse_args()
+
+    if args.verify:
+        compared, divergence = verify(args.verify, args.steps, args.seed)
+        if divergence is None:
+            print(f'{compared} passos idênticos ao jogo original')
+        else:
+            print(f'divergência na partida {divergence[0]}, passo {divergence[1]} '
+                  f'({compared} passos idênticos antes)')
+            raise SystemExit(1)
+        return
+
+    env = VecSpaceInvaders(args.envs, seed=args.seed)
+    try:
+        actions_rng = np.random.default_rng(args.seed)
+        actions = actions_rng.integers(0, 8, size=(64, args.envs))
+        start = perf_counter()
+        for step in range(args.steps):
+            env.step(actions[step % len(actions)])
+        elapsed = perf_counter() - start
+        total = args.envs * args.steps
+        print(f'{total} passos de ambiente em {elapsed:.2f} s '
+              f'({total / elapsed * 60 / 1e6:.1f} milhões por minuto), '
+              f'{env.episodes} partidas concluídas')
+    finally:
+        env.close()
+
+
+if __name__ == '__main__':
+    main()